@@ -9,24 +9,33 @@ Core module for prompt migration and optimization.
 This module provides the main functionality for migrating and optimizing prompts.
 """
 
-from .evaluation import (
-    Evaluator,
-    StatisticalEvaluator,
-    StatisticalResults,
-    create_evaluator,
-)
-from .metrics import ExactMatchMetric, MetricBase
-from .migrator import PromptMigrator
-from .prompt_strategies import BaseStrategy, BasicOptimizationStrategy
-
-__all__ = [
-    "PromptMigrator",
-    "BaseStrategy",
-    "BasicOptimizationStrategy",
-    "MetricBase",
-    "ExactMatchMetric",
-    "Evaluator",
-    "StatisticalEvaluator",
-    "StatisticalResults",
-    "create_evaluator",
-]
+import importlib
+
+# Public names and the submodule defining each. The submodules pull in DSPy and
+# LiteLLM, so they are imported on first attribute access instead of here; this
+# lets e.g. `prompt_ops.core.metrics` be imported without loading DSPy.
+_EXPORTS = {
+    "PromptMigrator": ".migrator",
+    "BaseStrategy": ".prompt_strategies",
+    "BasicOptimizationStrategy": ".prompt_strategies",
+    "MetricBase": ".metrics",
+    "ExactMatchMetric": ".metrics",
+    "Evaluator": ".evaluation",
+    "StatisticalEvaluator": ".evaluation",
+    "StatisticalResults": ".evaluation",
+    "create_evaluator": ".evaluation",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
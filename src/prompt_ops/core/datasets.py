@@ -11,15 +11,261 @@ for use with the prompt-ops tool.
 """
 
 import csv
+import hashlib
+import itertools
 import json
 import logging
+import mmap
+import multiprocessing
+import os
+import pickle
+import sys
+import tempfile
 from abc import ABC, abstractmethod
+from collections.abc import MutableSequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import dspy
+import numpy as np
 import yaml
 
+try:
+    # libyaml-backed loader is much faster than the pure-Python SafeLoader
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Default location for cached standardized datasets (see load_dataset)
+DEFAULT_DATASET_CACHE_DIR = Path.home() / ".cache" / "prompt_ops" / "datasets"
+
+# Bump when the cached payload format changes to invalidate old entries
+_DATASET_CACHE_VERSION = 2
+
+# JSON files at least this large are memory-mapped rather than read into memory
+_MMAP_MIN_BYTES = 100 * 1024 * 1024
+
+# Strings shorter than this are interned by _intern_short_string
+_INTERN_MAX_LENGTH = 256
+
+# Mapping of supported file extensions to dataset formats
+_EXT_TO_FORMAT = {
+    ".json": "json",
+    ".jsonl": "json",
+    ".csv": "csv",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+}
+
+
+def _parse_json(raw: bytes) -> Any:
+    """
+    Parse a JSON document, using orjson when it is installed.
+
+    Args:
+        raw: Encoded JSON document
+
+    Returns:
+        The parsed value
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the stdlib (e.g. NaN, big ints); let
+            # json.loads handle those documents and report genuine errors.
+            pass
+    return json.loads(raw)
+
+
+def _dump_json(value: Any) -> str:
+    """
+    Serialize a value to a compact JSON string, using orjson when it is installed.
+
+    Only for JSON this module reads back itself (e.g. the YAML cache). Values
+    stringified into example fields are model and metric input, so they keep
+    json.dumps's default separators instead.
+
+    Args:
+        value: Value to serialize
+
+    Returns:
+        JSON string
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(value).decode("utf-8")
+        except TypeError:
+            # e.g. non-string dict keys, which the stdlib converts
+            pass
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _compile_nested_getter(
+    field_path: Tuple[str, ...], default_value: Any = None
+) -> Callable[[Any], Any]:
+    """
+    Compile a nested field path into a getter function.
+
+    The returned function indexes straight through the path and falls back to
+    default_value when a key is missing or an intermediate value is not a
+    mapping, which avoids a per-level loop and isinstance check. Paths of one
+    or two keys (the common case) get a dedicated function.
+
+    Args:
+        field_path: Keys forming a path to the value
+        default_value: Value returned when the path cannot be resolved
+
+    Returns:
+        Function that extracts the value at field_path from a data item
+    """
+    if not field_path:
+        return lambda item: item
+
+    if len(field_path) == 1:
+        (key,) = field_path
+
+        def get_one(item: Any) -> Any:
+            try:
+                return item[key]
+            except (KeyError, TypeError, IndexError):
+                return default_value
+
+        return get_one
+
+    if len(field_path) == 2:
+        outer_key, inner_key = field_path
+
+        def get_two(item: Any) -> Any:
+            try:
+                return item[outer_key][inner_key]
+            except (KeyError, TypeError, IndexError):
+                return default_value
+
+        return get_two
+
+    def get_path(item: Any) -> Any:
+        try:
+            for key in field_path:
+                item = item[key]
+            return item
+        except (KeyError, TypeError, IndexError):
+            return default_value
+
+    return get_path
+
+
+def _intern_short_string(value: Any) -> Any:
+    """
+    Intern short strings so values repeated across rows share one object.
+
+    Dataset rows often repeat the same labels, categories, or fixed contexts;
+    interning them keeps only one copy of each in memory. Long strings are
+    unlikely to repeat and are returned unchanged, as is anything that is not
+    exactly a str.
+
+    Args:
+        value: Value to intern
+
+    Returns:
+        The interned string, or the value unchanged
+    """
+    if type(value) is str and len(value) < _INTERN_MAX_LENGTH:
+        return sys.intern(value)
+    return value
+
+
+# Remainder of the error logged when a non-dict field spec extracts a dict
+_FIELD_MAPPING_ERROR_HINT = (
+    ", but a string value was expected. "
+    "\n   Hint: If your data structure is {'fields': {'input': '...'}}, "
+    "\n   you should map to ['fields', 'input'] (nested path) instead of just 'fields'."
+    "\n   The dict will be converted to preserve individual fields, but this may cause issues with DSPy."
+)
+
+# Keys of the standardized example format
+_STANDARD_EXAMPLE_KEYS = ("inputs", "outputs", "metadata")
+
+
+@dataclass(slots=True)
+class StandardExample:
+    """
+    A single example in the standardized dataset format.
+
+    Using a slotted dataclass instead of a dict per example keeps large datasets
+    compact in memory. Dict-style read access (``example["inputs"]``,
+    ``"inputs" in example``, ``keys()``, ``get()``) is supported for code
+    written against the dictionary format.
+    """
+
+    inputs: Dict[str, Any]
+    outputs: Dict[str, Any]
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        if key not in _STANDARD_EXAMPLE_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in _STANDARD_EXAMPLE_KEYS
+
+    def keys(self) -> Tuple[str, ...]:
+        return _STANDARD_EXAMPLE_KEYS
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in _STANDARD_EXAMPLE_KEYS else default
+
+
+def _intern_example(example: StandardExample) -> StandardExample:
+    """
+    Re-intern the field names and short values of an unpickled example.
+
+    Args:
+        example: Example received from a worker process
+
+    Returns:
+        The example, with its inputs and outputs sharing interned strings
+    """
+    example.inputs = {
+        _intern_short_string(key): _intern_short_string(value)
+        for key, value in example.inputs.items()
+    }
+    example.outputs = {
+        _intern_short_string(key): _intern_short_string(value)
+        for key, value in example.outputs.items()
+    }
+    return example
+
 
 class DatasetAdapter(ABC):
     """
@@ -27,18 +273,37 @@ class DatasetAdapter(ABC):
 
     Subclasses should implement the adapt method to transform their specific dataset
     format into the standardized format expected by the prompt-ops tool.
+
+    The base class declares ``__slots__`` so bare adapters carry no instance
+    ``__dict__``. Subclasses that want the same benefit must declare their own
+    ``__slots__`` for any attributes they add; subclasses that don't simply get
+    a regular ``__dict__``.
     """
 
-    def __init__(self, dataset_path: str, file_format: str = None):
+    __slots__ = ("dataset_path", "file_format", "yaml_list_key", "yaml_cache_dir")
+
+    def __init__(
+        self,
+        dataset_path: str,
+        file_format: str = None,
+        yaml_list_key: Optional[str] = None,
+        yaml_cache_dir: Optional[Union[str, Path]] = None,
+    ):
         """
         Initialize the dataset adapter with a path to the dataset file.
 
         Args:
             dataset_path: Path to the dataset file
             file_format: Format of the file ('json', 'csv', 'yaml'). If None, inferred from file extension.
+            yaml_list_key: For YAML files whose top level is a mapping, the key
+                holding the list of items. If None, the first list value is used.
+            yaml_cache_dir: Directory to cache parsed YAML files in as JSON (None
+                disables the cache)
         """
         self.dataset_path = Path(dataset_path)
         self.file_format = file_format or self._infer_format(self.dataset_path)
+        self.yaml_list_key = yaml_list_key
+        self.yaml_cache_dir = yaml_cache_dir
 
     def _infer_format(self, path: Path) -> str:
         """
@@ -54,26 +319,66 @@ class DatasetAdapter(ABC):
             ValueError: If the file format cannot be inferred
         """
         extension = path.suffix.lower()
-        if extension == ".json":
-            return "json"
-        elif extension == ".csv":
-            return "csv"
-        elif extension in [".yaml", ".yml"]:
-            return "yaml"
-        else:
+        file_format = _EXT_TO_FORMAT.get(extension)
+        if file_format is None:
             raise ValueError(
-                f"Unsupported file format: {extension}. Supported formats: .json, .csv, .yaml, .yml"
+                f"Unsupported file format: {extension}. Supported formats: .json, .jsonl, .csv, .yaml, .yml"
             )
+        return file_format
 
     def _load_json(self) -> List[Dict[str, Any]]:
         """
         Load data from a JSON file.
 
+        Both a top-level JSON array and newline-delimited JSON (one object per
+        line) are supported. The file is read with a single call and parsed from
+        the buffer; with orjson installed, arrays in files of at least
+        _MMAP_MIN_BYTES are parsed straight from a memory map instead.
+
         Returns:
             List of data items
         """
-        with open(self.dataset_path, "r") as f:
-            return json.load(f)
+        with open(self.dataset_path, "rb") as f:
+            if ORJSON_AVAILABLE and os.fstat(f.fileno()).st_size >= _MMAP_MIN_BYTES:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    if buffer[:4096].lstrip()[:1] != b"{":
+                        try:
+                            with memoryview(buffer) as view:
+                                return orjson.loads(view)
+                        except orjson.JSONDecodeError:
+                            # Let _parse_json fall back to the stdlib below
+                            pass
+            raw_bytes = f.read()
+
+        if raw_bytes.lstrip()[:1] == b"{":
+            return [
+                _parse_json(line) for line in raw_bytes.splitlines() if line.strip()
+            ]
+        return _parse_json(raw_bytes)
+
+    def _iter_json(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the items of a JSON file.
+
+        Newline-delimited JSON is parsed one line at a time. A top-level array is
+        stream-parsed with ijson when it is installed, so only one item is held in
+        memory at a time; otherwise the whole file is parsed up front.
+
+        Yields:
+            Data items
+        """
+        with open(self.dataset_path, "rb") as f:
+            first_byte = f.read(4096).lstrip()[:1]
+            f.seek(0)
+            if first_byte == b"{":
+                for line in f:
+                    if line.strip():
+                        yield _parse_json(line)
+                return
+            if first_byte == b"[" and IJSON_AVAILABLE:
+                yield from ijson.items(f, "item", use_float=True)
+                return
+        yield from self._load_json()
 
     def _load_csv(self) -> List[Dict[str, Any]]:
         """
@@ -82,31 +387,103 @@ class DatasetAdapter(ABC):
         Returns:
             List of data items
         """
+        return list(self._iter_csv())
+
+    def _iter_csv(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the rows of a CSV file, keeping the file open while iterating.
+
+        Yields:
+            Data items
+        """
         with open(self.dataset_path, "r", newline="") as f:
-            reader = csv.DictReader(f)
-            return list(reader)
+            yield from csv.DictReader(f)
 
     def _load_yaml(self) -> List[Dict[str, Any]]:
         """
         Load data from a YAML file.
 
+        If yaml_cache_dir is set, the parsed document is cached there as JSON,
+        keyed by the file's path, modification time, and size, since parsing
+        JSON is much faster than parsing YAML. Documents that don't survive a
+        JSON round trip unchanged (e.g. dates, non-string keys) are not cached.
+
         Returns:
             List of data items
         """
-        with open(self.dataset_path, "r") as f:
-            data = yaml.safe_load(f)
-            # Ensure we return a list of dictionaries
-            if isinstance(data, list):
-                return data
-            elif isinstance(data, dict):
-                # If the YAML contains a single dictionary with a list field, return that list
-                for key, value in data.items():
-                    if isinstance(value, list):
-                        return value
-                # Otherwise, return a list with the dictionary as the only element
-                return [data]
-            else:
-                raise ValueError(f"Unexpected YAML structure: {type(data)}")
+        use_cache = getattr(self, "yaml_cache_dir", None) is not None
+        data = self._read_yaml_json_cache() if use_cache else None
+        if data is None:
+            data = yaml.load(self.dataset_path.read_bytes(), Loader=YamlSafeLoader)
+            if use_cache:
+                self._write_yaml_json_cache(data)
+
+        # Ensure we return a list of dictionaries
+        if isinstance(data, list):
+            return data
+        elif isinstance(data, dict):
+            yaml_list_key = getattr(self, "yaml_list_key", None)
+            if yaml_list_key is not None:
+                items = data.get(yaml_list_key)
+                if not isinstance(items, list):
+                    raise ValueError(
+                        f"YAML key '{yaml_list_key}' does not hold a list of items. "
+                        f"Top-level keys: {list(data.keys())}"
+                    )
+                return items
+            # If the YAML contains a single dictionary with a list field, return that list
+            for key, value in data.items():
+                if isinstance(value, list):
+                    return value
+            # Otherwise, return a list with the dictionary as the only element
+            return [data]
+        else:
+            raise ValueError(f"Unexpected YAML structure: {type(data)}")
+
+    def _yaml_json_cache_path(self) -> Path:
+        """
+        Get the path of the JSON cache for this adapter's YAML file.
+
+        Returns:
+            Path of the cache file
+        """
+        stat = self.dataset_path.stat()
+        key_source = repr(
+            (str(self.dataset_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        )
+        key = hashlib.blake2b(key_source.encode("utf-8"), digest_size=20).hexdigest()
+        return Path(self.yaml_cache_dir) / f"{key}.json"
+
+    def _read_yaml_json_cache(self) -> Any:
+        """
+        Read the JSON cache of this adapter's YAML file.
+
+        Returns:
+            The cached YAML document, or None on a cache miss
+        """
+        try:
+            return _parse_json(self._yaml_json_cache_path().read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def _write_yaml_json_cache(self, data: Any) -> None:
+        """
+        Cache a parsed YAML document as JSON if it round-trips unchanged.
+
+        Args:
+            data: Parsed YAML document
+        """
+        try:
+            payload = _dump_json(data).encode("utf-8")
+        except (TypeError, ValueError):
+            return
+        if _parse_json(payload) != data:
+            return
+        try:
+            cache_path = self._yaml_json_cache_path()
+        except OSError:
+            return
+        _write_dataset_cache(cache_path, payload)
 
     def load_raw_data(self) -> List[Dict[str, Any]]:
         """
@@ -131,12 +508,34 @@ class DatasetAdapter(ABC):
 
         return loaders[self.file_format]()
 
+    def iter_raw_data(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over raw data items from the dataset path.
+
+        Unlike load_raw_data, formats that support it are streamed so that
+        adapters can process one item at a time without materializing the
+        whole file.
+
+        Yields:
+            Raw data items from the dataset
+        """
+        iterators = {
+            "json": self._iter_json,
+            "csv": self._iter_csv,
+        }
+
+        if self.file_format in iterators:
+            yield from iterators[self.file_format]()
+        else:
+            yield from self.load_raw_data()
+
     @abstractmethod
     def adapt(self) -> List[Dict[str, Any]]:
         """
         Transform dataset-specific format into standardized format.
 
-        The standardized format is a list of dictionaries, where each dictionary
+        The standardized format is a list of dictionaries (or StandardExample
+        objects, which support the same read access), where each dictionary
         represents a single example and has the following structure:
         {
             "inputs": {
@@ -169,8 +568,20 @@ class ConfigurableJSONAdapter(DatasetAdapter):
     This adapter can be used with any JSON dataset by configuring the input and output
     field mappings. It supports simple field names, nested paths, and custom mappings,
     making it compatible with various JSON structures without requiring custom adapter classes.
+
+    Rows are processed serially unless ``num_workers`` is set, in which case
+    datasets with more than ``parallel_threshold`` rows are processed in a pool
+    of spawned worker processes. This requires the adapter, including any
+    transform functions, to be picklable (module-level functions rather than
+    lambdas or closures); otherwise rows are processed serially.
     """
 
+    # Row count above which adapt() uses the process pool, if num_workers is set
+    parallel_threshold = 5000
+
+    # Attributes rebuilt by _compile_getters rather than pickled
+    _COMPILED_ATTRIBUTES = ("_input_processor", "_output_processor")
+
     def __init__(
         self,
         dataset_path: Union[str, Path],
@@ -180,6 +591,9 @@ class ConfigurableJSONAdapter(DatasetAdapter):
         input_transform: Optional[Callable] = None,
         output_transform: Optional[Callable] = None,
         default_value: Any = None,
+        yaml_list_key: Optional[str] = None,
+        yaml_cache_dir: Optional[Union[str, Path]] = None,
+        num_workers: Optional[int] = None,
         **kwargs,
     ):
         """
@@ -195,15 +609,127 @@ class ConfigurableJSONAdapter(DatasetAdapter):
             file_format: Format of the dataset file (defaults to json)
             input_transform: Optional function to transform input values
             output_transform: Optional function to transform output values
+            yaml_list_key: For YAML files whose top level is a mapping, the key
+                holding the list of items
+            yaml_cache_dir: Directory to cache parsed YAML files in as JSON (None
+                disables the cache)
+            num_workers: Number of worker processes for large datasets (None
+                processes rows serially). Only worth it for expensive transforms
+                on multi-core machines, as workers start a fresh interpreter.
             **kwargs: Additional arguments
         """
-        super().__init__(dataset_path, file_format)
+        super().__init__(dataset_path, file_format, yaml_list_key, yaml_cache_dir)
+        self.num_workers = num_workers
         self.input_field = input_field
         self.golden_output_field = golden_output_field
         self.input_transform = input_transform
         self.output_transform = output_transform
         self.default_value = default_value
 
+        self._compile_getters()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Compiled getters are closures and can't be pickled; they are rebuilt
+        # in __setstate__ (e.g. when sent to process pool workers)
+        state = {
+            key: value
+            for key, value in self.__dict__.items()
+            if key not in self._COMPILED_ATTRIBUTES
+        }
+        for slot in DatasetAdapter.__slots__:
+            state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for key, value in state.items():
+            setattr(self, key, value)
+        self._compile_getters()
+
+    def _compile_getters(self) -> None:
+        """Resolve the field specifications once instead of once per row."""
+        self._input_processor = self._compile_field_processor(
+            self.input_field, self.input_transform, is_input=True
+        )
+        self._output_processor = self._compile_field_processor(
+            self.golden_output_field, self.output_transform, is_input=False
+        )
+
+    def _compile_field_processor(
+        self,
+        field_spec: Union[str, List[str], Dict[str, str]],
+        transform: Optional[Callable] = None,
+        is_input: bool = True,
+    ) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Compile a field specification into a single per-item processing function.
+
+        The returned function is equivalent to
+        _process_fields(item, field_spec, transform, is_input) but goes from the
+        raw item to the standardized fields in one call, with the getter,
+        transform and standard field name resolved up front.
+
+        Args:
+            field_spec: Field specification (string, list, or dict)
+            transform: Optional function to transform values
+            is_input: Whether this processes input fields (True) or output fields (False)
+
+        Returns:
+            Function that maps a data item to a dictionary of processed fields
+        """
+        getter = self._compile_field_spec(field_spec)
+        map_to_standard_format = self._map_to_standard_format
+        mapping_error_prefix = self._field_mapping_error_prefix(field_spec)
+
+        if transform is None:
+            return lambda item: map_to_standard_format(
+                getter(item), field_spec, is_input, mapping_error_prefix
+            )
+
+        transform_value = self._transform_value
+        return lambda item: map_to_standard_format(
+            transform_value(getter(item), transform),
+            field_spec,
+            is_input,
+            mapping_error_prefix,
+        )
+
+    def _compile_field_spec(
+        self, field_spec: Union[str, List[str], Dict[str, str]]
+    ) -> Callable[[Dict[str, Any]], Any]:
+        """
+        Compile a field specification into a getter function.
+
+        The returned function behaves like _extract_value(item, field_spec) but
+        dispatches on the type of the specification only once. It captures the
+        adapter's default_value at compile time.
+
+        Args:
+            field_spec: Field specification (string, list, or dict)
+
+        Returns:
+            Function that extracts the value(s) from a data item
+        """
+        default_value = self.default_value
+
+        if isinstance(field_spec, str):
+            # Simple field name
+            return lambda item: item.get(field_spec, default_value)
+
+        if isinstance(field_spec, list):
+            # Nested field path
+            return _compile_nested_getter(tuple(field_spec), default_value)
+
+        if isinstance(field_spec, dict):
+            # Multiple fields mapping
+            getters = [
+                (_intern_short_string(dst_field), self._compile_field_spec(src_field))
+                for src_field, dst_field in field_spec.items()
+                if isinstance(src_field, (str, list))
+            ]
+            return lambda item: {dst: getter(item) for dst, getter in getters}
+
+        return lambda item: default_value
+
     def _get_nested_value(self, item: Dict[str, Any], field_path: List[str]) -> Any:
         """
         Get a value from a nested dictionary using a field path.
@@ -273,9 +799,65 @@ class ConfigurableJSONAdapter(DatasetAdapter):
         try:
             return transform_func(value)
         except Exception as e:
-            logging.warning(f"Error transforming value: {e}")
+            logger.warning(f"Error transforming value: {e}")
             return value
 
+    def _string_from_str(self, value: str, field_spec: Any) -> str:
+        # Already a string - perfect
+        return value
+
+    def _string_from_none(self, value: None, field_spec: Any) -> str:
+        # None/null - warn and use empty string or default
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                f"Field '{field_spec}' is None. Using default value: '{self.default_value}'"
+            )
+        return str(self.default_value) if self.default_value is not None else ""
+
+    def _string_from_container(
+        self, value: Union[Dict[str, Any], List[Any]], field_spec: Any
+    ) -> str:
+        # Dict or list - this is likely an error, but handle gracefully
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                f"Field '{field_spec}' contains a {type(value).__name__} but should be a string. "
+                f"This will be JSON-stringified, but you should fix your field mapping. "
+                f"Hint: Did you mean to specify a nested path? "
+                f"For example, if your data has {{'fields': {{'input': '...'}}}}, "
+                f"use 'fields.input' instead of just 'fields'."
+            )
+        return json.dumps(value, ensure_ascii=False)
+
+    def _string_from_primitive(
+        self, value: Union[int, float, bool], field_spec: Any
+    ) -> str:
+        # Primitives (int, float, bool) - convert to string
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                f"Field '{field_spec}' is a {type(value).__name__}. Converting to string."
+            )
+        return str(value)
+
+    def _string_from_unknown(self, value: Any, field_spec: Any) -> str:
+        # Unknown type - try to stringify but warn
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                f"Field '{field_spec}' has unexpected type {type(value).__name__}. "
+                f"Attempting to convert to string."
+            )
+        return str(value)
+
+    # Converters used by _ensure_string_value, keyed by exact value type
+    _STRING_CONVERTERS = {
+        str: _string_from_str,
+        type(None): _string_from_none,
+        dict: _string_from_container,
+        list: _string_from_container,
+        int: _string_from_primitive,
+        float: _string_from_primitive,
+        bool: _string_from_primitive,
+    }
+
     def _ensure_string_value(
         self, value: Any, field_spec: Union[str, List[str], Dict[str, str]]
     ) -> str:
@@ -292,47 +874,50 @@ class ConfigurableJSONAdapter(DatasetAdapter):
         Raises:
             ValueError: If the value cannot be reasonably converted to a string
         """
-        # Already a string - perfect
-        if isinstance(value, str):
-            return value
-
-        # None/null - warn and use empty string or default
-        if value is None:
-            logging.warning(
-                f"Field '{field_spec}' is None. Using default value: '{self.default_value}'"
+        converter = self._STRING_CONVERTERS.get(type(value))
+        if converter is None:
+            # Subclasses of the supported types (e.g. OrderedDict) resolve
+            # through their MRO; anything else is an unexpected type
+            converter = next(
+                (
+                    self._STRING_CONVERTERS[base]
+                    for base in type(value).__mro__
+                    if base in self._STRING_CONVERTERS
+                ),
+                ConfigurableJSONAdapter._string_from_unknown,
             )
-            return str(self.default_value) if self.default_value is not None else ""
+        return converter(self, value, field_spec)
 
-        # Dict or list - this is likely an error, but handle gracefully
-        if isinstance(value, (dict, list)):
-            logging.error(
-                f"Field '{field_spec}' contains a {type(value).__name__} but should be a string. "
-                f"This will be JSON-stringified, but you should fix your field mapping. "
-                f"Hint: Did you mean to specify a nested path? "
-                f"For example, if your data has {{'fields': {{'input': '...'}}}}, "
-                f"use 'fields.input' instead of just 'fields'."
-            )
-            return json.dumps(value, ensure_ascii=False)
+    def _field_mapping_error_prefix(
+        self, field_spec: Union[str, List[str], Dict[str, str]]
+    ) -> str:
+        """
+        Build the start of the error logged when a field extracts a dict.
 
-        # Primitives (int, float, bool) - convert to string
-        if isinstance(value, (int, float, bool)):
-            logging.warning(
-                f"Field '{field_spec}' is a {type(value).__name__}. Converting to string."
-            )
-            return str(value)
+        Extracting a dict is expected for dict field specifications and likely
+        a configuration error otherwise. The prefix depends only on the field
+        specification, so it can be built once per adapter.
 
-        # Unknown type - try to stringify but warn
-        logging.warning(
-            f"Field '{field_spec}' has unexpected type {type(value).__name__}. "
-            f"Attempting to convert to string."
+        Args:
+            field_spec: Field specification (string, list, or dict)
+
+        Returns:
+            Message prefix to which the extracted keys are appended, or an
+            empty string if extracting a dict is expected
+        """
+        if isinstance(field_spec, dict):
+            return ""
+        return (
+            f"⚠️  FIELD MAPPING ERROR: Field '{field_spec}' extracted a dict "
+            f"with keys "
         )
-        return str(value)
 
     def _map_to_standard_format(
         self,
         values: Any,
         field_spec: Union[str, List[str], Dict[str, str]],
         is_input: bool = True,
+        mapping_error_prefix: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Map extracted values to the standard format.
@@ -341,11 +926,13 @@ class ConfigurableJSONAdapter(DatasetAdapter):
             values: Extracted values (single value or dictionary)
             field_spec: Original field specification (for reference)
             is_input: Whether this is mapping input fields (True) or output fields (False)
+            mapping_error_prefix: Precomputed _field_mapping_error_prefix(field_spec);
+                computed on demand if None
 
         Returns:
             Dictionary with standardized field names
         """
-        result = {}
+        standard_field = "question" if is_input else "answer"
 
         if isinstance(values, dict):
             # Values already in dictionary format
@@ -354,51 +941,47 @@ class ConfigurableJSONAdapter(DatasetAdapter):
             # 2. field_spec extracted a dict value (likely a configuration error)
 
             # Check if this is likely a configuration error
-            if not isinstance(field_spec, dict):
-                logging.error(
-                    f"⚠️  FIELD MAPPING ERROR: Field '{field_spec}' extracted a dict "
-                    f"with keys {list(values.keys())}, but a string value was expected. "
-                    f"\n   Hint: If your data structure is {{'fields': {{'input': '...'}}}}, "
-                    f"\n   you should map to ['fields', 'input'] (nested path) instead of just 'fields'."
-                    f"\n   The dict will be converted to preserve individual fields, but this may cause issues with DSPy."
+            if mapping_error_prefix is None:
+                mapping_error_prefix = self._field_mapping_error_prefix(field_spec)
+            if mapping_error_prefix and logger.isEnabledFor(logging.ERROR):
+                logger.error(
+                    f"{mapping_error_prefix}{list(values.keys())}"
+                    f"{_FIELD_MAPPING_ERROR_HINT}"
                 )
 
             # Validate each value in the dict to ensure they're strings
-            validated_dict = {}
-            for key, value in values.items():
-                if not isinstance(value, str):
-                    validated_dict[key] = self._ensure_string_value(
-                        value, f"{field_spec}.{key}"
-                    )
-                else:
-                    validated_dict[key] = value
-            result.update(validated_dict)
+            result = {
+                key: _intern_short_string(
+                    value
+                    if isinstance(value, str)
+                    else self._ensure_string_value(value, f"{field_spec}.{key}")
+                )
+                for key, value in values.items()
+            }
 
             # Ensure standard field exists (question/answer)
-            standard_field = "question" if is_input else "answer"
-            if standard_field not in result:
+            if standard_field not in result and result:
                 # Use the first value as the standard field
-                if validated_dict:
-                    result[standard_field] = next(iter(validated_dict.values()))
-                    logging.warning(
-                        f"Added '{standard_field}' field automatically using value from '{list(validated_dict.keys())[0]}'. "
+                first_key = next(iter(result))
+                result[standard_field] = result[first_key]
+                if logger.isEnabledFor(logging.WARNING):
+                    logger.warning(
+                        f"Added '{standard_field}' field automatically using value from '{first_key}'. "
                         f"Consider fixing your field mapping to avoid confusion."
                     )
-        else:
-            # Single value - ensure it's a string for DSPy compatibility
-            standardized_value = self._ensure_string_value(values, field_spec)
+            return result
 
-            if isinstance(field_spec, str):
-                # Keep original field name as well
-                result[field_spec] = standardized_value
+        # Single value - ensure it's a string for DSPy compatibility
+        standardized_value = _intern_short_string(
+            self._ensure_string_value(values, field_spec)
+        )
 
-            # Add standardized field names for DSPy compatibility
-            if is_input:
-                result["question"] = standardized_value
-            else:
-                result["answer"] = standardized_value
+        if isinstance(field_spec, str):
+            # Keep original field name as well, plus the standardized field name
+            # for DSPy compatibility
+            return {field_spec: standardized_value, standard_field: standardized_value}
 
-        return result
+        return {standard_field: standardized_value}
 
     def _process_fields(
         self,
@@ -428,34 +1011,75 @@ class ConfigurableJSONAdapter(DatasetAdapter):
         # 3. Map to standard format
         return self._map_to_standard_format(transformed_values, field_spec, is_input)
 
-    def adapt(self) -> List[Dict[str, Any]]:
+    def adapt(self) -> List[StandardExample]:
         """
         Transform the JSON dataset into standardized format.
 
         Returns:
             List of standardized examples
         """
-        # Load raw data
-        raw_data = self.load_raw_data()
+        # Transform into standardized format, streaming the raw data
+        return self._process_items(self.iter_raw_data())
 
-        # Transform into standardized format
-        standardized_data = []
-        for item in raw_data:
-            inputs = self._process_fields(
-                item, self.input_field, self.input_transform, is_input=True
-            )
-            outputs = self._process_fields(
-                item, self.golden_output_field, self.output_transform, is_input=False
-            )
+    def _process_item(self, item: Dict[str, Any]) -> StandardExample:
+        """
+        Transform a single raw data item into a standardized example.
 
-            standardized_example = {
-                "inputs": inputs,
-                "outputs": outputs,
-                "metadata": {},
-            }
-            standardized_data.append(standardized_example)
+        Args:
+            item: Raw data item
+
+        Returns:
+            Standardized example
+        """
+        return StandardExample(
+            inputs=self._input_processor(item),
+            outputs=self._output_processor(item),
+        )
+
+    def _process_items(self, items: Iterable[Dict[str, Any]]) -> List[StandardExample]:
+        """
+        Apply _process_item to every raw item, in parallel if num_workers is set.
+
+        Args:
+            items: Raw data items
+
+        Returns:
+            List of standardized examples, in input order
+        """
+        items = iter(items)
+        if not self.num_workers or self.num_workers <= 1:
+            return [self._process_item(item) for item in items]
+
+        head = list(itertools.islice(items, self.parallel_threshold + 1))
+        if len(head) <= self.parallel_threshold or not self._is_picklable():
+            return [self._process_item(item) for item in itertools.chain(head, items)]
+
+        # Spawned workers don't inherit the threads (and held import locks) of
+        # litellm or DSPy the way forked ones would
+        with ProcessPoolExecutor(
+            max_workers=self.num_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            return [
+                _intern_example(example)
+                for example in executor.map(
+                    self._process_item, itertools.chain(head, items), chunksize=256
+                )
+            ]
+
+    def _is_picklable(self) -> bool:
+        """
+        Check whether the adapter can be sent to process pool workers.
 
-        return standardized_data
+        Returns:
+            True if the adapter pickles, False otherwise (e.g. lambda transforms)
+        """
+        try:
+            pickle.dumps(self)
+            return True
+        except Exception as e:
+            logger.debug(f"Processing dataset serially, adapter is not picklable: {e}")
+            return False
 
 
 class RAGJSONAdapter(ConfigurableJSONAdapter):
@@ -467,6 +1091,10 @@ class RAGJSONAdapter(ConfigurableJSONAdapter):
     RAG-based evaluation and optimization frameworks.
     """
 
+    _COMPILED_ATTRIBUTES = ConfigurableJSONAdapter._COMPILED_ATTRIBUTES + (
+        "_context_processor",
+    )
+
     def __init__(
         self,
         dataset_path: Union[str, Path],
@@ -498,6 +1126,14 @@ class RAGJSONAdapter(ConfigurableJSONAdapter):
             default_value: Default value to use when a field is not found
             **kwargs: Additional arguments
         """
+        # Store RAG-specific fields (before the parent compiles the getters)
+        self.question_field = question_field
+        self.context_field = context_field
+        self.golden_answer_field = golden_answer_field
+        self.question_transform = question_transform
+        self.context_transform = context_transform
+        self.answer_transform = answer_transform
+
         # Initialize with basic fields for backward compatibility
         super().__init__(
             dataset_path=dataset_path,
@@ -510,13 +1146,13 @@ class RAGJSONAdapter(ConfigurableJSONAdapter):
             **kwargs,
         )
 
-        # Store RAG-specific fields
-        self.question_field = question_field
-        self.context_field = context_field
-        self.golden_answer_field = golden_answer_field
-        self.question_transform = question_transform
-        self.context_transform = context_transform
-        self.answer_transform = answer_transform
+    def _compile_getters(self) -> None:
+        """Resolve the field specifications once instead of once per row."""
+        # Question and answer use the input and output processors
+        super()._compile_getters()
+        self._context_processor = self._compile_field_processor(
+            self.context_field, self.context_transform, is_input=True
+        )
 
     def _map_field_to_standard_name(
         self, field_data: Dict[str, Any], field_type: str
@@ -543,71 +1179,133 @@ class RAGJSONAdapter(ConfigurableJSONAdapter):
         # Ensure the value is a string for DSPy compatibility
         return self._ensure_string_value(value, field_type)
 
-    def adapt(self) -> List[Dict[str, Any]]:
+    def adapt(self) -> List[StandardExample]:
         """
         Transform the JSON dataset into standardized format with question, context, and answer.
 
         Returns:
             List of standardized examples with question, context, and answer fields
         """
-        # Load raw data
-        raw_data = self.load_raw_data()
+        # Transform into standardized format, streaming the raw data
+        return self._process_items(self.iter_raw_data())
 
-        # Transform into standardized format
-        standardized_data = []
-        for item in raw_data:
-            # Process question, context, and answer fields
-            question_data = self._process_fields(
-                item, self.question_field, self.question_transform, is_input=True
-            )
-            context_data = self._process_fields(
-                item, self.context_field, self.context_transform, is_input=True
-            )
-            answer_data = self._process_fields(
-                item, self.golden_answer_field, self.answer_transform, is_input=False
+    def _process_item(self, item: Dict[str, Any]) -> StandardExample:
+        """
+        Transform a single raw data item into a standardized RAG example.
+
+        Args:
+            item: Raw data item
+
+        Returns:
+            Standardized example with question, context, and answer fields
+        """
+        # Process question, context, and answer fields
+        question_data = self._input_processor(item)
+        context_data = self._context_processor(item)
+        answer_data = self._output_processor(item)
+
+        # Create standardized inputs with question and context
+        inputs = {}
+        inputs.update(question_data)  # Include all question fields
+
+        # Ensure 'question' field exists
+        if "question" not in inputs:
+            inputs["question"] = self._map_field_to_standard_name(
+                question_data, "question"
             )
 
-            # Create standardized inputs with question and context
-            inputs = {}
-            inputs.update(question_data)  # Include all question fields
+        # Add context fields
+        context_value = self._map_field_to_standard_name(context_data, "context")
+        inputs["context"] = context_value
 
-            # Ensure 'question' field exists
-            if "question" not in inputs:
-                inputs["question"] = self._map_field_to_standard_name(
-                    question_data, "question"
-                )
+        # Create standardized outputs
+        outputs = {}
+        outputs.update(answer_data)  # Include all answer fields
+
+        # Ensure 'answer' field exists
+        if "answer" not in outputs:
+            outputs["answer"] = self._map_field_to_standard_name(answer_data, "answer")
+
+        # Create standardized example
+        return StandardExample(inputs=inputs, outputs=outputs)
+
+
+def _stringify_fields(fields: Dict[str, Any], field_kind: str) -> Dict[str, str]:
+    """
+    Ensure every value in a field dictionary is a string for DSPy.
 
-            # Add context fields
-            context_value = self._map_field_to_standard_name(context_data, "context")
-            inputs["context"] = context_value
+    Args:
+        fields: Field names mapped to values
+        field_kind: "Input" or "Output", used in warning messages
 
-            # Create standardized outputs
-            outputs = {}
-            outputs.update(answer_data)  # Include all answer fields
+    Returns:
+        The same dictionary if all values are already strings, otherwise a copy
+        with non-string values converted
+    """
+    # Fast path: the built-in adapters already produce strings
+    if all(type(value) is str for value in fields.values()):
+        return fields
 
-            # Ensure 'answer' field exists
-            if "answer" not in outputs:
-                outputs["answer"] = self._map_field_to_standard_name(
-                    answer_data, "answer"
+    validated = {}
+    for key, value in fields.items():
+        if not isinstance(value, str):
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    f"{field_kind} field '{key}' is not a string (type: {type(value).__name__}). "
+                    f"Converting to string for DSPy compatibility."
                 )
+            if isinstance(value, (dict, list)):
+                value = json.dumps(value, ensure_ascii=False)
+            else:
+                value = str(value)
+        validated[key] = value
+    return validated
 
-            # Create standardized example
-            standardized_example = {
-                "inputs": inputs,
-                "outputs": outputs,
-                "metadata": {},
-            }
-            standardized_data.append(standardized_example)
 
-        return standardized_data
+# dspy.Example internals populated directly by _new_dspy_example
+_EXAMPLE_INTERNAL_ATTRIBUTES = ("_store", "_demos", "_input_keys")
+_EXAMPLE_FAST_PATH = all(
+    hasattr(dspy.Example(), attr) for attr in _EXAMPLE_INTERNAL_ATTRIBUTES
+)
 
 
-def create_dspy_example(doc: Dict[str, Any]) -> dspy.Example:
+def _new_dspy_example(inputs: Dict[str, str], outputs: Dict[str, str]) -> dspy.Example:
+    """
+    Build a dspy.Example with its input and output keys set.
+
+    Populates the Example's internal attributes directly instead of going
+    through its keyword-argument constructor, which rebuilds the kwargs dict
+    and copies it into the store for every example. Falls back to the public
+    constructor if the installed DSPy version lays Example out differently.
+
+    Args:
+        inputs: Validated input fields
+        outputs: Validated output fields
+
+    Returns:
+        DSPy example
+    """
+    if _EXAMPLE_FAST_PATH:
+        example = object.__new__(dspy.Example)
+        object.__setattr__(example, "_store", {**inputs, **outputs})
+        object.__setattr__(example, "_demos", [])
+        object.__setattr__(example, "_input_keys", set(inputs))
+    else:
+        example = dspy.Example(**inputs, **outputs)
+        example._input_keys = set(inputs)
+    example._output_keys = set(outputs)
+    return example
+
+
+def create_dspy_example(
+    doc: Union[StandardExample, Dict[str, Any]],
+) -> dspy.Example:
     """
     Convert a standardized document into a DSPy example.
 
     Args:
-        doc: Standardized document with 'inputs' and 'outputs' dictionaries
+        doc: Standardized document (StandardExample or dict) with 'inputs' and
+            'outputs' dictionaries
 
     Returns:
         DSPy example
@@ -616,128 +1314,330 @@ def create_dspy_example(doc: Dict[str, Any]) -> dspy.Example:
         ValueError: If the document structure is invalid or contains non-string values
     """
     # Validate document structure
-    if "inputs" not in doc or "outputs" not in doc:
-        raise ValueError(
-            f"Document must contain 'inputs' and 'outputs' keys. Found: {list(doc.keys())}"
-        )
+    if isinstance(doc, StandardExample):
+        inputs, outputs, metadata = doc.inputs, doc.outputs, doc.metadata
+    else:
+        if "inputs" not in doc or "outputs" not in doc:
+            raise ValueError(
+                f"Document must contain 'inputs' and 'outputs' keys. Found: {list(doc.keys())}"
+            )
+        inputs, outputs, metadata = doc["inputs"], doc["outputs"], doc.get("metadata")
 
-    if not isinstance(doc["inputs"], dict):
-        raise ValueError(
-            f"'inputs' must be a dictionary, got {type(doc['inputs']).__name__}"
-        )
+    if not isinstance(inputs, dict):
+        raise ValueError(f"'inputs' must be a dictionary, got {type(inputs).__name__}")
 
-    if not isinstance(doc["outputs"], dict):
+    if not isinstance(outputs, dict):
         raise ValueError(
-            f"'outputs' must be a dictionary, got {type(doc['outputs']).__name__}"
+            f"'outputs' must be a dictionary, got {type(outputs).__name__}"
         )
 
     # Validate that all input and output values are strings (or can be converted)
-    validated_inputs = {}
-    for key, value in doc["inputs"].items():
-        if not isinstance(value, str):
-            logging.warning(
-                f"Input field '{key}' is not a string (type: {type(value).__name__}). "
-                f"Converting to string for DSPy compatibility."
-            )
-            if isinstance(value, (dict, list)):
-                value = json.dumps(value, ensure_ascii=False)
-            else:
-                value = str(value)
-        validated_inputs[key] = value
-
-    validated_outputs = {}
-    for key, value in doc["outputs"].items():
-        if not isinstance(value, str):
-            logging.warning(
-                f"Output field '{key}' is not a string (type: {type(value).__name__}). "
-                f"Converting to string for DSPy compatibility."
-            )
-            if isinstance(value, (dict, list)):
-                value = json.dumps(value, ensure_ascii=False)
-            else:
-                value = str(value)
-        validated_outputs[key] = value
+    validated_inputs = _stringify_fields(inputs, "Input")
+    validated_outputs = _stringify_fields(outputs, "Output")
 
     # Verify that standard fields exist
     if "question" not in validated_inputs and "query" not in validated_inputs:
-        logging.error(
-            f"❌ DSPy Example missing 'question' field! "
-            f"Input keys: {list(validated_inputs.keys())}. "
-            f"This will cause DSPy optimization to fail. "
-            f"Check your dataset adapter configuration."
-        )
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                f"❌ DSPy Example missing 'question' field! "
+                f"Input keys: {list(validated_inputs.keys())}. "
+                f"This will cause DSPy optimization to fail. "
+                f"Check your dataset adapter configuration."
+            )
 
     if "answer" not in validated_outputs:
-        logging.error(
-            f"❌ DSPy Example missing 'answer' field! "
-            f"Output keys: {list(validated_outputs.keys())}. "
-            f"This will cause DSPy optimization to fail. "
-            f"Check your dataset adapter configuration."
-        )
-
-    # Create example with validated inputs and outputs
-    example = dspy.Example(**validated_inputs, **validated_outputs)
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                f"❌ DSPy Example missing 'answer' field! "
+                f"Output keys: {list(validated_outputs.keys())}. "
+                f"This will cause DSPy optimization to fail. "
+                f"Check your dataset adapter configuration."
+            )
 
-    # Set input and output keys explicitly
-    example._input_keys = set(validated_inputs.keys())
-    example._output_keys = set(validated_outputs.keys())
+    # Create example with validated inputs and outputs, setting input and
+    # output keys explicitly
+    example = _new_dspy_example(validated_inputs, validated_outputs)
 
     # Log for debugging
-    logging.debug(
-        f"Created DSPy Example with input_keys={example._input_keys}, "
-        f"output_keys={example._output_keys}"
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"Created DSPy Example with input_keys={example._input_keys}, "
+            f"output_keys={example._output_keys}"
+        )
 
     # Add metadata if available
-    if "metadata" in doc:
-        for key, value in doc["metadata"].items():
+    if metadata:
+        for key, value in metadata.items():
             setattr(example, key, value)
 
     return example
 
 
+class _LazyExampleList(MutableSequence):
+    """
+    List of DSPy examples that converts standardized records on first access.
+
+    load_dataset returns its splits as lazy lists so that splits a caller never
+    touches are never converted (and validated). Each record is converted by
+    create_dspy_example at most once; the example is then cached. The list is
+    mutable so optimizers can shuffle it in place, and concatenating it with
+    another sequence returns a plain list.
+    """
+
+    def __init__(self, docs: Iterable[Any]):
+        """
+        Initialize the lazy list.
+
+        Args:
+            docs: Standardized records to convert on access
+        """
+        self._docs = list(docs)
+        self._examples: List[Optional[dspy.Example]] = [None] * len(self._docs)
+
+    def _example_at(self, index: int) -> dspy.Example:
+        example = self._examples[index]
+        if example is None:
+            example = create_dspy_example(self._docs[index])
+            self._examples[index] = example
+        return example
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._example_at(i) for i in range(*index.indices(len(self)))]
+        return self._example_at(index)
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            values = list(value)
+            self._examples[index] = values
+            self._docs[index] = [None] * len(values)
+        else:
+            self._examples[index] = value
+
+    def __delitem__(self, index) -> None:
+        del self._examples[index]
+        del self._docs[index]
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __iter__(self) -> Iterator[dspy.Example]:
+        for i in range(len(self)):
+            yield self._example_at(i)
+
+    def insert(self, index: int, value: dspy.Example) -> None:
+        self._examples.insert(index, value)
+        self._docs.insert(index, None)
+
+    def copy(self) -> List[dspy.Example]:
+        return list(self)
+
+    def __add__(self, other: Iterable[dspy.Example]) -> List[dspy.Example]:
+        return list(self) + list(other)
+
+    def __radd__(self, other: Iterable[dspy.Example]) -> List[dspy.Example]:
+        return list(other) + list(self)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, _LazyExampleList)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+def _dataset_cache_path(
+    adapter: DatasetAdapter, cache_dir: Union[str, Path]
+) -> Optional[Path]:
+    """
+    Build the cache file path for an adapter's standardized output.
+
+    The key covers the dataset file (resolved path, mtime, size), the adapter
+    class, and the adapter's public configuration, so editing the file or
+    changing a field mapping produces a new entry. Values without a stable
+    repr (e.g. transform functions) make the key differ between processes,
+    which simply results in a cache miss.
+
+    Args:
+        adapter: Dataset adapter
+        cache_dir: Directory holding cached datasets
+
+    Returns:
+        Path of the cache file, or None if the adapter is not file-backed
+    """
+    dataset_path = getattr(adapter, "dataset_path", None)
+    if not isinstance(dataset_path, Path) or not dataset_path.is_file():
+        return None
+
+    stat = dataset_path.stat()
+    config = {
+        key: value
+        for key, value in getattr(adapter, "__dict__", {}).items()
+        if not key.startswith("_")
+    }
+    key_source = repr(
+        (
+            _DATASET_CACHE_VERSION,
+            str(dataset_path.resolve()),
+            stat.st_mtime_ns,
+            stat.st_size,
+            type(adapter).__module__,
+            type(adapter).__qualname__,
+            getattr(adapter, "file_format", None),
+            getattr(adapter, "yaml_list_key", None),
+            sorted(config.items()),
+        )
+    )
+    key = hashlib.blake2b(key_source.encode("utf-8"), digest_size=20).hexdigest()
+    return Path(cache_dir) / f"{key}.pkl"
+
+
+def _read_dataset_cache(cache_path: Path) -> Optional[List[Dict[str, Any]]]:
+    """
+    Read cached standardized records, ignoring missing or unreadable entries.
+
+    Args:
+        cache_path: Path of the cache file
+
+    Returns:
+        The cached records, or None on a cache miss
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable dataset cache {cache_path}: {e}")
+        return None
+
+
+def _write_dataset_cache(cache_path: Path, payload: bytes) -> None:
+    """
+    Atomically write a serialized payload to the dataset cache.
+
+    Failures are logged and otherwise ignored, since the cache is only an
+    optimization.
+
+    Args:
+        cache_path: Path of the cache file
+        payload: Serialized data to cache
+    """
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception as e:
+        logger.warning(f"Could not write dataset cache {cache_path}: {e}")
+
+
+def _split_records(
+    data: Any, seed: int, train_end: int, val_end: int
+) -> Tuple[Any, Any, Any]:
+    """
+    Shuffle standardized records with a seeded permutation and split them into
+    train, validation, and test partitions.
+
+    The permutation is split first and each partition gathered directly from
+    it, so the records are copied once rather than shuffled into a new list and
+    then sliced again.
+
+    Adapters may return either a list of dictionaries or a Hugging Face
+    ``datasets.Dataset``. For the latter, ``select`` is used so that each split
+    is an index mapping over the same Arrow table rather than a copy of its rows.
+
+    Args:
+        data: Standardized records returned by ``DatasetAdapter.adapt``
+        seed: Random seed for the permutation
+        train_end: Index where the training split ends
+        val_end: Index where the validation split ends
+
+    Returns:
+        Tuple containing (train_records, val_records, test_records)
+    """
+    permutation = np.random.default_rng(seed).permutation(len(data))
+    split_indices = (
+        permutation[:train_end],
+        permutation[train_end:val_end],
+        permutation[val_end:],
+    )
+    if hasattr(data, "select"):
+        return tuple(data.select(indices.tolist()) for indices in split_indices)
+    return tuple([data[i] for i in indices.tolist()] for indices in split_indices)
+
+
 def load_dataset(
     adapter: DatasetAdapter,
     train_size: float = 0.60,
     validation_size: float = 0.20,
     seed: int = 42,
+    cache: bool = False,
+    cache_dir: Optional[Union[str, Path]] = None,
 ) -> Tuple[List[dspy.Example], List[dspy.Example], List[dspy.Example]]:
     """
     Load dataset using an adapter and split into train, validation, and test sets.
 
+    The splits are list-like and convert records to DSPy examples on first
+    access, so unused splits cost nothing beyond the standardized records.
+
     Args:
         adapter: Dataset adapter
         train_size: Fraction of data to use for training
         validation_size: Fraction of data to use for validation
         seed: Random seed for shuffling
+        cache: Whether to cache the adapter's standardized output on disk, so
+            repeated loads of an unchanged dataset skip adapter.adapt()
+        cache_dir: Directory for cached datasets (defaults to
+            DEFAULT_DATASET_CACHE_DIR)
 
     Returns:
         Tuple containing (trainset, valset, testset)
     """
-    # Get standardized data
-    data = adapter.adapt()
-    logging.info(f"Loaded {len(data)} examples from {adapter.dataset_path}")
-
-    # Convert to DSPy examples
-    dspy_dataset = [create_dspy_example(doc) for doc in data]
+    # Get standardized data, from the on-disk cache if enabled
+    cache_path = (
+        _dataset_cache_path(adapter, cache_dir or DEFAULT_DATASET_CACHE_DIR)
+        if cache
+        else None
+    )
+    data = _read_dataset_cache(cache_path) if cache_path else None
+    if data is not None:
+        logger.debug(f"Loaded standardized dataset from cache {cache_path}")
+    else:
+        data = adapter.adapt()
+        if cache_path and isinstance(data, list):
+            _write_dataset_cache(
+                cache_path, pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+            )
+    logger.info(f"Loaded {len(data)} examples from {adapter.dataset_path}")
 
-    # Split dataset
-    total = len(dspy_dataset)
+    # Split the standardized records before converting them to DSPy examples,
+    # shuffling deterministically so splits don't inherit the source file's order
+    total = len(data)
     train_end = int(total * train_size)
     val_end = train_end + int(total * validation_size)
 
-    trainset = dspy_dataset[:train_end]
-    valset = dspy_dataset[train_end:val_end]
-    testset = dspy_dataset[val_end:]
+    train_docs, val_docs, test_docs = _split_records(data, seed, train_end, val_end)
+
+    # Convert each split to DSPy examples as they are accessed
+    trainset = _LazyExampleList(train_docs)
+    valset = _LazyExampleList(val_docs)
+    testset = _LazyExampleList(test_docs)
 
-    logging.info(f"Created dataset splits:")
-    logging.info(
+    logger.info(f"Created dataset splits:")
+    logger.info(
         f"  - Training:   {len(trainset)} examples ({train_size*100:.1f}% of total)"
     )
-    logging.info(
+    logger.info(
         f"  - Validation: {len(valset)} examples ({validation_size*100:.1f}% of total)"
     )
-    logging.info(
+    logger.info(
         f"  - Testing:    {len(testset)} examples ({(1-train_size-validation_size)*100:.1f}% of total)"
     )
 
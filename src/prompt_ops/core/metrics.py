@@ -10,26 +10,94 @@ This module contains the base metric class and various implementations
 for evaluating the quality of optimized prompts.
 """
 
+import functools
+import hashlib
 import json
 import logging
+import random
 import re
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import (
     Any,
     Callable,
     Dict,
+    FrozenSet,
     Generic,
+    Iterator,
     List,
     Optional,
+    Set,
+    Tuple,
     TypeVar,
     Union,
 )
 
-import dspy
+import numpy as np
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from prompt_ops.core.model import ModelAdapter
 from prompt_ops.core.utils import extract_value, parse_json
 from prompt_ops.core.utils.logging import get_logger
+from prompt_ops.core.utils.semantic_cache import SemanticCache, default_embedding_fn
+
+
+@functools.lru_cache(maxsize=None)
+def _dspy():
+    """
+    Import DSPy on first use.
+
+    Only DSPyMetricAdapter needs DSPy, so the import is deferred until a judge
+    is built or run; code that only uses the string and JSON metrics in this
+    module never pays for it.
+    """
+    import dspy
+
+    return dspy
+
+
+@functools.lru_cache(maxsize=None)
+def _judge_errors() -> Tuple[Tuple[type, ...], Tuple[type, ...]]:
+    """
+    Exception types raised by judge LM calls that are not bugs in the metric.
+
+    Returns:
+        (transient, provider): transient errors are worth retrying; provider
+        errors are failures reported by the LM provider (e.g. a rejected
+        request). Both are LiteLLM/OpenAI exception types when LiteLLM is
+        installed, alongside the builtin timeout and connection errors.
+    """
+    transient = [TimeoutError, ConnectionError]
+    provider = []
+    try:
+        from litellm import exceptions as litellm_exceptions
+    except ImportError:
+        pass
+    else:
+        transient += [
+            litellm_exceptions.Timeout,
+            litellm_exceptions.APIConnectionError,
+            litellm_exceptions.RateLimitError,
+            litellm_exceptions.ServiceUnavailableError,
+            litellm_exceptions.InternalServerError,
+        ]
+        provider.append(litellm_exceptions.OpenAIError)
+    return tuple(transient), tuple(provider)
+
+
+# Upper bound in seconds on the backoff between judge retries
+_MAX_RETRY_DELAY = 2.0
+
+# First number in a judge's score output (e.g. "8", "7.5", "Score: 9/10")
+_SCORE_RE = re.compile(r"-?\d+(?:\.\d+)?")
 
 T = TypeVar("T", bound=Any)
 U = TypeVar("U", bound=Any)
@@ -44,8 +112,15 @@ class MetricBase(ABC, Generic[T, U]):
 
     It also supports different input types, including raw values, dictionaries,
     or structured objects like DSPy examples.
+
+    Metrics are declared with ``__slots__``: evaluation loops read their
+    configuration on every call and orchestrators may create many instances.
+    Subclasses list their own attributes in ``__slots__``; a subclass without
+    a ``__slots__`` declaration keeps an ordinary instance ``__dict__``.
     """
 
+    __slots__ = ("_logger",)
+
     def __init__(self):
         """Initialize the metric with a logger."""
         self._logger = None
@@ -87,6 +162,49 @@ class MetricBase(ABC, Generic[T, U]):
     extract_value = staticmethod(extract_value)
 
 
+# Input resolvers for DSPyMetricAdapter, see _build_input_resolvers
+def _gold_input(gold: Any, pred: Any, kwargs: Dict[str, Any]) -> Any:
+    return extract_value(gold, "answer", gold)
+
+
+def _pred_input(gold: Any, pred: Any, kwargs: Dict[str, Any]) -> Any:
+    return extract_value(pred, "answer", pred)
+
+
+def _kwarg_input(key: str, gold: Any, pred: Any, kwargs: Dict[str, Any]) -> Any:
+    return kwargs.get(key, None)
+
+
+def _build_input_resolvers(
+    input_mapping: Dict[str, str],
+) -> Tuple[Tuple[str, Callable[[Any, Any, Dict[str, Any]], Any]], ...]:
+    """
+    Turn a DSPyMetricAdapter input mapping into (signature key, resolver) pairs.
+
+    Each resolver is called as resolver(gold, pred, kwargs) and returns the
+    value for its signature input, so scoring is a single pass over a fixed
+    tuple instead of re-dispatching on every adapter key per call.
+
+    Args:
+        input_mapping: Mapping of adapter keys ("gold", "pred", or the name of
+            a keyword argument) to signature input names
+
+    Returns:
+        Tuple of (signature key, resolver) pairs in mapping order
+    """
+    resolvers = []
+    for adapter_key, sig_key in input_mapping.items():
+        if adapter_key == "gold":
+            resolver = _gold_input
+        elif adapter_key == "pred":
+            resolver = _pred_input
+        else:
+            # Handle custom mappings
+            resolver = functools.partial(_kwarg_input, adapter_key)
+        resolvers.append((sig_key, resolver))
+    return tuple(resolvers)
+
+
 class DSPyMetricAdapter(MetricBase):
     """
     Adapter for DSPy-based metrics with flexible configuration.
@@ -104,8 +222,40 @@ class DSPyMetricAdapter(MetricBase):
         score_range: Expected score range from the LLM (min, max)
         normalize_to: Range to normalize scores to (min, max)
         custom_instructions: Optional custom instructions for the signature
+        cache_size: Maximum number of scores to keep in the in-memory cache of
+            judged inputs (0 disables the cache)
+        semantic_cache: Whether to also reuse the score of a near-duplicate
+            earlier judgment, found by embedding similarity of the judge inputs
+        embedding_fn: Function mapping a text to an embedding vector for the
+            semantic cache (defaults to a sentence-transformers MiniLM model)
+        similarity_threshold: Minimum cosine similarity for a semantic cache hit
+        max_retries: Number of times to retry a judge call that fails with a
+            transient error (timeouts, connection errors, rate limits)
+        retry_delay: Initial delay in seconds for the jittered exponential
+            backoff between retries
     """
 
+    __slots__ = (
+        "_judge",
+        "_default_instructions_cache",
+        "model",
+        "signature_class",
+        "signature_name",
+        "input_mapping",
+        "_input_resolvers",
+        "output_fields",
+        "score_range",
+        "normalize_to",
+        "custom_instructions",
+        "input_field_descriptions",
+        "cache_size",
+        "_score_cache",
+        "_score_cache_lock",
+        "_semantic_cache",
+        "max_retries",
+        "retry_delay",
+    )
+
     # Built-in signature templates
     SIGNATURES = {
         "similarity": {
@@ -142,6 +292,19 @@ class DSPyMetricAdapter(MetricBase):
         },
     }
 
+    # Attributes the judge module is built from; setting one discards the
+    # cached judge and default instructions so they are rebuilt on next use
+    _JUDGE_ATTRIBUTES = frozenset(
+        {
+            "signature_class",
+            "signature_name",
+            "input_field_descriptions",
+            "output_fields",
+            "score_range",
+            "custom_instructions",
+        }
+    )
+
     def __init__(
         self,
         model=None,
@@ -152,7 +315,17 @@ class DSPyMetricAdapter(MetricBase):
         score_range=(1, 10),
         normalize_to=(0, 1),
         custom_instructions=None,
+        cache_size=4096,
+        semantic_cache=False,
+        embedding_fn=None,
+        similarity_threshold=0.97,
+        max_retries=2,
+        retry_delay=0.2,
     ):
+        # Judge module, built lazily by the judge property
+        self._judge = None
+        self._default_instructions_cache = None
+
         # Handle both raw DSPy models and our ModelAdapter instances
         if isinstance(model, ModelAdapter):
             # If it's a ModelAdapter, we can use its underlying model
@@ -194,8 +367,104 @@ class DSPyMetricAdapter(MetricBase):
             if not custom_instructions:
                 self.custom_instructions = template["instructions"]
 
+        # LRU cache of normalized scores keyed by _score_cache_key; optimization
+        # loops re-evaluate the same (gold, pred) pairs across candidate prompts
+        self.cache_size = cache_size
+        self._score_cache = OrderedDict()
+        self._score_cache_lock = threading.Lock()
+
+        # Optional near-duplicate cache, consulted after the exact cache
+        self._semantic_cache = (
+            SemanticCache(
+                embedding_fn or default_embedding_fn(),
+                similarity_threshold,
+                max(cache_size, 1),
+            )
+            if semantic_cache
+            else None
+        )
+
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+
+    # Rebuilt rather than copied, as locks can't be copied or pickled
+    _UNCOPIED_ATTRIBUTES = frozenset({"_judge", "_score_cache", "_score_cache_lock"})
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Optimizers and evaluators may deep-copy metrics or send them to
+        # worker processes; copies start with an empty score cache
+        state = dict(getattr(self, "__dict__", {}))
+        for cls in type(self).__mro__:
+            for slot in getattr(cls, "__slots__", ()):
+                if slot not in self._UNCOPIED_ATTRIBUTES and hasattr(self, slot):
+                    state[slot] = getattr(self, slot)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, "_judge", None)
+        object.__setattr__(self, "_score_cache", OrderedDict())
+        object.__setattr__(self, "_score_cache_lock", threading.Lock())
+
+    def _judge_fingerprint(self) -> str:
+        """
+        Identify the judge configuration.
+
+        The fingerprint covers everything besides the inputs that affects a
+        score: the judge model, the signature, the instructions, and the score
+        ranges. Changing any of these on the adapter therefore misses the cache.
+
+        Returns:
+            Hex digest identifying the judge configuration
+        """
+        key_source = repr(
+            (
+                id(self.model),
+                id(self.signature_class),
+                self.signature_name,
+                self.custom_instructions,
+                tuple(self.output_fields),
+                tuple(self.score_range),
+                tuple(self.normalize_to),
+            )
+        )
+        return hashlib.blake2b(key_source.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _score_cache_key(self, inputs: Dict[str, Any]) -> str:
+        """
+        Build the score cache key for a set of judge inputs.
+
+        Args:
+            inputs: Judge inputs keyed by signature field
+
+        Returns:
+            Hex digest identifying the judgment
+        """
+        key_source = repr((self._judge_fingerprint(), sorted(inputs.items())))
+        return hashlib.blake2b(key_source.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _get_cached_score(self, key: str) -> Optional[float]:
+        """Return the cached score for a key, or None on a cache miss."""
+        with self._score_cache_lock:
+            score = self._score_cache.get(key)
+            if score is not None:
+                self._score_cache.move_to_end(key)
+            return score
+
+    def _cache_score(self, key: str, score: float) -> None:
+        """Store a score, evicting the least recently used entries."""
+        if self.cache_size <= 0:
+            return
+        with self._score_cache_lock:
+            self._score_cache[key] = score
+            self._score_cache.move_to_end(key)
+            while len(self._score_cache) > self.cache_size:
+                self._score_cache.popitem(last=False)
+
     def build_custom_signature(self):
         """Build a custom signature class based on configuration."""
+        dspy = _dspy()
 
         # Define input and output fields
         input_fields = {
@@ -228,23 +497,28 @@ class DSPyMetricAdapter(MetricBase):
 
     def _default_instructions(self):
         """Generate default instructions based on configuration."""
+        if self._default_instructions_cache is None:
+            self._default_instructions_cache = self._compute_default_instructions()
+        return self._default_instructions_cache
+
+    def _compute_default_instructions(self) -> str:
+        """Render the default instructions from the current configuration."""
+        low, high = self.score_range
+        header = (
+            "Evaluate the similarity between the inputs.\n"
+            f"Score from {low}-{high}, where {low} means completely different\n"
+            f"and {high} means identical in meaning."
+        )
         input_placeholders = "\n\n".join(
-            f"{name.capitalize()}: {{{name}}}"
-            for name in self.input_field_descriptions.keys()
+            [
+                f"{name.capitalize()}: {{{name}}}"
+                for name in self.input_field_descriptions
+            ]
         )
-
         output_placeholders = "\n".join(
-            f"{name.capitalize()}[{self.score_range[0]}-{self.score_range[1]}]:"
-            for name in self.output_fields
+            [f"{name.capitalize()}[{low}-{high}]:" for name in self.output_fields]
         )
-
-        return f"""Evaluate the similarity between the inputs.
-Score from {self.score_range[0]}-{self.score_range[1]}, where {self.score_range[0]} means completely different
-and {self.score_range[1]} means identical in meaning.
-
-{input_placeholders}
-
-{output_placeholders}"""
+        return "\n\n".join((header, input_placeholders, output_placeholders))
 
     def normalize_score(self, score):
         """Normalize score from score_range to normalize_to range."""
@@ -263,6 +537,104 @@ and {self.score_range[1]} means identical in meaning.
         # Clamp to the target range
         return max(min_norm, min(max_norm, normalized))
 
+    def normalize_scores(self, scores: Any) -> np.ndarray:
+        """
+        Normalize an array of scores from score_range to normalize_to range.
+
+        Vectorized counterpart of normalize_score for callers that hold many
+        raw scores at once.
+
+        Args:
+            scores: Raw scores (array-like)
+
+        Returns:
+            Array of normalized scores, clamped to the target range
+        """
+        scores = np.asarray(scores, dtype=np.float64)
+        min_score, max_score = self.score_range
+        min_norm, max_norm = self.normalize_to
+
+        # Handle edge cases
+        if min_score == max_score:
+            return np.full_like(scores, min_norm)
+
+        normalized = (scores - min_score) / (max_score - min_score) * (
+            max_norm - min_norm
+        ) + min_norm
+        return np.clip(normalized, min_norm, max_norm)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in self._JUDGE_ATTRIBUTES:
+            super().__setattr__("_judge", None)
+            super().__setattr__("_default_instructions_cache", None)
+        elif name == "input_mapping":
+            super().__setattr__("_input_resolvers", _build_input_resolvers(value))
+
+    @property
+    def judge(self):
+        """DSPy judge module, built on first use and reused across calls."""
+        if self._judge is None:
+            self._judge = _dspy().ChainOfThought(self._resolve_signature())
+        return self._judge
+
+    def _resolve_signature(self):
+        """Get the signature class to use for the judge."""
+        if self.signature_class:
+            return self.signature_class
+        dspy = _dspy()
+        if self.signature_name and hasattr(dspy, self.signature_name):
+            return getattr(dspy, self.signature_name)
+        return self.build_custom_signature()
+
+    def batch(
+        self,
+        golds: List[Any],
+        preds: List[Any],
+        max_threads: int = 32,
+        trace: bool = False,
+        **kwargs,
+    ) -> List[float]:
+        """
+        Evaluate many predictions concurrently.
+
+        The judge calls are I/O bound, so running up to max_threads of them at
+        once overlaps their network latency instead of paying it once per pair.
+        A single judge module is shared by the whole batch.
+
+        Args:
+            golds: Ground truth examples
+            preds: Predicted examples, aligned with golds
+            max_threads: Maximum number of judge calls in flight
+            trace: Whether to enable tracing
+            **kwargs: Additional inputs for custom input mappings
+
+        Returns:
+            List of scores in the same order as the inputs
+
+        Raises:
+            ValueError: If golds and preds have different lengths
+        """
+        if len(golds) != len(preds):
+            raise ValueError(
+                f"golds and preds must have the same length, got {len(golds)} and {len(preds)}"
+            )
+
+        judge = self.judge
+
+        def score(pair):
+            return self._score(pair[0], pair[1], trace, judge, **kwargs)
+
+        if max_threads <= 1:
+            # Sequential execution
+            return [score(pair) for pair in zip(golds, preds)]
+
+        # Parallel execution
+        import concurrent.futures
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_threads) as executor:
+            return list(executor.map(score, zip(golds, preds)))
+
     def __call__(self, gold: Any, pred: Any, trace: bool = False, **kwargs) -> float:
         """
         Evaluate the prediction against the ground truth using DSPy.
@@ -275,17 +647,31 @@ and {self.score_range[1]} means identical in meaning.
         Returns:
             A float score between normalize_to[0] and normalize_to[1]
         """
+        return self._score(gold, pred, trace, None, **kwargs)
+
+    def _score(
+        self, gold: Any, pred: Any, trace: bool, judge: Optional[Any], **kwargs
+    ) -> float:
+        """
+        Score a single prediction, optionally with a prebuilt judge module.
+
+        Args:
+            gold: Ground truth example
+            pred: Predicted example
+            trace: Whether to enable tracing
+            judge: Judge module to use; defaults to the adapter's judge
+
+        Returns:
+            A float score between normalize_to[0] and normalize_to[1]
+        """
+        transient_errors, provider_errors = _judge_errors()
+        judge_failures = (ValueError, *transient_errors, *provider_errors)
         try:
             # Extract values from objects based on input mapping
-            inputs = {}
-            for adapter_key, sig_key in self.input_mapping.items():
-                if adapter_key == "gold":
-                    inputs[sig_key] = extract_value(gold, "answer", gold)
-                elif adapter_key == "pred":
-                    inputs[sig_key] = extract_value(pred, "answer", pred)
-                else:
-                    # Handle custom mappings
-                    inputs[sig_key] = kwargs.get(adapter_key, None)
+            inputs = {
+                sig_key: resolve(gold, pred, kwargs)
+                for sig_key, resolve in self._input_resolvers
+            }
 
             if trace:
                 for key, value in inputs.items():
@@ -293,33 +679,47 @@ and {self.score_range[1]} means identical in meaning.
                         f"\n{key.capitalize()}: {value}"
                     )  # Replaced print with logger.debug
 
-            # Get the signature class to use
-            if self.signature_class:
-                signature = self.signature_class
-            elif self.signature_name and hasattr(dspy, self.signature_name):
-                signature = getattr(dspy, self.signature_name)
-            else:
-                signature = self.build_custom_signature()
+            # Reuse the score of an identical earlier judgment
+            cache_key = self._score_cache_key(inputs) if self.cache_size > 0 else None
+            if cache_key is not None:
+                cached_score = self._get_cached_score(cache_key)
+                if cached_score is not None:
+                    if trace:
+                        self.logger.debug(f"Cached score: {cached_score}")
+                    return cached_score
+
+            # Reuse the score of a near-duplicate earlier judgment
+            semantic_vector = None
+            if self._semantic_cache is not None:
+                semantic_namespace = self._judge_fingerprint()
+                semantic_vector = self._semantic_cache.embed(
+                    json.dumps(inputs, sort_keys=True, default=str)
+                )
+                if semantic_vector is not None:
+                    cached_score = self._semantic_cache.lookup(
+                        semantic_namespace, semantic_vector
+                    )
+                    if cached_score is not None:
+                        if trace:
+                            self.logger.debug(
+                                f"Semantically cached score: {cached_score}"
+                            )
+                        return cached_score
 
-            judge = dspy.ChainOfThought(signature)
+            if judge is None:
+                judge = self.judge
 
-            with dspy.context(lm=self.model):
-                result = judge(**inputs)
+            result = self._invoke_judge(judge, inputs, trace)
 
             # Extract scores from result
             scores = []
             for field in self.output_fields:
                 if hasattr(result, field):
-                    # Extract just the numeric score, removing any extra text
-                    score_str = "".join(
-                        c
-                        for c in str(getattr(result, field))
-                        if c.isdigit() or c == "."
-                    )
-                    try:
-                        score = float(score_str)
-                        scores.append(score)
-                    except ValueError:
+                    # Extract just the numeric score, ignoring any extra text
+                    match = _SCORE_RE.search(str(getattr(result, field)))
+                    if match:
+                        scores.append(float(match.group()))
+                    else:
                         if trace:
                             self.logger.debug(  # Replaced print with logger.debug
                                 f"Could not parse score from {field}: {getattr(result, field)}"
@@ -337,6 +737,12 @@ and {self.score_range[1]} means identical in meaning.
 
             # Normalize the score
             final_score = self.normalize_score(raw_score)
+            if cache_key is not None:
+                self._cache_score(cache_key, final_score)
+            if semantic_vector is not None:
+                self._semantic_cache.add(
+                    semantic_namespace, semantic_vector, final_score
+                )
 
             if trace:
                 self.logger.debug(
@@ -348,30 +754,53 @@ and {self.score_range[1]} means identical in meaning.
 
             return final_score
 
-        except (ValueError, TypeError, KeyError, AttributeError) as e:
-            # Expected errors when parsing LLM outputs or accessing attributes
-            logging.warning(f"Expected error in DSPyMetricAdapter: {str(e)}")
+        except judge_failures as e:
+            # Unparseable LLM outputs, exhausted retries, and provider-reported
+            # failures score as the worst result; anything else is a bug in
+            # the metric or its configuration and propagates
+            logging.warning(f"Judge error in DSPyMetricAdapter: {str(e)}")
             if trace:
                 self.logger.debug(
-                    f"\nExpected error in metric evaluation: {str(e)}"
+                    f"\nJudge error in metric evaluation: {str(e)}"
                 )  # Replaced print with logger.debug
 
-            # Return a default score for expected evaluation failures
+            # Return a default score for failed judgments
             return self.normalize_to[0]
 
-        except Exception as e:
-            # Unexpected errors that might indicate bugs in the code
-            logging.error(f"Unexpected error in DSPyMetricAdapter: {str(e)}")
-            if trace:
-                self.logger.debug(
-                    f"\nUnexpected error in metric: {str(e)}"
-                )  # Replaced print with logger.debug
-                import traceback
+    def _invoke_judge(self, judge: Any, inputs: Dict[str, Any], trace: bool) -> Any:
+        """
+        Run the judge, retrying transient LM failures with jittered backoff.
 
-                traceback.print_exc()
+        Args:
+            judge: Judge module to call
+            inputs: Signature inputs for the judge
+            trace: Whether to enable tracing
 
-            # Still return a default score, but this should be investigated
-            return self.normalize_to[0]
+        Returns:
+            The judge's prediction
+
+        Raises:
+            Exception: The last transient error once retries are exhausted, or
+                any other error raised by the judge
+        """
+        transient_errors = _judge_errors()[0]
+        for attempt in range(self.max_retries + 1):
+            try:
+                with _dspy().context(lm=self.model):
+                    return judge(**inputs)
+            except transient_errors as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = min(
+                    self.retry_delay * (2**attempt)
+                    + random.uniform(0, self.retry_delay),
+                    _MAX_RETRY_DELAY,
+                )
+                if trace:
+                    self.logger.debug(
+                        f"Transient judge error ({e}); retrying in {delay:.2f}s"
+                    )
+                time.sleep(delay)
 
 
 class ExactMatchMetric(MetricBase):
@@ -382,17 +811,55 @@ class ExactMatchMetric(MetricBase):
     and returns 1.0 if they match exactly, 0.0 otherwise.
     """
 
-    def __init__(self, case_sensitive: bool = True, strip_whitespace: bool = True):
+    __slots__ = ("case_sensitive", "strip_whitespace", "return_scalar")
+
+    def __init__(
+        self,
+        case_sensitive: bool = True,
+        strip_whitespace: bool = True,
+        return_scalar: bool = False,
+    ):
         """
         Initialize the exact match metric.
 
         Args:
             case_sensitive: Whether to perform case-sensitive matching
             strip_whitespace: Whether to strip whitespace before comparing
+            return_scalar: Whether __call__ returns the bare float score instead
+                of a {'exact_match': score} dictionary
         """
         super().__init__()
         self.case_sensitive = case_sensitive
         self.strip_whitespace = strip_whitespace
+        self.return_scalar = return_scalar
+
+    def _normalize(self, value: Any) -> str:
+        """Convert a value to the string form that is compared."""
+        text = value if type(value) is str else str(value)
+        if self.strip_whitespace:
+            text = text.strip()
+        if not self.case_sensitive:
+            text = text.lower()
+        return text
+
+    def score(self, gold: Any, pred: Any) -> float:
+        """
+        Check if prediction exactly matches ground truth, as a bare float.
+
+        Hot loops that only need the number should use this rather than
+        __call__, which wraps the score in a dictionary by default.
+
+        Args:
+            gold: Ground truth string or object with a string representation
+            pred: Predicted string or object with a string representation
+
+        Returns:
+            1.0 for a match, 0.0 for a mismatch
+        """
+        if gold is pred or (type(gold) is str and type(pred) is str and gold == pred):
+            # Identical values match under any normalization
+            return 1.0
+        return 1.0 if self._normalize(gold) == self._normalize(pred) else 0.0
 
     def __call__(
         self, gold: Any, pred: Any, trace: bool = False, **kwargs
@@ -406,27 +873,205 @@ class ExactMatchMetric(MetricBase):
             trace: Whether to print detailed information
 
         Returns:
-            Dictionary with 'exact_match' score (1.0 for match, 0.0 for mismatch)
+            Dictionary with 'exact_match' score (1.0 for match, 0.0 for mismatch),
+            or the bare score if return_scalar is set
         """
-        gold_str = str(gold)
-        pred_str = str(pred)
+        if not trace:
+            match = self.score(gold, pred)
+        else:
+            gold_str = self._normalize(gold)
+            pred_str = self._normalize(pred)
+            match = 1.0 if gold_str == pred_str else 0.0
+
+            self.logger.debug(f"Gold: {gold_str}")  # Replaced print with logger.debug
+            self.logger.debug(f"Pred: {pred_str}")  # Replaced print with logger.debug
+            self.logger.debug(f"Match: {match}")  # Replaced print with logger.debug
+
+        return match if self.return_scalar else {"exact_match": match}
+
+    def batch(self, golds: List[Any], preds: List[Any]) -> np.ndarray:
+        """
+        Check many predictions at once.
+
+        Applies the same normalization as __call__, but to whole arrays of
+        strings with NumPy's vectorized string operations instead of one
+        Python call per pair.
+
+        Args:
+            golds: Ground truth values
+            preds: Predicted values, aligned with golds
+
+        Returns:
+            float32 array with 1.0 for each match and 0.0 for each mismatch
+
+        Raises:
+            ValueError: If golds and preds have different lengths
+        """
+        if len(golds) != len(preds):
+            raise ValueError(
+                f"golds and preds must have the same length, got {len(golds)} and {len(preds)}"
+            )
+
+        gold_strs = np.array([str(gold) for gold in golds], dtype=np.str_)
+        pred_strs = np.array([str(pred) for pred in preds], dtype=np.str_)
 
         if self.strip_whitespace:
-            gold_str = gold_str.strip()
-            pred_str = pred_str.strip()
+            gold_strs = np.char.strip(gold_strs)
+            pred_strs = np.char.strip(pred_strs)
 
         if not self.case_sensitive:
-            gold_str = gold_str.lower()
-            pred_str = pred_str.lower()
+            gold_strs = np.char.lower(gold_strs)
+            pred_strs = np.char.lower(pred_strs)
 
-        match = 1.0 if gold_str == pred_str else 0.0
+        return (gold_strs == pred_strs).astype(np.float32)
 
-        if trace:
-            self.logger.debug(f"Gold: {gold_str}")  # Replaced print with logger.debug
-            self.logger.debug(f"Pred: {pred_str}")  # Replaced print with logger.debug
-            self.logger.debug(f"Match: {match}")  # Replaced print with logger.debug
+    def evaluate(self, golds: Any, preds: Any) -> Union[np.ndarray, float]:
+        """
+        Evaluate either a single pair or aligned sequences of values.
 
-        return {"exact_match": match}
+        Args:
+            golds: Ground truth value, or a list/tuple/array of them
+            preds: Predicted value, or a list/tuple/array of them
+
+        Returns:
+            A float32 array of scores for sequences (see batch), or a single
+            float score for a single pair
+        """
+        if isinstance(golds, (list, tuple, np.ndarray)) and isinstance(
+            preds, (list, tuple, np.ndarray)
+        ):
+            return self.batch(golds, preds)
+        return self.score(golds, preds)
+
+
+def _flatten_keys(
+    obj: Any, prefix: str = "", out: Optional[List[str]] = None
+) -> List[str]:
+    """
+    Flatten a JSON value into the key paths of its leaves (e.g. "a.b[0].c").
+
+    Walks the tree with an explicit stack, so deep documents neither pay
+    per-level call overhead nor hit the recursion limit. The order of the
+    returned paths is unspecified.
+
+    Args:
+        obj: JSON value to flatten
+        prefix: Key path of obj itself
+        out: Optional list to append the key paths to
+
+    Returns:
+        The list of key paths (out, if given)
+    """
+    if out is None:
+        out = []
+    stack = [(obj, prefix)]
+    while stack:
+        current, path = stack.pop()
+        if isinstance(current, dict):
+            children = ((f"{path}.{k}" if path else k, v) for k, v in current.items())
+        elif isinstance(current, list):
+            children = ((f"{path}[{i}]", v) for i, v in enumerate(current))
+        else:
+            out.append(path)
+            continue
+        for key, value in children:
+            if isinstance(value, (dict, list)) and value:
+                stack.append((value, key))
+            else:
+                out.append(key)
+    return out
+
+
+def _iter_leaf_paths(obj: Any) -> Iterator[Tuple[Any, ...]]:
+    """
+    Yield the paths of a JSON value's leaves as tuples of keys and indices.
+
+    This is the set-friendly counterpart of _flatten_keys: the paths are
+    compared and hashed as tuples, without building a printable key string
+    for every leaf. Unlike the strings, tuple paths also keep a dotted key
+    such as {"a.b": 1} distinct from the nested {"a": {"b": 1}}. Each leaf is
+    yielded exactly once.
+
+    Args:
+        obj: JSON value to flatten
+
+    Yields:
+        Leaf paths, in unspecified order
+    """
+    stack = [(obj, ())]
+    while stack:
+        current, path = stack.pop()
+        if isinstance(current, dict):
+            children = current.items()
+        elif isinstance(current, list):
+            children = enumerate(current)
+        else:
+            yield path
+            continue
+        for key, value in children:
+            if isinstance(value, (dict, list)) and value:
+                stack.append((value, path + (key,)))
+            else:
+                yield path + (key,)
+
+
+def _leaf_paths(obj: Any) -> Set[Tuple[Any, ...]]:
+    """
+    Collect the leaf paths of a JSON value (see _iter_leaf_paths).
+
+    Args:
+        obj: JSON value to flatten
+
+    Returns:
+        Set of leaf paths
+    """
+    return set(_iter_leaf_paths(obj))
+
+
+def _loads_json(raw: str) -> Any:
+    """
+    Parse a JSON string, using orjson when it is installed.
+
+    Args:
+        raw: JSON string
+
+    Returns:
+        The parsed value
+
+    Raises:
+        json.JSONDecodeError: If the string is not valid JSON
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than the stdlib (e.g. NaN, big ints); let
+            # json.loads handle those documents and report genuine errors.
+            pass
+    return json.loads(raw)
+
+
+@functools.lru_cache(maxsize=1024)
+def _loads_gold_json(raw: str) -> Any:
+    """
+    Parse a ground truth JSON string, memoized by the raw string.
+
+    The same ground truth is scored against many candidate predictions during
+    optimization, so it only needs to be parsed once. Callers must not mutate
+    the returned value.
+    """
+    return _loads_json(raw)
+
+
+@functools.lru_cache(maxsize=1024)
+def _gold_leaf_paths(raw: str) -> FrozenSet[Tuple[Any, ...]]:
+    """
+    Leaf paths of a ground truth JSON string, memoized by the raw string.
+
+    Raises:
+        json.JSONDecodeError: If the string is not valid JSON
+    """
+    return frozenset(_iter_leaf_paths(_loads_gold_json(raw)))
 
 
 def json_evaluation_metric(
@@ -449,17 +1094,19 @@ def json_evaluation_metric(
     # Parse JSON if needed
     if isinstance(gold, str):
         try:
-            gold = json.loads(gold)
+            gold_keys = _gold_leaf_paths(gold)
         except json.JSONDecodeError:
             if trace:
                 get_logger().debug(
                     "Error parsing gold JSON"
                 )  # Replaced print with logger.debug
             return {"precision": 0.0, "recall": 0.0, "f1": 0.0}
+    else:
+        gold_keys = _leaf_paths(gold)
 
     if isinstance(pred, str):
         try:
-            pred = json.loads(pred)
+            pred = _loads_json(pred)
         except json.JSONDecodeError:
             if trace:
                 get_logger().debug(
@@ -467,34 +1114,17 @@ def json_evaluation_metric(
                 )  # Replaced print with logger.debug
             return {"precision": 0.0, "recall": 0.0, "f1": 0.0}
 
-    # Flatten both JSONs into key paths
-    def _flatten_keys(obj: Any, prefix: str = "") -> List[str]:
-        keys = []
-        if isinstance(obj, dict):
-            for k, v in obj.items():
-                key = f"{prefix}.{k}" if prefix else k
-                if isinstance(v, (dict, list)) and v:
-                    keys.extend(_flatten_keys(v, key))
-                else:
-                    keys.append(key)
-        elif isinstance(obj, list):
-            for i, v in enumerate(obj):
-                key = f"{prefix}[{i}]"
-                if isinstance(v, (dict, list)) and v:
-                    keys.extend(_flatten_keys(v, key))
-                else:
-                    keys.append(key)
-        else:
-            keys.append(prefix)
-        return keys
-
-    gold_keys = set(_flatten_keys(gold))
-    pred_keys = set(_flatten_keys(pred))
-
-    # Calculate metrics
-    true_positives = len(gold_keys.intersection(pred_keys))
-    false_positives = len(pred_keys - gold_keys)
-    false_negatives = len(gold_keys - pred_keys)
+    # Stream the predicted leaves against the gold paths instead of collecting
+    # them into a set; each path is either shared or unique to one side, so
+    # one pass gives all three counts
+    true_positives = 0
+    pred_count = 0
+    for path in _iter_leaf_paths(pred):
+        pred_count += 1
+        if path in gold_keys:
+            true_positives += 1
+    false_positives = pred_count - true_positives
+    false_negatives = len(gold_keys) - true_positives
 
     precision = (
         true_positives / (true_positives + false_positives)
@@ -514,8 +1144,15 @@ def json_evaluation_metric(
 
     if trace:
         logger = get_logger()
-        logger.debug(f"Gold keys: {gold_keys}")  # Replaced print with logger.debug
-        logger.debug(f"Pred keys: {pred_keys}")  # Replaced print with logger.debug
+        if isinstance(gold, str):
+            gold = _loads_gold_json(gold)
+        # Only build the printable key paths when they are logged
+        logger.debug(
+            f"Gold keys: {set(_flatten_keys(gold))}"
+        )  # Replaced print with logger.debug
+        logger.debug(
+            f"Pred keys: {set(_flatten_keys(pred))}"
+        )  # Replaced print with logger.debug
         logger.debug(f"Precision: {precision:.2f}")  # Replaced print with logger.debug
         logger.debug(f"Recall: {recall:.2f}")  # Replaced print with logger.debug
         logger.debug(f"F1: {f1:.2f}")  # Replaced print with logger.debug
@@ -531,6 +1168,8 @@ class FacilityMetric(MetricBase):
     specifically evaluates JSON predictions with urgency, sentiment, and categories fields.
     """
 
+    __slots__ = ("output_field", "strict_json")
+
     def __init__(
         self, output_field: str = "answer", strict_json: bool = False, **kwargs
     ):
@@ -667,6 +1306,16 @@ class StandardJSONMetric(MetricBase):
     It supports flexible field mapping and custom scoring logic.
     """
 
+    __slots__ = (
+        "evaluation_mode",
+        "fields",
+        "field_weights",
+        "required_fields",
+        "nested_fields",
+        "strict_json",
+        "output_field",
+    )
+
     def __init__(
         self,
         output_fields: Optional[Union[List[str], Dict[str, float]]] = None,
@@ -11,33 +11,81 @@ different providers (DSPy, TextGrad, etc.) for use with the prompt-ops tool.
 It leverages LiteLLM's unified interface for accessing various LLM providers.
 """
 
+import asyncio
+import functools
+import hashlib
+import importlib.util
+import json
 import os
+import threading
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from collections import OrderedDict, deque
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from .utils.logging import get_logger
+from .utils.semantic_cache import SemanticCache, default_embedding_fn
 
-try:
+# Provider libraries are slow to import, so only check that they are installed
+# here; each one is imported by the first adapter that uses it
+DSPY_AVAILABLE = importlib.util.find_spec("dspy") is not None
+TEXTGRAD_AVAILABLE = importlib.util.find_spec("textgrad") is not None
+LITELLM_AVAILABLE = importlib.util.find_spec("litellm") is not None
+
+
+@functools.lru_cache(maxsize=None)
+def _dspy():
+    """Import DSPy on first use."""
     import dspy
 
-    DSPY_AVAILABLE = True
-except ImportError:
-    DSPY_AVAILABLE = False
+    return dspy
+
 
-try:
-    import textgrad as tg
+@functools.lru_cache(maxsize=None)
+def _textgrad():
+    """Import TextGrad on first use."""
+    import textgrad
 
-    TEXTGRAD_AVAILABLE = True
-except ImportError:
-    TEXTGRAD_AVAILABLE = False
+    return textgrad
 
-try:
+
+@functools.lru_cache(maxsize=None)
+def _litellm():
+    """Import LiteLLM on first use."""
     import litellm
 
-    LITELLM_AVAILABLE = True
-except ImportError:
-    LITELLM_AVAILABLE = False
+    return litellm
+
+
+@functools.lru_cache(maxsize=None)
+def _dspy_lm_owners() -> Tuple[Any, ...]:
+    """
+    DSPy objects that some components read the default LM from directly.
+
+    Beyond dspy.configure, these are the settings, dspy.LM (for backward
+    compatibility) and the teleprompt module used by MIPROv2 (only where it
+    exposes an `lm`).
+    """
+    dspy = _dspy()
+    owners = (
+        getattr(dspy, "settings", None),
+        getattr(dspy, "LM", None),
+        dspy.teleprompt if hasattr(getattr(dspy, "teleprompt", None), "lm") else None,
+    )
+    return tuple(owner for owner in owners if owner is not None)
+
+
+# Guards creation of the per-adapter generate_batch thread pools
+_EXECUTOR_LOCK = threading.Lock()
+
+# Prompt prefix for each chat role when flattening messages into a single prompt
+_ROLE_PREFIXES = {"system": "System: ", "user": "User: ", "assistant": "Assistant: "}
+
+# Maximum number of responses kept per request configuration by the semantic cache
+_SEMANTIC_CACHE_SIZE = 4096
+
+# Timeout of pooled provider connections, matching litellm's default request timeout
+_HTTP_POOL_TIMEOUT = 600.0
 
 
 class ModelAdapter(ABC):
@@ -96,7 +144,9 @@ class ModelAdapter(ABC):
         Generate responses for multiple prompts, optionally in parallel.
 
         This method is useful for optimizers that need to evaluate multiple
-        candidates simultaneously (e.g., PDO duels, batch evaluation).
+        candidates simultaneously (e.g., PDO duels, batch evaluation). When the
+        temperature is known to be zero, repeated prompts are generated once and
+        their response is shared.
 
         Args:
             prompts: List of input prompts
@@ -106,18 +156,77 @@ class ModelAdapter(ABC):
         Returns:
             List of generated responses in same order as input prompts
         """
+        # Identical prompts get identical deterministic responses, so only
+        # send each one once; sampled requests keep their independent draws,
+        # as do requests to adapters that don't expose their temperature
+        temperature = kwargs.get("temperature")
+        if temperature is None:
+            temperature = getattr(self, "temperature", None)
+        if temperature is None or temperature:
+            return self._generate_batch(prompts, max_threads, **kwargs)
+
+        positions = {}
+        order = [positions.setdefault(prompt, len(positions)) for prompt in prompts]
+        if len(positions) == len(prompts):
+            return self._generate_batch(prompts, max_threads, **kwargs)
+        results = self._generate_batch(list(positions), max_threads, **kwargs)
+        return [results[i] for i in order]
+
+    def _generate_batch(
+        self, prompts: List[str], max_threads: int = 1, **kwargs
+    ) -> List[str]:
+        """
+        Generate responses for distinct prompts; see generate_batch.
+
+        Adapters with a more efficient way of running many requests override
+        this rather than generate_batch, keeping the deduplication.
+        """
         if max_threads <= 1:
             # Sequential execution
             return [self.generate(prompt, **kwargs) for prompt in prompts]
 
         # Parallel execution
+        executor = self._batch_executor(max_threads)
+        futures = [
+            executor.submit(self.generate, prompt, **kwargs) for prompt in prompts
+        ]
+        return [future.result() for future in futures]
+
+    def _batch_executor(self, max_threads: int) -> Any:
+        """
+        Get this adapter's thread pool for batches, sized to max_threads.
+
+        The pool is kept across calls so batches don't pay for starting and
+        stopping threads; it is only replaced when max_threads changes.
+
+        Args:
+            max_threads: Number of worker threads required
+
+        Returns:
+            A concurrent.futures.ThreadPoolExecutor
+        """
         import concurrent.futures
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_threads) as executor:
-            futures = [
-                executor.submit(self.generate, prompt, **kwargs) for prompt in prompts
-            ]
-            return [future.result() for future in futures]
+        with _EXECUTOR_LOCK:
+            # Subclasses don't call ModelAdapter.__init__, so the pool is an
+            # attribute set on first use
+            executor = getattr(self, "_executor", None)
+            if executor is not None and self._executor_workers == max_threads:
+                return executor
+            if executor is not None:
+                get_logger().progress(
+                    f"generate_batch max_threads changed from "
+                    f"{self._executor_workers} to {max_threads}; "
+                    f"recreating the thread pool",
+                    level="WARNING",
+                )
+                # Batches still running on the old pool finish normally
+                executor.shutdown(wait=False)
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_threads, thread_name_prefix="prompt-ops"
+            )
+            self._executor_workers = max_threads
+            return self._executor
 
 
 class DSPyModelAdapter(ModelAdapter):
@@ -130,7 +239,7 @@ class DSPyModelAdapter(ModelAdapter):
         model_name: str = None,
         api_base: str = None,
         api_key: str = None,
-        max_tokens: int = 48000,
+        max_tokens: int = 4096,
         temperature: float = 0.0,
         cache: bool = False,
         num_retries: int = 15,
@@ -164,6 +273,9 @@ class DSPyModelAdapter(ModelAdapter):
             "cache": cache,
             **kwargs,
         }
+        self.temperature = temperature
+
+        dspy = _dspy()
 
         # Create the DSPy model - pass num_retries directly to dspy.LM
         self._model = dspy.LM(
@@ -181,20 +293,10 @@ class DSPyModelAdapter(ModelAdapter):
         # This is critical for DSPy's optimizers to work properly
         dspy.configure(lm=self._model)
 
-        # Ensure the model is globally accessible for DSPy
-        # This is needed for some DSPy components that don't explicitly take a model parameter
-        if hasattr(dspy, "settings"):
-            dspy.settings.lm = self._model
-
-        # Set the global LM in the DSPy module for backward compatibility
-        # Some DSPy components access this directly
-        if hasattr(dspy, "LM"):
-            dspy.LM.lm = self._model
-
-        # For DSPy's teleprompt module which is used by MIPROv2
-        if hasattr(dspy, "teleprompt"):
-            if hasattr(dspy.teleprompt, "lm"):
-                dspy.teleprompt.lm = self._model
+        # Also publish the model on the DSPy objects that read a global `lm`
+        # instead of taking a model parameter
+        for owner in _dspy_lm_owners():
+            owner.lm = self._model
 
     def generate(
         self, prompt: str, temperature: float = None, max_tokens: int = None, **kwargs
@@ -226,7 +328,7 @@ class DSPyModelAdapter(ModelAdapter):
         try:
             # Use the model to generate a completion
             if temp_config:
-                with dspy.settings(**temp_config):
+                with _dspy().settings(**temp_config):
                     response = self._model(prompt)
             else:
                 response = self._model(prompt)
@@ -235,10 +337,14 @@ class DSPyModelAdapter(ModelAdapter):
 
         except Exception as e:
             # Check if it's a rate limit error
-            if LITELLM_AVAILABLE and isinstance(e, litellm.exceptions.RateLimitError):
-                logger.error(f"Rate limit exceeded in generate(): {e}")
+            if LITELLM_AVAILABLE and isinstance(
+                e, _litellm().exceptions.RateLimitError
+            ):
+                logger.progress(
+                    f"Rate limit exceeded in generate(): {e}", level="ERROR"
+                )
             else:
-                logger.error(f"Error in generate(): {e}")
+                logger.progress(f"Error in generate(): {e}", level="ERROR")
             raise
 
     def generate_with_chat_format(
@@ -260,20 +366,15 @@ class DSPyModelAdapter(ModelAdapter):
         Returns:
             The generated text response
         """
-        # Format the messages into a single prompt
-        formatted_prompt = ""
+        # Format the messages into a single prompt; messages with other roles
+        # are left out
+        parts = []
         for message in messages:
-            role = message.get("role", "user").lower()
-            content = message.get("content", "")
-
-            if role == "system":
-                formatted_prompt += f"System: {content}\n\n"
-            elif role == "user":
-                formatted_prompt += f"User: {content}\n\n"
-            elif role == "assistant":
-                formatted_prompt += f"Assistant: {content}\n\n"
-
-        formatted_prompt += "Assistant: "
+            prefix = _ROLE_PREFIXES.get(message.get("role", "user").lower())
+            if prefix is not None:
+                parts.append(f"{prefix}{message.get('content', '')}\n\n")
+        parts.append("Assistant: ")
+        formatted_prompt = "".join(parts)
 
         # Generate the response using the formatted prompt
         return self.generate(
@@ -329,7 +430,7 @@ class TextGradModelAdapter(ModelAdapter):
         engine_kwargs.update(kwargs)
 
         # Get the engine
-        self._model = tg.get_engine(engine_name=model_name, **engine_kwargs)
+        self._model = _textgrad().get_engine(engine_name=model_name, **engine_kwargs)
 
     def generate(
         self, prompt: str, temperature: float = 0.0, max_tokens: int = 1024, **kwargs
@@ -389,6 +490,323 @@ class TextGradModelAdapter(ModelAdapter):
         return response.text
 
 
+class _FairLimiter:
+    """
+    Caps the number of in-flight requests, sharing slots fairly across tenants.
+
+    Callers that find no free slot queue up under their tenant id (e.g. an
+    optimizer trial). Each freed slot goes to the tenant at the head of a
+    round-robin rotation, so a tenant that floods the adapter with requests
+    cannot starve the others.
+    """
+
+    def __init__(self, max_concurrency: int):
+        """
+        Initialize the limiter.
+
+        Args:
+            max_concurrency: Maximum number of requests in flight at once
+        """
+        self.max_concurrency = max_concurrency
+        self._in_flight = 0
+        # tenant -> queue of waiting callers, in round-robin order
+        self._waiting: "OrderedDict[Any, deque]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def acquire(self, tenant: Any = None) -> None:
+        """Block until the caller holds a slot."""
+        ticket = threading.Event()
+        if not self._enqueue(tenant, ticket.set):
+            ticket.wait()
+
+    async def aacquire(self, tenant: Any = None) -> None:
+        """
+        Wait on the event loop until the caller holds a slot.
+
+        Unlike running acquire() in a worker thread, waiting coroutines don't
+        occupy the loop's executor, which the slot holders may need.
+        """
+        loop = asyncio.get_running_loop()
+        ticket = asyncio.Event()
+        wake = functools.partial(loop.call_soon_threadsafe, ticket.set)
+        if self._enqueue(tenant, wake):
+            return
+        try:
+            await ticket.wait()
+        except asyncio.CancelledError:
+            with self._lock:
+                queue = self._waiting.get(tenant)
+                granted = queue is None or wake not in queue
+                if not granted:
+                    queue.remove(wake)
+                    if not queue:
+                        del self._waiting[tenant]
+            if granted:
+                # The slot was handed over as the wait was cancelled
+                self.release()
+            raise
+
+    def _enqueue(self, tenant: Any, wake: Callable[[], Any]) -> bool:
+        """
+        Take a free slot, or queue wake to be called once one is handed over.
+
+        Returns:
+            True if the caller got a slot without waiting
+        """
+        with self._lock:
+            if self._in_flight < self.max_concurrency and not self._waiting:
+                self._in_flight += 1
+                return True
+            self._waiting.setdefault(tenant, deque()).append(wake)
+            return False
+
+    def release(self) -> None:
+        """Free a slot, handing it to the next waiting tenant if there is one."""
+        with self._lock:
+            if not self._waiting:
+                self._in_flight -= 1
+                return
+            tenant, queue = self._waiting.popitem(last=False)
+            wake = queue.popleft()
+            if queue:
+                # Served tenants rejoin at the back of the rotation
+                self._waiting[tenant] = queue
+        wake()
+
+
+class _RateLimiter:
+    """
+    Token-bucket admission control for provider request and token budgets.
+
+    Each bucket refills continuously at its per-minute rate and holds at most
+    one minute of budget. acquire() blocks until both buckets can cover a
+    request, so bursts are smoothed into the provider's limits up front
+    instead of turning into 429 responses and retry backoff.
+    """
+
+    def __init__(self, rpm: Optional[int] = None, tpm: Optional[int] = None):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rpm: Requests per minute budget (None for no request limit)
+            tpm: Tokens per minute budget (None for no token limit)
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = float(rpm or 0)
+        self._tokens = float(tpm or 0)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        if self.rpm:
+            self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+        if self.tpm:
+            self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+
+    def acquire(self, tokens: int) -> None:
+        """
+        Block until a request of the given size fits in the budgets.
+
+        Args:
+            tokens: Estimated prompt plus completion tokens of the request
+        """
+        while True:
+            wait = self._take(tokens)
+            if not wait:
+                return
+            time.sleep(wait)
+
+    async def aacquire(self, tokens: int) -> None:
+        """Async counterpart of acquire, sleeping on the event loop."""
+        while True:
+            wait = self._take(tokens)
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+
+    def _take(self, tokens: int) -> float:
+        """
+        Take budget for a request if both buckets can cover it.
+
+        Args:
+            tokens: Estimated prompt plus completion tokens of the request
+
+        Returns:
+            0.0 if the budget was taken, otherwise the seconds until it refills
+        """
+        if self.tpm:
+            # A request larger than the whole budget would otherwise never fit
+            tokens = min(tokens, self.tpm)
+        with self._lock:
+            self._refill()
+            wait = 0.0
+            if self.rpm and self._requests < 1:
+                wait = (1 - self._requests) * 60 / self.rpm
+            if self.tpm and self._tokens < tokens:
+                wait = max(wait, (tokens - self._tokens) * 60 / self.tpm)
+            if wait == 0.0:
+                if self.rpm:
+                    self._requests -= 1
+                if self.tpm:
+                    self._tokens -= tokens
+            return wait
+
+
+class _Counters:
+    """
+    Usage counters that are cheap to update from many threads.
+
+    Each thread increments its own dictionary without locking; the lock is only
+    taken when a thread first counts something and when totals are read.
+    """
+
+    _NAMES = ("requests", "cache_hits", "provider_calls", "latency_s", "total_tokens")
+
+    def __init__(self):
+        self._local = threading.local()
+        self._per_thread: List[Dict[str, float]] = []
+        self._lock = threading.Lock()
+
+    def add(self, **amounts: float) -> None:
+        """Add amounts to the named counters of the calling thread."""
+        counts = getattr(self._local, "counts", None)
+        if counts is None:
+            counts = self._local.counts = dict.fromkeys(self._NAMES, 0)
+            with self._lock:
+                self._per_thread.append(counts)
+        for name, amount in amounts.items():
+            counts[name] += amount
+
+    def totals(self) -> Dict[str, float]:
+        """Sum the counters of all threads."""
+        totals = dict.fromkeys(self._NAMES, 0)
+        with self._lock:
+            per_thread = list(self._per_thread)
+        for counts in per_thread:
+            for name, amount in counts.items():
+                totals[name] += amount
+        return totals
+
+
+def _install_http_pool(pool_size: int) -> None:
+    """
+    Route litellm's provider calls through shared keep-alive httpx clients.
+
+    Both the sync and async clients are installed process-wide, as litellm only
+    reads them from module globals. HTTP/2 is used when the h2 package is
+    installed so concurrent calls multiplex over a few connections. Sessions a
+    caller already configured on litellm are left untouched.
+
+    Args:
+        pool_size: Maximum number of connections per client
+    """
+    litellm = _litellm()
+    if litellm.client_session is not None and litellm.aclient_session is not None:
+        return
+
+    import httpx
+
+    try:
+        import h2  # noqa: F401
+
+        http2 = True
+    except ImportError:
+        http2 = False
+
+    options = {
+        "http2": http2,
+        "limits": httpx.Limits(
+            max_connections=pool_size, max_keepalive_connections=pool_size
+        ),
+        "timeout": httpx.Timeout(_HTTP_POOL_TIMEOUT),
+    }
+    if litellm.client_session is None:
+        litellm.client_session = httpx.Client(**options)
+    if litellm.aclient_session is None:
+        litellm.aclient_session = httpx.AsyncClient(**options)
+
+
+@functools.lru_cache(maxsize=16)
+def _encoding_for(model: Optional[str]) -> Any:
+    """
+    Load the tiktoken encoding used to count tokens for a model, once per model.
+
+    OpenAI models use their own encoding; other models are approximated with
+    cl100k_base, which is close enough for admission control.
+
+    Args:
+        model: LiteLLM model identifier
+
+    Returns:
+        The tiktoken encoding, or None when tiktoken or its encoding files are
+        unavailable (e.g. offline)
+    """
+    try:
+        import tiktoken
+
+        try:
+            return tiktoken.encoding_for_model((model or "").split("/")[-1])
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+# LRU cache of token counts keyed by (blake2b digest of the text, model), so
+# the same prompt is only encoded once without keeping the prompt itself alive
+_TOKEN_COUNT_CACHE_SIZE = 4096
+_token_counts: "OrderedDict[Tuple[bytes, Optional[str]], int]" = OrderedDict()
+_token_counts_lock = threading.Lock()
+
+
+def _count_tokens(text: str, model: Optional[str]) -> int:
+    """
+    Estimate the number of tokens in a text.
+
+    Falls back to four characters per token when no encoding is available.
+
+    Args:
+        text: Text to count
+        model: LiteLLM model identifier
+
+    Returns:
+        Estimated token count
+    """
+    key = (hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest(), model)
+    with _token_counts_lock:
+        count = _token_counts.get(key)
+        if count is not None:
+            _token_counts.move_to_end(key)
+            return count
+
+    encoding = _encoding_for(model)
+    if encoding is None:
+        count = len(text) // 4
+    else:
+        count = len(encoding.encode(text, disallowed_special=()))
+
+    with _token_counts_lock:
+        _token_counts[key] = count
+        while len(_token_counts) > _TOKEN_COUNT_CACHE_SIZE:
+            _token_counts.popitem(last=False)
+    return count
+
+
+def _estimate_request_tokens(litellm_kwargs: Dict[str, Any]) -> int:
+    """Estimate prompt tokens plus the completion budget of a LiteLLM request."""
+    text = "\n".join(
+        str(message.get("content") or "") for message in litellm_kwargs["messages"]
+    )
+    return _count_tokens(text, litellm_kwargs.get("model")) + (
+        litellm_kwargs.get("max_tokens") or 0
+    )
+
+
 class LiteLLMModelAdapter(ModelAdapter):
     """
     Lightweight adapter using LiteLLM for simple text generation.
@@ -407,6 +825,15 @@ class LiteLLMModelAdapter(ModelAdapter):
         temperature: float = 0.0,
         max_retries: int = 5,
         retry_delay: float = 1.0,
+        cache_size: int = 10_000,
+        semantic_cache: bool = False,
+        embedding_fn: Optional[Callable[[str], Any]] = None,
+        similarity_threshold: float = 0.95,
+        max_concurrency: Optional[int] = None,
+        rpm: Optional[int] = None,
+        tpm: Optional[int] = None,
+        connection_pool_size: Optional[int] = None,
+        stop: Optional[List[str]] = None,
         **kwargs,
     ):
         """
@@ -421,7 +848,33 @@ class LiteLLMModelAdapter(ModelAdapter):
             temperature: Sampling temperature
             max_retries: Maximum number of retries for rate limit errors (default: 5)
             retry_delay: Initial delay in seconds for exponential backoff (default: 1.0)
-            **kwargs: Additional arguments to pass to litellm.completion
+            cache_size: Maximum number of responses to keep in the in-memory cache of
+                       deterministic (temperature 0) requests (0 disables the cache)
+            semantic_cache: Whether to reuse the response of a near-duplicate earlier
+                           request, found by embedding similarity of the messages. Only
+                           deterministic (temperature 0) requests are cached.
+            embedding_fn: Function mapping a text to an embedding vector for the
+                         semantic cache (defaults to a sentence-transformers MiniLM model)
+            similarity_threshold: Minimum cosine similarity for a semantic cache hit
+            max_concurrency: Maximum number of provider calls in flight across all
+                            callers of this adapter. Waiting calls are served
+                            round-robin by tenant_id (default: no limit)
+            rpm: Provider requests-per-minute budget; calls wait for budget
+                instead of hitting rate limit errors (default: no limit)
+            tpm: Provider tokens-per-minute budget, counting estimated prompt
+                tokens plus max_tokens per call (default: no limit)
+            connection_pool_size: If set, provider calls share persistent
+                                 (HTTP/2 when h2 is installed) connections, at
+                                 most this many. The pool is process-wide and
+                                 is not installed over sessions already
+                                 configured on litellm (default: litellm's
+                                 own clients)
+            stop: Sequences at which the provider stops generating (not included
+                 in the response), e.g. the closing tag of a tagged answer
+            **kwargs: Additional arguments to pass to litellm.completion. Server
+                     specific options go in extra_body, e.g.
+                     extra_body={"guided_decoding_backend": "xgrammar"} for a
+                     vLLM endpoint; a per-call extra_body is merged into it
         """
         if not LITELLM_AVAILABLE:
             raise ImportError(
@@ -439,6 +892,200 @@ class LiteLLMModelAdapter(ModelAdapter):
         self.kwargs = kwargs
         self.logger = get_logger()
 
+        # litellm.completion arguments shared by every call, built once; calls
+        # only add their messages and overrides
+        self._base_kwargs = {
+            "model": model_name,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            # Filter out DSPy-specific parameters that LiteLLM doesn't understand
+            **{k: v for k, v in kwargs.items() if k not in ("cache", "model")},
+        }
+        if api_base:
+            self._base_kwargs["api_base"] = api_base
+        if stop:
+            self._base_kwargs["stop"] = list(stop)
+
+        # LRU cache of responses keyed by _request_key; optimization loops send
+        # the same deterministic requests for every candidate they re-evaluate
+        self.cache_size = cache_size
+        self._response_cache = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+
+        # Optional near-duplicate response cache, consulted after the exact cache
+        self._semantic_cache = (
+            SemanticCache(
+                embedding_fn or default_embedding_fn(),
+                similarity_threshold,
+                _SEMANTIC_CACHE_SIZE,
+            )
+            if semantic_cache
+            else None
+        )
+        self._metrics = _Counters()
+
+        self._limiter = (
+            _FairLimiter(max_concurrency) if max_concurrency is not None else None
+        )
+        self._rate_limiter = _RateLimiter(rpm, tpm) if rpm or tpm else None
+
+        if connection_pool_size:
+            _install_http_pool(connection_pool_size)
+
+    def _complete(self, litellm_kwargs: Dict[str, Any], tenant_id: Any = None) -> str:
+        """
+        Complete a request, reusing cached responses where possible.
+
+        Args:
+            litellm_kwargs: Arguments to pass to litellm.completion
+            tenant_id: Caller to account the request to for fair scheduling
+
+        Returns:
+            The generated text response
+        """
+        cached, pending = self._lookup_response(litellm_kwargs)
+        if cached is not None:
+            return cached
+        if self._limiter is None:
+            response = self._call_with_budget(litellm_kwargs)
+        else:
+            self._limiter.acquire(tenant_id)
+            try:
+                response = self._call_with_budget(litellm_kwargs)
+            finally:
+                self._limiter.release()
+        self._store_response(pending, response)
+        return response
+
+    async def _acomplete(
+        self, litellm_kwargs: Dict[str, Any], tenant_id: Any = None
+    ) -> str:
+        """
+        Async counterpart of _complete, built on litellm.acompletion.
+
+        Args:
+            litellm_kwargs: Arguments to pass to litellm.acompletion
+            tenant_id: Caller to account the request to for fair scheduling
+
+        Returns:
+            The generated text response
+        """
+        cached, pending = self._lookup_response(litellm_kwargs)
+        if cached is not None:
+            return cached
+        if self._limiter is None:
+            response = await self._acall_with_budget(litellm_kwargs)
+        else:
+            await self._limiter.aacquire(tenant_id)
+            try:
+                response = await self._acall_with_budget(litellm_kwargs)
+            finally:
+                self._limiter.release()
+        self._store_response(pending, response)
+        return response
+
+    def _call_with_budget(self, litellm_kwargs: Dict[str, Any]) -> str:
+        """Wait for rate limit budget, then call the provider with retries."""
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire(_estimate_request_tokens(litellm_kwargs))
+        return self._call_with_retry(litellm_kwargs)
+
+    async def _acall_with_budget(self, litellm_kwargs: Dict[str, Any]) -> str:
+        """Async counterpart of _call_with_budget."""
+        if self._rate_limiter is not None:
+            await self._rate_limiter.aacquire(_estimate_request_tokens(litellm_kwargs))
+        return await self._acall_with_retry(litellm_kwargs)
+
+    def _lookup_response(
+        self, litellm_kwargs: Dict[str, Any]
+    ) -> Tuple[Optional[str], Optional[Tuple[Any, Any]]]:
+        """
+        Look a request up in the response caches.
+
+        Only deterministic (temperature 0) requests are cached, so sampled
+        requests keep their variance.
+
+        Args:
+            litellm_kwargs: Arguments to pass to litellm.completion
+
+        Returns:
+            (cached, pending): the cached response or None, and on a miss the
+            cache entries to fill in with _store_response
+        """
+        self._metrics.add(requests=1)
+        if litellm_kwargs["temperature"] != 0:
+            return None, None
+
+        # Reuse the response to an identical earlier request
+        cache_key = _request_key(litellm_kwargs) if self.cache_size > 0 else None
+        if cache_key is not None:
+            with self._response_cache_lock:
+                cached = self._response_cache.get(cache_key)
+                if cached is not None:
+                    self._response_cache.move_to_end(cache_key)
+            if cached is not None:
+                self._count_cache_hit()
+                return cached, None
+
+        # Reuse the response to a near-duplicate earlier request
+        semantic_entry = None
+        if self._semantic_cache is not None:
+            namespace, text = _split_request(litellm_kwargs)
+            vector = self._semantic_cache.embed(text)
+            if vector is not None:
+                cached = self._semantic_cache.lookup(namespace, vector)
+                if cached is not None:
+                    self._count_cache_hit()
+                    return cached, None
+                semantic_entry = (namespace, vector)
+
+        return None, (cache_key, semantic_entry)
+
+    def _store_response(
+        self, pending: Optional[Tuple[Any, Any]], response: Optional[str]
+    ) -> None:
+        """Fill in the cache entries returned by _lookup_response."""
+        if pending is None or response is None:
+            return
+        cache_key, semantic_entry = pending
+        if cache_key is not None:
+            with self._response_cache_lock:
+                self._response_cache[cache_key] = response
+                self._response_cache.move_to_end(cache_key)
+                while len(self._response_cache) > self.cache_size:
+                    self._response_cache.popitem(last=False)
+        if semantic_entry is not None:
+            self._semantic_cache.add(*semantic_entry, response)
+
+    def _count_cache_hit(self) -> None:
+        self._metrics.add(cache_hits=1)
+
+    def _record_call(self, start: float, response: Any = None) -> None:
+        """Account a completed provider call that started at perf_counter start."""
+        usage = getattr(response, "usage", None)
+        tokens = getattr(usage, "total_tokens", None)
+        self._metrics.add(
+            provider_calls=1,
+            latency_s=time.perf_counter() - start,
+            total_tokens=tokens if isinstance(tokens, int) else 0,
+        )
+
+    @property
+    def cache_hits(self) -> int:
+        """Number of requests answered from the response caches."""
+        return self._metrics.totals()["cache_hits"]
+
+    def metrics(self) -> Dict[str, float]:
+        """
+        Usage totals of this adapter across all threads.
+
+        Returns:
+            Dictionary with the number of requests, of cache_hits among them, of
+            provider_calls made, their total latency_s, and the total_tokens
+            reported by the provider
+        """
+        return self._metrics.totals()
+
     def _call_with_retry(self, litellm_kwargs: Dict[str, Any]) -> str:
         """
         Call LiteLLM completion with retry logic for rate limit errors.
@@ -452,44 +1099,141 @@ class LiteLLMModelAdapter(ModelAdapter):
         Raises:
             Exception: If all retries are exhausted or a non-retryable error occurs
         """
-        last_exception = None
-
+        litellm = _litellm()
         for attempt in range(self.max_retries + 1):
             try:
+                start = time.perf_counter()
                 response = litellm.completion(**litellm_kwargs)
+                self._record_call(start, response)
                 return response.choices[0].message.content
 
-            except litellm.exceptions.RateLimitError as e:
-                last_exception = e
-
-                if attempt < self.max_retries:
-                    # Exponential backoff: 1s, 2s, 4s, 8s, 16s...
-                    delay = self.retry_delay * (2**attempt)
-                    self.logger.warning(
-                        f"Rate limit hit (attempt {attempt + 1}/{self.max_retries + 1}). "
-                        f"Retrying in {delay:.1f}s..."
-                    )
-                    time.sleep(delay)
-                else:
-                    self.logger.error(
-                        f"Rate limit error: All {self.max_retries + 1} attempts exhausted."
-                    )
+            except litellm.exceptions.RateLimitError:
+                delay = self._rate_limit_backoff(attempt)
+                if delay is None:
                     raise
+                time.sleep(delay)
 
             except Exception as e:
                 # For non-rate-limit errors, fail immediately
-                self.logger.error(f"API call failed: {str(e)}")
+                self.logger.progress(f"API call failed: {str(e)}", level="ERROR")
+                raise
+
+    async def _acall_with_retry(self, litellm_kwargs: Dict[str, Any]) -> str:
+        """
+        Async counterpart of _call_with_retry, built on litellm.acompletion.
+
+        Args:
+            litellm_kwargs: Arguments to pass to litellm.acompletion
+
+        Returns:
+            The generated text response
+
+        Raises:
+            Exception: If all retries are exhausted or a non-retryable error occurs
+        """
+        litellm = _litellm()
+        for attempt in range(self.max_retries + 1):
+            try:
+                start = time.perf_counter()
+                response = await litellm.acompletion(**litellm_kwargs)
+                self._record_call(start, response)
+                return response.choices[0].message.content
+
+            except litellm.exceptions.RateLimitError:
+                delay = self._rate_limit_backoff(attempt)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+
+            except Exception as e:
+                # For non-rate-limit errors, fail immediately
+                self.logger.progress(f"API call failed: {str(e)}", level="ERROR")
+                raise
+
+    def _stream_with_retry(
+        self,
+        litellm_kwargs: Dict[str, Any],
+        stop_detector: Optional[Callable[[str], bool]],
+    ) -> Tuple[str, bool]:
+        """
+        Stream a completion, retrying rate limit errors when opening the stream.
+
+        Args:
+            litellm_kwargs: Arguments to pass to litellm.completion
+            stop_detector: Called with the text received so far after each chunk;
+                          returning True stops reading the stream
+
+        Returns:
+            (text, complete): the text received, and whether the stream ran to
+            its end rather than being stopped by stop_detector
+
+        Raises:
+            Exception: If all retries are exhausted or a non-retryable error occurs
+        """
+        litellm = _litellm()
+        start = time.perf_counter()
+        for attempt in range(self.max_retries + 1):
+            try:
+                stream = litellm.completion(**litellm_kwargs, stream=True)
+                break
+
+            except litellm.exceptions.RateLimitError:
+                delay = self._rate_limit_backoff(attempt)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+
+            except Exception as e:
+                self.logger.progress(f"API call failed: {str(e)}", level="ERROR")
                 raise
 
-        # Should never reach here, but just in case
-        raise (
-            last_exception
-            if last_exception
-            else Exception("Unknown error in retry logic")
+        text = ""
+        try:
+            for chunk in stream:
+                content = chunk.choices[0].delta.content if chunk.choices else None
+                if not content:
+                    continue
+                text += content
+                if stop_detector is not None and stop_detector(text):
+                    return text, False
+        finally:
+            _close_stream(stream)
+            self._record_call(start)
+        return text, True
+
+    def _rate_limit_backoff(self, attempt: int) -> Optional[float]:
+        """
+        Delay before retrying a rate-limited call.
+
+        Args:
+            attempt: Zero-based index of the attempt that hit the rate limit
+
+        Returns:
+            The delay in seconds, or None once all retries are exhausted
+        """
+        if attempt < self.max_retries:
+            # Exponential backoff: 1s, 2s, 4s, 8s, 16s...
+            delay = self.retry_delay * (2**attempt)
+            self.logger.progress(
+                f"Rate limit hit (attempt {attempt + 1}/{self.max_retries + 1}). "
+                f"Retrying in {delay:.1f}s...",
+                level="WARNING",
+            )
+            return delay
+
+        self.logger.progress(
+            f"Rate limit error: All {self.max_retries + 1} attempts exhausted.",
+            level="ERROR",
         )
+        return None
 
     def generate(
-        self, prompt: str, temperature: float = None, max_tokens: int = None, **kwargs
+        self,
+        prompt: str,
+        temperature: float = None,
+        max_tokens: int = None,
+        tenant_id: Any = None,
+        **kwargs,
     ) -> str:
         """
         Generate text from a prompt using LiteLLM.
@@ -498,47 +1242,98 @@ class LiteLLMModelAdapter(ModelAdapter):
             prompt: The input prompt text
             temperature: Override the default temperature
             max_tokens: Override the default max tokens
+            tenant_id: Caller (e.g. optimizer trial) to schedule the request under
+                      when max_concurrency is set
             **kwargs: Additional generation parameters
 
         Returns:
             The generated text response
         """
-        # Use override values or defaults
-        temp = temperature if temperature is not None else self.temperature
-        tokens = max_tokens if max_tokens is not None else self.max_tokens
+        messages = [{"role": "user", "content": prompt}]
+        litellm_kwargs = self._request_kwargs(messages, temperature, max_tokens, kwargs)
 
-        # Prepare LiteLLM call
+        # Use retry logic for rate limit handling
+        return self._complete(litellm_kwargs, tenant_id)
+
+    async def agenerate(
+        self,
+        prompt: str,
+        temperature: float = None,
+        max_tokens: int = None,
+        tenant_id: Any = None,
+        **kwargs,
+    ) -> str:
+        """
+        Generate text from a prompt using LiteLLM, without blocking the event loop.
+
+        Args:
+            prompt: The input prompt text
+            temperature: Override the default temperature
+            max_tokens: Override the default max tokens
+            tenant_id: Caller to schedule the request under (see generate)
+            **kwargs: Additional generation parameters
+
+        Returns:
+            The generated text response
+        """
         messages = [{"role": "user", "content": prompt}]
+        litellm_kwargs = self._request_kwargs(messages, temperature, max_tokens, kwargs)
+        return await self._acomplete(litellm_kwargs, tenant_id)
 
-        # Filter out DSPy-specific parameters that LiteLLM doesn't understand
-        filtered_kwargs = {
-            k: v
-            for k, v in self.kwargs.items()
-            if k not in ["cache", "model"]  # Remove DSPy-specific params
-        }
+    def generate_streaming(
+        self,
+        prompt: str,
+        stop_detector: Optional[Callable[[str], bool]] = None,
+        temperature: float = None,
+        max_tokens: int = None,
+        tenant_id: Any = None,
+        **kwargs,
+    ) -> str:
+        """
+        Generate text from a prompt, streaming the response as it is decoded.
 
-        # Prepare kwargs for litellm
-        litellm_kwargs = {
-            "model": self.model_name,
-            "messages": messages,
-            "temperature": temp,
-            "max_tokens": tokens,
-            **filtered_kwargs,
-            **kwargs,
-        }
+        With a stop_detector, the stream is closed as soon as the output is
+        sufficient (e.g. once an "Answer:" line is complete), so the provider
+        stops decoding tokens the caller does not need. Truncated responses
+        are not cached.
 
-        # Add API base if specified
-        if self.api_base:
-            litellm_kwargs["api_base"] = self.api_base
+        Args:
+            prompt: The input prompt text
+            stop_detector: Called with the text received so far after each chunk;
+                          returning True returns that text immediately
+            temperature: Override the default temperature
+            max_tokens: Override the default max tokens
+            tenant_id: Caller to schedule the request under (see generate)
+            **kwargs: Additional generation parameters
 
-        # Use retry logic for rate limit handling
-        return self._call_with_retry(litellm_kwargs)
+        Returns:
+            The generated text, up to where stop_detector stopped it
+        """
+        messages = [{"role": "user", "content": prompt}]
+        litellm_kwargs = self._request_kwargs(messages, temperature, max_tokens, kwargs)
+
+        cached, pending = self._lookup_response(litellm_kwargs)
+        if cached is not None:
+            return cached
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire(_estimate_request_tokens(litellm_kwargs))
+        if self._limiter is not None:
+            self._limiter.acquire(tenant_id)
+        try:
+            text, complete = self._stream_with_retry(litellm_kwargs, stop_detector)
+        finally:
+            if self._limiter is not None:
+                self._limiter.release()
+        if complete:
+            self._store_response(pending, text)
+        return text
 
     def generate_with_chat_format(
         self,
         messages: List[Dict[str, str]],
         temperature: float = None,
         max_tokens: int = None,
+        tenant_id: Any = None,
         **kwargs,
     ) -> str:
         """
@@ -548,38 +1343,170 @@ class LiteLLMModelAdapter(ModelAdapter):
             messages: List of message dictionaries with 'role' and 'content' keys
             temperature: Override the default temperature
             max_tokens: Override the default max tokens
+            tenant_id: Caller to schedule the request under (see generate)
             **kwargs: Additional generation parameters
 
         Returns:
             The generated text response
         """
-        # Use override values or defaults
-        temp = temperature if temperature is not None else self.temperature
-        tokens = max_tokens if max_tokens is not None else self.max_tokens
+        litellm_kwargs = self._request_kwargs(messages, temperature, max_tokens, kwargs)
 
-        # Filter out DSPy-specific parameters that LiteLLM doesn't understand
-        filtered_kwargs = {
-            k: v
-            for k, v in self.kwargs.items()
-            if k not in ["cache", "model"]  # Remove DSPy-specific params
-        }
+        # Use retry logic for rate limit handling
+        return self._complete(litellm_kwargs, tenant_id)
 
-        # Prepare kwargs for litellm
-        litellm_kwargs = {
-            "model": self.model_name,
-            "messages": messages,
-            "temperature": temp,
-            "max_tokens": tokens,
-            **filtered_kwargs,
-            **kwargs,
-        }
+    def _generate_batch(
+        self, prompts: List[str], max_threads: int = 1, **kwargs
+    ) -> List[str]:
+        """
+        Generate responses for distinct prompts, optionally concurrently.
 
-        # Add API base if specified
-        if self.api_base:
-            litellm_kwargs["api_base"] = self.api_base
+        Concurrent batches run on a single event loop with litellm.acompletion,
+        keeping at most max_threads requests in flight, instead of one blocking
+        thread per request. When called from inside a running event loop (e.g.
+        a notebook), the thread pool of the base class is used instead.
 
-        # Use retry logic for rate limit handling
-        return self._call_with_retry(litellm_kwargs)
+        Args:
+            prompts: List of input prompts
+            max_threads: Maximum number of concurrent requests
+            **kwargs: Generation parameters (temperature, max_tokens, etc.)
+
+        Returns:
+            List of generated responses in same order as input prompts
+        """
+        if max_threads <= 1 or len(prompts) <= 1:
+            return super()._generate_batch(prompts, max_threads, **kwargs)
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self._agenerate_batch(prompts, max_threads, **kwargs))
+        return super()._generate_batch(prompts, max_threads, **kwargs)
+
+    async def _agenerate_batch(
+        self, prompts: List[str], max_concurrency: int, **kwargs
+    ) -> List[str]:
+        """Run agenerate over prompts with bounded concurrency, keeping order."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def generate_one(prompt: str) -> str:
+            async with semaphore:
+                return await self.agenerate(prompt, **kwargs)
+
+        return list(await asyncio.gather(*(generate_one(p) for p in prompts)))
+
+    def _request_kwargs(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Build the litellm.completion arguments for a request.
+
+        Args:
+            messages: Chat messages to send
+            temperature: Override the default temperature
+            max_tokens: Override the default max tokens
+            kwargs: Additional per-call generation parameters
+
+        Returns:
+            Arguments for litellm.completion / litellm.acompletion
+        """
+        litellm_kwargs = {**self._base_kwargs, "messages": messages}
+        if temperature is None and max_tokens is None and not kwargs:
+            # Common case: the configured arguments as they are
+            return litellm_kwargs
+
+        # Apply per-call overrides
+        if temperature is not None:
+            litellm_kwargs["temperature"] = temperature
+        if max_tokens is not None:
+            litellm_kwargs["max_tokens"] = max_tokens
+        if kwargs:
+            litellm_kwargs.update(kwargs)
+            # Per-call server options extend the configured ones
+            if "extra_body" in kwargs and "extra_body" in self._base_kwargs:
+                litellm_kwargs["extra_body"] = {
+                    **self._base_kwargs["extra_body"],
+                    **kwargs["extra_body"],
+                }
+            # The configured API base always wins over per-call arguments
+            if self.api_base:
+                litellm_kwargs["api_base"] = self.api_base
+
+        return litellm_kwargs
+
+
+def _close_stream(stream: Any) -> None:
+    """Close a litellm stream, releasing its provider connection."""
+    # litellm's stream wrapper only closes asynchronously; close the provider
+    # stream it wraps instead
+    for target in (stream, getattr(stream, "completion_stream", None)):
+        close = getattr(target, "close", None)
+        if callable(close):
+            close()
+            return
+
+
+def _request_key(litellm_kwargs: Dict[str, Any]) -> str:
+    """
+    Hash a LiteLLM request into an exact-match cache key.
+
+    Args:
+        litellm_kwargs: Arguments to pass to litellm.completion
+
+    Returns:
+        Hex digest of the canonical JSON encoding of the request
+    """
+    canonical = json.dumps(litellm_kwargs, sort_keys=True, default=str)
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _split_request(litellm_kwargs: Dict[str, Any]) -> Tuple[str, str]:
+    """
+    Split a LiteLLM request into its configuration and its message text.
+
+    Args:
+        litellm_kwargs: Arguments to pass to litellm.completion
+
+    Returns:
+        (namespace, text): a canonical string of every parameter besides the
+        messages, and the messages rendered as "role: content" blocks
+    """
+    params = {k: v for k, v in litellm_kwargs.items() if k != "messages"}
+    namespace = json.dumps(params, sort_keys=True, default=str)
+    text = "\n\n".join(
+        f"{message.get('role', 'user')}: {message.get('content', '')}"
+        for message in litellm_kwargs["messages"]
+    )
+    return namespace, text
+
+
+def _stop_sequences(output_format: str, output_tag: Optional[str]) -> List[str]:
+    """
+    Stop sequences that end generation once a structured answer is complete.
+
+    Args:
+        output_format: "json" for an answer in a fenced JSON block, or "xml_tag"
+                      for an answer wrapped in <output_tag>...</output_tag>
+        output_tag: Name of the answer tag, required for "xml_tag"
+
+    Returns:
+        Stop sequences for the request
+
+    Raises:
+        ValueError: If the format is unknown or the tag is missing
+    """
+    if output_format == "json":
+        # Stop at the fence closing the block rather than at the closing brace,
+        # which would be cut from the response and leave it unparseable
+        return ["\n```"]
+    if output_format == "xml_tag":
+        if not output_tag:
+            raise ValueError('output_format="xml_tag" requires an output_tag')
+        return [f"</{output_tag}>"]
+    raise ValueError(f"Unsupported output format: {output_format}")
 
 
 def setup_model(model_name=None, adapter_type="dspy", **kwargs):
@@ -592,7 +1519,10 @@ def setup_model(model_name=None, adapter_type="dspy", **kwargs):
     Args:
         model_name: The model identifier (e.g., "openai/gpt-4o-mini", "anthropic/claude-3-opus-20240229")
         adapter_type: The adapter type to use ("dspy", "textgrad", or "litellm")
-        **kwargs: Additional adapter-specific configuration options
+        **kwargs: Additional adapter-specific configuration options. With the
+                 LiteLLM adapter, output_format ("json" or "xml_tag", with
+                 output_tag naming the tag) sets default stop sequences so
+                 generation ends once the answer is complete
 
     Returns:
         A ModelAdapter instance that provides a unified interface to the underlying model
@@ -624,6 +1554,13 @@ def setup_model(model_name=None, adapter_type="dspy", **kwargs):
         ]
         response = adapter.generate_with_chat_format(messages)
     """
+    output_format = kwargs.pop("output_format", None)
+    output_tag = kwargs.pop("output_tag", None)
+    if output_format is not None:
+        if adapter_type.lower() != "litellm":
+            raise ValueError("output_format is only supported by the litellm adapter")
+        kwargs.setdefault("stop", _stop_sequences(output_format, output_tag))
+
     # Create adapter based on type
     logger = get_logger()
     if adapter_type.lower() == "dspy":
@@ -96,6 +96,7 @@ class PDOEngine:
         # Task type configuration
         task_type: str = "close_ended",
         judge_requirement: Optional[str] = None,
+        seed: Optional[int] = None,
     ):
         """
         Initialize PDO optimization engine.
@@ -118,6 +119,7 @@ class PDOEngine:
             max_concurrent_threads: Max threads for parallel execution
             task_json_output_schema: JSON schema for task outputs
             task_json_default_values: Default values for task outputs
+            seed: Seed for duel pair sampling (default: fresh OS entropy)
         """
         self.task_model = task_model
         self.judge_model = judge_model
@@ -151,6 +153,10 @@ class PDOEngine:
         # Derived context
         self.dataset_summary: Optional[str] = None
 
+        # One generator for all duel sampling, rather than reading OS entropy
+        # for a new one every round; seeding it makes duel selection reproducible
+        self.rng = np.random.default_rng(seed)
+
         # State variables
         self.instruction_pool: List[str] = []
         self.allowed_prompt_indices: List[int] = []
@@ -327,7 +333,8 @@ class PDOEngine:
         ts_cons = signals["ts_cons"]
 
         duel_pairs = []
-        rng = np.random.default_rng()
+        # The win matrix only changes once the round's duels are judged
+        duel_counts = self.win_matrix + self.win_matrix.T
 
         # Sample duel pairs using Thompson sampling
         for _ in range(self.num_duels_per_round):
@@ -342,7 +349,8 @@ class PDOEngine:
                 ts_cons=ts_cons,
                 tau=tau,
                 dirichlet_weights=dirichlet_weights,
-                rng=rng,
+                rng=self.rng,
+                N=duel_counts,
             )
             duel_pairs.append((i, j))
 
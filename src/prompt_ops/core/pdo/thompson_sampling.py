@@ -11,7 +11,7 @@ and multi-ranker fusion for prompt duel optimization.
 """
 
 import math
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
@@ -26,8 +26,68 @@ def _normalize(x: np.ndarray) -> np.ndarray:
     return (x - mn) / (mx - mn)
 
 
-def beta_var(a: float, b: float) -> float:
-    """Variance of Beta(a, b)."""
+def _confidence_bounds(
+    W: np.ndarray, N: np.ndarray, alpha: float, log_term
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pairwise upper/lower confidence bounds on win probabilities.
+
+    Bounds are computed for the upper triangle and mirrored so that
+    upper[j, i] = 1 - lower[i, j]; pairs that never met get the trivial
+    bounds [0, 1] and the diagonal is 0.5.
+
+    Args:
+        W: (K, K) wins matrix, W[i, j] = wins of i over j
+        N: (K, K) duel counts, W + W.T
+        alpha: Exploration coefficient
+        log_term: Scalar or (K, K) log term of the confidence radius
+
+    Returns:
+        (upper, lower): (K, K) bound matrices
+    """
+    met = N > 0
+    N_safe = np.where(met, N, 1)
+    p = W / N_safe
+    delta = np.sqrt(alpha * log_term / N_safe)
+    upper_tri = np.triu(np.where(met, np.minimum(p + delta, 1.0), 1.0), 1)
+    lower_tri = np.triu(np.where(met, np.maximum(p - delta, 0.0), 0.0), 1)
+
+    diagonal = np.diag(np.full(W.shape[0], 0.5))
+    upper = upper_tri + np.tril(1.0 - lower_tri.T, -1) + diagonal
+    lower = lower_tri + np.tril(1.0 - upper_tri.T, -1) + diagonal
+    return upper, lower
+
+
+def _sample_win_probabilities(W: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """
+    Thompson-sample pairwise win probabilities from their Beta posteriors.
+
+    All pairs are drawn with a single vectorized call; theta[i, j] for i < j
+    is Beta(W[i, j] + 1, W[j, i] + 1) and theta[j, i] = 1 - theta[i, j].
+
+    Args:
+        W: (K, K) wins matrix
+        rng: Random generator
+
+    Returns:
+        (K, K) sampled probability matrix with a zero diagonal
+    """
+    A = W + 1.0
+    sampled = np.triu(rng.beta(A, A.T), 1)
+    return sampled + np.tril(1.0 - sampled.T, -1)
+
+
+def _break_tie(candidates: np.ndarray, rng: np.random.Generator) -> int:
+    """Pick uniformly among tied candidates, without a draw for a unique one."""
+    if candidates.size == 1:
+        return int(candidates[0])
+    return int(rng.choice(candidates))
+
+
+def beta_var(
+    a: Union[float, np.ndarray], b: Union[float, np.ndarray]
+) -> Union[float, np.ndarray]:
+    """Variance of Beta(a, b), elementwise for arrays."""
     s = a + b
     return (a * b) / (s * s * (s + 1.0))
 
@@ -39,6 +99,7 @@ def fused_selection_score(
     ts_cons: np.ndarray,
     dirichlet: bool = True,
     seed: Optional[int] = None,
+    rng: Optional[np.random.Generator] = None,
 ) -> Tuple[np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
     """
     Build a *higher-is-better* fused score from:
@@ -48,46 +109,42 @@ def fused_selection_score(
       - Elo μ
       - TrueSkill μ, conservative
 
+    Dirichlet weights are drawn from rng, or from a new generator seeded with
+    seed if rng is None.
+
     Returns:
         fused_scores: (K,) fused score
         weights:      (F,) weights used to aggregate (sampled via Dirichlet if enabled)
         features:     dict of individual feature vectors for debugging
     """
-    rng = np.random.default_rng(seed)
-    K = theta.shape[0]
-
     # Scores from the *sampled* probability matrix theta
     copeland = np.sum(theta > 0.5, axis=1)
     borda = theta.sum(axis=1)
     winrate = theta.mean(axis=1)
 
     # Normalize all to [0,1], higher is better
-    feats = [
-        _normalize(copeland),
-        _normalize(borda),
-        _normalize(winrate),
-        _normalize(elo_mu),
-        _normalize(ts_mu),
-        _normalize(ts_cons),
-    ]
-    features = {
-        "copeland": feats[0],
-        "borda": feats[1],
-        "winrate": feats[2],
-        "elo_mu": feats[3],
-        "ts_mu": feats[4],
-        "ts_cons": feats[5],
-    }
-
-    F = len(feats)
-    M = np.vstack(feats)  # (F, K)
+    names = ("copeland", "borda", "winrate", "elo_mu", "ts_mu", "ts_cons")
+    M = np.vstack(
+        [
+            _normalize(copeland),
+            _normalize(borda),
+            _normalize(winrate),
+            _normalize(elo_mu),
+            _normalize(ts_mu),
+            _normalize(ts_cons),
+        ]
+    )  # (F, K)
+    features = dict(zip(names, M))
+    F = len(names)
 
     if dirichlet:
+        if rng is None:
+            rng = np.random.default_rng(seed)
         w = rng.dirichlet(np.ones(F))
     else:
         w = np.ones(F) / F
 
-    fused = (w[:, None] * M).sum(axis=0)  # (K,)
+    fused = w @ M  # (K,)
     return fused, w, features
 
 
@@ -130,56 +187,36 @@ def sample_duel_pair(
         return first, second
 
     # 1) Bounds and Copeland candidate set C
-    upper = np.full((K, K), 0.5)
-    lower = np.full((K, K), 0.5)
-    log_term = math.log(max(t, 2))
-
-    for i in range(K):
-        for j in range(i + 1, K):
-            if N[i, j] > 0:
-                p_ij = W[i, j] / N[i, j]
-                delta = math.sqrt(alpha * log_term / N[i, j])
-                upper[i, j] = min(p_ij + delta, 1.0)
-                lower[i, j] = max(p_ij - delta, 0.0)
-            else:
-                upper[i, j] = 1.0
-                lower[i, j] = 0.0
-            upper[j, i] = 1.0 - lower[i, j]
-            lower[j, i] = 1.0 - upper[i, j]
+    upper, lower = _confidence_bounds(W, N, alpha, math.log(max(t, 2)))
+
+    allowed = np.asarray(allowed_indices)
+    allowed_mask = np.zeros(K, dtype=bool)
+    allowed_mask[allowed] = True
 
     zeta_upper = np.sum(upper > 0.5, axis=1)
-    C = np.flatnonzero(zeta_upper == zeta_upper.max())
     # Restrict to allowed indices
-    C = [i for i in C if i in allowed_indices]
-    if not C:
-        C = allowed_indices
+    C = np.flatnonzero((zeta_upper == zeta_upper.max()) & allowed_mask)
+    if C.size == 0:
+        C = allowed
 
     # 2) Thompson-sampled Copeland to choose first
-    theta1 = np.zeros((K, K))
-    for i in range(K):
-        for j in range(i + 1, K):
-            th = rng.beta(W[i, j] + 1, W[j, i] + 1)
-            theta1[i, j] = th
-            theta1[j, i] = 1.0 - th
-
-    copeland_scores = np.sum(theta1 > 0.5, axis=1)
-    max_score = copeland_scores[C].max()
-    first_candidates = [i for i in C if copeland_scores[i] == max_score]
-    first = int(rng.choice(first_candidates))
+    theta1 = _sample_win_probabilities(W, rng)
+    copeland_C = np.sum(theta1 > 0.5, axis=1)[C]
+    first_candidates = C[copeland_C == copeland_C.max()]
+    first = _break_tie(first_candidates, rng)
 
     # 3) Thompson draw conditioned on the first to pick second
-    theta2 = np.full(K, 0.5)
-    for k in range(K):
-        if k != first:
-            theta2[k] = rng.beta(W[k, first] + 1, W[first, k] + 1)
+    theta2 = rng.beta(W[:, first] + 1, W[first, :] + 1)
+    theta2[first] = 0.5
 
-    cand = [k for k in allowed_indices if k != first and lower[k, first] <= 0.5]
-    if not cand:
-        cand = [k for k in allowed_indices if k != first]
+    others = allowed[allowed != first]
+    cand = others[lower[others, first] <= 0.5]
+    if cand.size == 0:
+        cand = others
 
-    best_val = max(theta2[k] for k in cand)
-    second_choices = [k for k in cand if abs(theta2[k] - best_val) < 1e-12]
-    second = int(rng.choice(second_choices))
+    theta2_cand = theta2[cand]
+    second_choices = cand[np.abs(theta2_cand - theta2_cand.max()) < 1e-12]
+    second = _break_tie(second_choices, rng)
 
     return first, second
 
@@ -196,11 +233,16 @@ def sample_duel_pair_fused(
     tau: float = 0.2,  # softmax temperature for exploration across rankers
     dirichlet_weights: bool = True,
     rng: Optional[np.random.Generator] = None,
+    N: Optional[np.ndarray] = None,
+    match_counts: Optional[np.ndarray] = None,
 ) -> Tuple[int, int]:
     """
     Fused sampler (previous default):
       - First arm: Dirichlet-weighted fusion of Copeland/Borda/Winrate/Elo/TrueSkill
       - Second arm: uncertainty (Beta variance) against the first
+
+    N (W + W.T) and match_counts (W.sum(axis=1)) can be passed precomputed by
+    callers drawing several pairs from the same W.
     """
 
     if rng is None:
@@ -209,7 +251,8 @@ def sample_duel_pair_fused(
     if allowed_indices is None:
         allowed_indices = list(range(K))
 
-    N = W + W.T
+    if N is None:
+        N = W + W.T
     if N.sum() == 0:  # no duels yet
         first, second = rng.choice(allowed_indices, size=2, replace=False)
         return first, second
@@ -222,32 +265,11 @@ def sample_duel_pair_fused(
         ts_cons = np.zeros(K)
 
     # ---------- Step 1: compute CI bounds ----------
-    upper = np.full((K, K), 0.5)
-    lower = np.full((K, K), 0.5)
-
-    for i in range(K):
-        for j in range(i + 1, K):
-            if N[i, j] > 0:
-                p_ij = W[i, j] / N[i, j]
-                pair_t = max(N[i, j], 2)
-                delta = math.sqrt(alpha * math.log(pair_t) / N[i, j])
-                upper[i, j] = min(p_ij + delta, 1.0)
-                lower[i, j] = max(p_ij - delta, 0.0)
-            else:
-                upper[i, j] = 1.0
-                lower[i, j] = 0.0
-            upper[j, i] = 1.0 - lower[i, j]
-            lower[j, i] = 1.0 - upper[i, j]
+    # Each pair's confidence radius uses its own duel count as the horizon
+    upper, lower = _confidence_bounds(W, N, alpha, np.log(np.maximum(N, 2)))
 
     # ---------- Step 2: Thompson-sample θ matrix ----------
-    theta = np.zeros((K, K))
-    for i in range(K):
-        for j in range(i + 1, K):
-            a = W[i, j] + 1
-            b = W[j, i] + 1
-            th = rng.beta(a, b)
-            theta[i, j] = th
-            theta[j, i] = 1.0 - th
+    theta = _sample_win_probabilities(W, rng)
 
     # ---------- Step 3: fuse rankers & sample FIRST arm via softmax ----------
     fused, weights, feature_dict = fused_selection_score(
@@ -256,26 +278,31 @@ def sample_duel_pair_fused(
         ts_mu=ts_mu,
         ts_cons=ts_cons,
         dirichlet=dirichlet_weights,
-        seed=None,
+        rng=rng,
     )
 
-    scores = fused[allowed_indices] + rng.normal(0, 1e-6, size=len(allowed_indices))
+    # Tiny per-arm noise breaking ties in both arm choices, drawn once
+    jitter = rng.normal(0, 1e-6, size=K)
+
+    allowed = np.asarray(allowed_indices)
+    scores = fused[allowed] + jitter[allowed]
     scores_stable = scores / max(tau, 1e-8)
     scores_stable -= scores_stable.max()
     probs = np.exp(scores_stable)
     probs /= probs.sum()
-    first = rng.choice(allowed_indices, p=probs)
+    first = rng.choice(allowed, p=probs)
 
     # Step 4: Choose SECOND arm by uncertainty vs first
-    cand = [k for k in allowed_indices if k != first and lower[k, first] <= 0.5]
-    if not cand:
-        cand = [k for k in allowed_indices if k != first]
-
-    if cand:
-        rng.shuffle(cand)
-        variances = np.array([beta_var(W[k, first] + 1, W[first, k] + 1) for k in cand])
-        variances += rng.normal(0, 1e-6, size=len(variances))
-        match_counts = W.sum(axis=1)
+    others = allowed[allowed != first]
+    cand = others[lower[others, first] <= 0.5]
+    if cand.size == 0:
+        cand = others
+
+    if cand.size:
+        variances = beta_var(W[cand, first] + 1, W[first, cand] + 1)
+        variances += jitter[cand]
+        if match_counts is None:
+            match_counts = W.sum(axis=1)
         decay = 1 / (1 + match_counts[cand])
         weighted = variances * decay
         probs = weighted / weighted.sum()
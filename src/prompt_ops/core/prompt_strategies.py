@@ -10,6 +10,7 @@ This module contains the base strategy class and various specialized
 optimization strategies for migrating prompts to Llama models.
 """
 
+import functools
 import json
 import logging
 import os
@@ -33,6 +34,40 @@ class OptimizationError(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=64)
+def _build_signature(inputs: tuple, outputs: tuple, instructions: str):
+    """
+    Build a DSPy signature class with explicit field definitions.
+
+    Signature classes are immutable once created, so identical field lists and
+    instructions share one class instead of re-running the metaclass each time.
+
+    Args:
+        inputs: Names of the input fields
+        outputs: Names of the output fields
+        instructions: The instruction text for the signature
+
+    Returns:
+        DSPy signature class
+    """
+    # Define input and output fields
+    input_fields = {field: dspy.InputField(desc="${" + field + "}") for field in inputs}
+    output_fields = {
+        field: dspy.OutputField(desc="${" + field + "}") for field in outputs
+    }
+
+    # Create the signature class with proper field definitions
+    return type(
+        "DynamicSignature",
+        (dspy.Signature,),
+        {
+            **input_fields,
+            **output_fields,
+            "__doc__": instructions,  # Store the instructions as the docstring
+        },
+    )
+
+
 class BaseStrategy(ABC):
     """
     Base class for prompt optimization strategies.
@@ -272,29 +307,12 @@ class BasicOptimizationStrategy(BaseStrategy):
         Returns:
             DSPy signature class
         """
-        # Create a signature class dynamically with proper field definitions
-        input_fields = {}
-        output_fields = {}
-
-        # Define input and output fields based on prompt_data
-        for field in prompt_data.get("inputs", ["question"]):
-            input_fields[field] = dspy.InputField(desc="${" + field + "}")
-        for field in prompt_data.get("outputs", ["answer"]):
-            output_fields[field] = dspy.OutputField(desc="${" + field + "}")
-
-        # Create the signature class with proper field definitions
-        DynamicSignature = type(
-            "DynamicSignature",
-            (dspy.Signature,),
-            {
-                **input_fields,
-                **output_fields,
-                "__doc__": instructions,  # Store the instructions as the docstring
-            },
+        return _build_signature(
+            tuple(prompt_data.get("inputs", ["question"])),
+            tuple(prompt_data.get("outputs", ["answer"])),
+            instructions,
         )
 
-        return DynamicSignature
-
     def _compute_baseline_score(self, prompt_data: Dict[str, Any]) -> Optional[float]:
         """
         Compute baseline score using the original prompt before optimization.
@@ -829,6 +847,7 @@ class PDOStrategy(BaseStrategy):
             # Task type and judge requirement (for open-ended tasks)
             "task_type": kwargs.get("task_type", "close_ended"),
             "judge_requirement": kwargs.get("judge_requirement"),
+            "seed": kwargs.get("seed"),
         }
 
         # Training and validation data (will be set by migrator)
@@ -882,12 +901,14 @@ class PDOStrategy(BaseStrategy):
             examples = []
             labels = []
 
+            input_fields = prompt_data.get("inputs", ["question"])
             for example in self.trainset:
                 # Extract input text
-                input_text = ""
-                for field in prompt_data.get("inputs", ["question"]):
-                    if hasattr(example, field):
-                        input_text += f"{getattr(example, field)}\n"
+                input_text = "\n".join(
+                    str(getattr(example, field))
+                    for field in input_fields
+                    if hasattr(example, field)
+                )
                 examples.append(input_text.strip())
 
                 # Extract expected output
@@ -942,25 +963,8 @@ class PDOStrategy(BaseStrategy):
 
     def _create_signature(self, prompt_data: Dict[str, Any], instructions: str):
         """Create DSPy signature with explicit field definitions."""
-        # Create a signature class dynamically with proper field definitions
-        input_fields = {}
-        output_fields = {}
-
-        # Define input and output fields based on prompt_data
-        for field in prompt_data.get("inputs", ["question"]):
-            input_fields[field] = dspy.InputField(desc="${" + field + "}")
-        for field in prompt_data.get("outputs", ["answer"]):
-            output_fields[field] = dspy.OutputField(desc="${" + field + "}")
-
-        # Create the signature class with proper field definitions
-        DynamicSignature = type(
-            "DynamicSignature",
-            (dspy.Signature,),
-            {
-                **input_fields,
-                **output_fields,
-                "__doc__": instructions,  # Store the instructions as the docstring
-            },
+        return _build_signature(
+            tuple(prompt_data.get("inputs", ["question"])),
+            tuple(prompt_data.get("outputs", ["answer"])),
+            instructions,
         )
-
-        return DynamicSignature
@@ -7,7 +7,71 @@
 Utility functions for extracting values from different object types.
 """
 
-from typing import Any
+import operator
+from typing import Any, Callable, Dict, Tuple
+
+# Resolved accessor per (type(obj), key). Each accessor is called as
+# accessor(obj, key, default) and must return exactly what the generic lookup
+# in _extract_value_generic would for that object.
+_accessor_cache: Dict[Tuple[type, str], Callable[[Any, str, Any], Any]] = {}
+
+# Builtin types whose attribute set cannot change per instance, so the outcome
+# of every hasattr/isinstance check below is decided by the type alone.
+_FIXED_SHAPE_TYPES = frozenset(
+    {dict, str, bytes, bytearray, int, float, bool, list, tuple, type(None)}
+)
+_STRING_TYPES = (str, bytes, bytearray)
+
+
+def _extract_value_generic(obj: Any, key: str, default: Any = None) -> Any:
+    """Resolve ``key`` on ``obj`` by probing each supported object shape."""
+    # Check for outputs attribute (DSPy Example objects)
+    if hasattr(obj, "outputs") and hasattr(obj.outputs, "get"):
+        value = obj.outputs.get(key)
+        if value is not None:
+            return value
+
+    # Direct attribute access
+    if hasattr(obj, key):
+        return getattr(obj, key)
+
+    # Dictionary access
+    if isinstance(obj, dict) and key in obj:
+        return obj[key]
+
+    # Text attribute (Prediction objects)
+    if hasattr(obj, "text"):
+        return obj.text
+
+    # Fallback to string representation
+    if hasattr(obj, "__str__") and not isinstance(obj, _STRING_TYPES):
+        return str(obj)
+
+    return default
+
+
+def _resolve_accessor(obj_type: type, key: str) -> Callable[[Any, str, Any], Any]:
+    """
+    Pick the cheapest accessor that is equivalent to the generic lookup.
+
+    Only builtin types with a fixed attribute set get a specialized accessor;
+    anything else (DSPy Examples, Predictions, user classes with dynamic
+    attributes) keeps the generic per-call probing.
+    """
+    if obj_type not in _FIXED_SHAPE_TYPES:
+        return _extract_value_generic
+
+    if hasattr(obj_type, key):
+        getter = operator.attrgetter(key)
+        return lambda obj, _key, _default: getter(obj)
+
+    if obj_type is dict:
+        return lambda obj, key, _default: obj[key] if key in obj else str(obj)
+
+    if issubclass(obj_type, _STRING_TYPES):
+        return lambda _obj, _key, default: default
+
+    return lambda obj, _key, _default: str(obj)
 
 
 def extract_value(obj: Any, key: str, default: Any = None) -> Any:
@@ -43,26 +107,9 @@ def extract_value(obj: Any, key: str, default: Any = None) -> Any:
         ...     answer = "42"
         >>> extract_value(Response(), "answer")  # Returns "42"
     """
-    # Check for outputs attribute (DSPy Example objects)
-    if hasattr(obj, "outputs") and hasattr(obj.outputs, "get"):
-        value = obj.outputs.get(key)
-        if value is not None:
-            return value
-
-    # Direct attribute access
-    if hasattr(obj, key):
-        return getattr(obj, key)
-
-    # Dictionary access
-    if isinstance(obj, dict) and key in obj:
-        return obj[key]
-
-    # Text attribute (Prediction objects)
-    if hasattr(obj, "text"):
-        return obj.text
-
-    # Fallback to string representation
-    if hasattr(obj, "__str__") and not isinstance(obj, (str, bytes, bytearray)):
-        return str(obj)
-
-    return default
+    cache_key = (type(obj), key)
+    accessor = _accessor_cache.get(cache_key)
+    if accessor is None:
+        accessor = _resolve_accessor(cache_key[0], key)
+        _accessor_cache[cache_key] = accessor
+    return accessor(obj, key, default)
@@ -0,0 +1,139 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the terms described in the LICENSE file in
+# the root directory of this source tree.
+"""
+Embedding-based near-duplicate cache shared by LLM judges and model adapters.
+"""
+
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+
+def default_embedding_fn() -> Callable[[str], Any]:
+    """
+    Load the default sentence embedding function for semantic caching.
+
+    Returns:
+        Function mapping a text to its embedding vector
+
+    Raises:
+        ImportError: If sentence-transformers is not installed
+    """
+    try:
+        # Import here so the (heavy) dependency is only needed when used
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        raise ImportError(
+            "semantic_cache requires an embedding_fn or sentence-transformers. "
+            "Install it with `pip install sentence-transformers`"
+        )
+
+    encoder = SentenceTransformer("all-MiniLM-L6-v2")
+    return lambda text: encoder.encode(text)
+
+
+class SemanticCache:
+    """
+    Nearest-neighbour cache of values keyed by embeddings of a text.
+
+    Values are stored per namespace (e.g. a judge or model configuration), so
+    entries made under different configurations never match each other. Each
+    namespace keeps at most max_size entries, overwriting the oldest ones once
+    full. Lookups are a brute-force dot product over the namespace, which is
+    fast at the sizes an optimization run produces.
+    """
+
+    def __init__(
+        self,
+        embedding_fn: Callable[[str], Any],
+        similarity_threshold: float,
+        max_size: int,
+    ):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            embedding_fn: Function mapping a text to its embedding vector
+            similarity_threshold: Minimum cosine similarity for a cache hit
+            max_size: Maximum number of entries per namespace
+        """
+        self.embedding_fn = embedding_fn
+        self.similarity_threshold = similarity_threshold
+        self.max_size = max_size
+        # namespace -> [unit vectors (max_size, dim), values, number of entries added]
+        self._entries: Dict[str, List[Any]] = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The lock can't be copied or pickled; copies get their own
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def embed(self, text: str) -> Optional[np.ndarray]:
+        """
+        Embed a text as a unit vector.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            The normalized embedding, or None if it has zero norm
+        """
+        vector = np.asarray(self.embedding_fn(text), dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else None
+
+    def lookup(self, namespace: str, vector: np.ndarray) -> Optional[Any]:
+        """
+        Find the value of the most similar cached entry.
+
+        Args:
+            namespace: Configuration the entry belongs to
+            vector: Normalized embedding of the text
+
+        Returns:
+            The cached value, or None if no entry is similar enough
+        """
+        with self._lock:
+            entry = self._entries.get(namespace)
+            if entry is None:
+                return None
+            vectors, values, added = entry
+            count = min(added, self.max_size)
+            similarities = vectors[:count] @ vector
+            best = int(np.argmax(similarities))
+            if similarities[best] >= self.similarity_threshold:
+                return values[best]
+            return None
+
+    def add(self, namespace: str, vector: np.ndarray, value: Any) -> None:
+        """
+        Cache a value.
+
+        Args:
+            namespace: Configuration the entry belongs to
+            vector: Normalized embedding of the text
+            value: Value to return for similar texts
+        """
+        with self._lock:
+            entry = self._entries.get(namespace)
+            if entry is None or entry[0].shape[1] != vector.shape[0]:
+                entry = [
+                    np.zeros((self.max_size, vector.shape[0]), dtype=np.float32),
+                    [None] * self.max_size,
+                    0,
+                ]
+                self._entries[namespace] = entry
+            slot = entry[2] % self.max_size
+            entry[0][slot] = vector
+            entry[1][slot] = value
+            entry[2] += 1
@@ -28,6 +28,8 @@ class HotpotQAMetric(MetricBase):
     This metric evaluates both answer correctness and passage retrieval accuracy.
     """
 
+    __slots__ = ("output_field", "strict_json", "passage_weight")
+
     def __init__(
         self,
         output_field: str = "answer",
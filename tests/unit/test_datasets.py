@@ -1,13 +1,20 @@
 import json
 import os
+import pickle
+import random
+import sys
 import tempfile
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+import dspy
 import pytest
 
+from prompt_ops.core import datasets
 from prompt_ops.core.datasets import (
     ConfigurableJSONAdapter,
     DatasetAdapter,
+    StandardExample,
+    create_dspy_example,
     load_dataset,
 )
 
@@ -184,3 +191,364 @@ def test_minimum_records_in_dataset(simple_data_file):
 
     with pytest.raises(ValueError, match="Dataset must contain at least 4 records"):
         validate_min_records_in_dataset(dataset_adapter)
+
+
+def test_load_json_accepts_non_strict_values(tmp_path):
+    # NaN is rejected by strict parsers but has always been accepted here
+    data_file = tmp_path / "data.json"
+    data_file.write_text('[{"question": "Q1", "answer": "A1", "score": NaN}]')
+
+    adapter = ConfigurableJSONAdapter(
+        dataset_path=str(data_file),
+        input_field="question",
+        golden_output_field="answer",
+    )
+    data = adapter.load_raw_data()
+
+    assert len(data) == 1
+    assert data[0]["question"] == "Q1"
+
+
+def test_load_dataset_shuffles_with_seed(mock_dataset_adapter):
+    train_a, val_a, test_a = load_dataset(mock_dataset_adapter, seed=7)
+    train_b, _, _ = load_dataset(mock_dataset_adapter, seed=7)
+    train_c, _, _ = load_dataset(mock_dataset_adapter, seed=8)
+
+    questions_a = [example.question for example in train_a]
+
+    # Same seed gives the same split, a different seed a different one
+    assert questions_a == [example.question for example in train_b]
+    assert questions_a != [example.question for example in train_c]
+
+    # The shuffle must not drop or duplicate examples
+    all_questions = questions_a + [ex.question for ex in val_a + test_a]
+    assert sorted(all_questions) == sorted(f"Q{i}" for i in range(100))
+
+
+def test_load_yaml_list_and_wrapped_list(tmp_path, monkeypatch):
+    monkeypatch.setattr(datasets, "DEFAULT_DATASET_CACHE_DIR", tmp_path / "cache")
+    list_file = tmp_path / "list.yaml"
+    list_file.write_text("- question: Q1\n  answer: A1\n- question: Q2\n  answer: A2\n")
+    wrapped_file = tmp_path / "wrapped.yml"
+    wrapped_file.write_text("name: demo\nitems:\n  - question: Q1\n    answer: A1\n")
+
+    for path, expected_len in ((list_file, 2), (wrapped_file, 1)):
+        adapter = ConfigurableJSONAdapter(
+            dataset_path=str(path),
+            input_field="question",
+            golden_output_field="answer",
+        )
+        data = adapter.load_raw_data()
+
+        assert len(data) == expected_len
+        assert data[0]["question"] == "Q1"
+
+
+def test_adapt_newline_delimited_json(tmp_path):
+    data_file = tmp_path / "data.jsonl"
+    data_file.write_text(
+        '{"question": "Q1", "answer": "A1"}\n\n{"question": "Q2", "answer": "A2"}\n'
+    )
+
+    adapter = ConfigurableJSONAdapter(
+        dataset_path=str(data_file),
+        input_field="question",
+        golden_output_field="answer",
+    )
+
+    assert adapter.file_format == "json"
+    assert len(adapter.load_raw_data()) == 2
+
+    adapted_data = adapter.adapt()
+    assert [ex["inputs"]["question"] for ex in adapted_data] == ["Q1", "Q2"]
+    assert adapted_data[1]["outputs"]["answer"] == "A2"
+
+
+def test_load_dataset_cache_skips_adapt(simple_data_file, tmp_path):
+    temp_file, _ = simple_data_file
+    adapter = ConfigurableJSONAdapter(
+        dataset_path=temp_file,
+        input_field="question",
+        golden_output_field="answer",
+    )
+
+    first = load_dataset(adapter, cache=True, cache_dir=tmp_path)
+    assert len(list(tmp_path.glob("*.pkl"))) == 1
+
+    # A cache hit must not call adapt() again and must give the same splits
+    with patch.object(
+        ConfigurableJSONAdapter,
+        "adapt",
+        side_effect=AssertionError("adapt() was called"),
+    ):
+        second = load_dataset(adapter, cache=True, cache_dir=tmp_path)
+
+    for split_a, split_b in zip(first, second):
+        assert [ex.question for ex in split_a] == [ex.question for ex in split_b]
+
+
+def _shout(text):
+    return text.upper()
+
+
+def test_adapt_parallel_matches_serial(tmp_path):
+    data_file = tmp_path / "data.json"
+    data_file.write_text(
+        json.dumps([{"question": f"Q{i}", "answer": f"a{i}"} for i in range(40)])
+    )
+
+    def make_adapter(output_transform):
+        adapter = ConfigurableJSONAdapter(
+            dataset_path=str(data_file),
+            input_field="question",
+            golden_output_field="answer",
+            output_transform=output_transform,
+            num_workers=2,
+        )
+        adapter.parallel_threshold = 10
+        return adapter
+
+    # Module-level transforms pickle and run in the process pool; lambdas
+    # fall back to serial processing with the same result
+    parallel = make_adapter(_shout).adapt()
+    serial = make_adapter(lambda text: text.upper()).adapt()
+
+    assert parallel == serial
+    assert parallel[39]["outputs"]["answer"] == "A39"
+    assert sys.intern("A39") is parallel[39]["outputs"]["answer"]
+
+
+def test_adapt_is_serial_by_default(tmp_path):
+    data_file = tmp_path / "data.json"
+    data_file.write_text(
+        json.dumps([{"question": f"Q{i}", "answer": f"a{i}"} for i in range(40)])
+    )
+    adapter = ConfigurableJSONAdapter(
+        dataset_path=str(data_file),
+        input_field="question",
+        golden_output_field="answer",
+        output_transform=_shout,
+    )
+    adapter.parallel_threshold = 10
+
+    with patch.object(datasets, "ProcessPoolExecutor") as executor:
+        assert len(adapter.adapt()) == 40
+    executor.assert_not_called()
+
+
+def test_load_yaml_uses_json_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(datasets, "DEFAULT_DATASET_CACHE_DIR", tmp_path / "default")
+    data_file = tmp_path / "data.yaml"
+    data_file.write_text("- question: Q1\n  answer: A1\n")
+
+    # Without a cache directory nothing is written
+    uncached = ConfigurableJSONAdapter(
+        dataset_path=str(data_file),
+        input_field="question",
+        golden_output_field="answer",
+    )
+    assert uncached.load_raw_data() == [{"question": "Q1", "answer": "A1"}]
+    assert list(tmp_path.iterdir()) == [data_file]
+
+    adapter = ConfigurableJSONAdapter(
+        dataset_path=str(data_file),
+        input_field="question",
+        golden_output_field="answer",
+        yaml_cache_dir=tmp_path / "cache",
+    )
+    first = adapter.load_raw_data()
+    assert len(list((tmp_path / "cache").glob("*.json"))) == 1
+
+    # The second load is served from the JSON cache without parsing YAML
+    with patch.object(datasets.yaml, "load", side_effect=AssertionError):
+        assert adapter.load_raw_data() == first
+
+
+def test_adapt_csv_rows(tmp_path):
+    data_file = tmp_path / "data.csv"
+    data_file.write_text("question,answer\nQ1,A1\nQ2,A2\n")
+
+    adapter = ConfigurableJSONAdapter(
+        dataset_path=str(data_file),
+        input_field="question",
+        golden_output_field="answer",
+    )
+
+    assert adapter.load_raw_data() == [
+        {"question": "Q1", "answer": "A1"},
+        {"question": "Q2", "answer": "A2"},
+    ]
+    adapted_data = adapter.adapt()
+    assert [ex["outputs"]["answer"] for ex in adapted_data] == ["A1", "A2"]
+
+
+def test_standard_example_dict_access():
+    example = StandardExample(inputs={"question": "Q"}, outputs={"answer": "A"})
+
+    assert example["inputs"] == {"question": "Q"}
+    assert "outputs" in example and "extra" not in example
+    assert example.get("metadata") == {}
+    assert example.get("extra", "default") == "default"
+    with pytest.raises(KeyError):
+        example["extra"]
+
+    assert pickle.loads(pickle.dumps(example)) == example
+    dspy_example = create_dspy_example(example)
+    assert dspy_example.question == "Q"
+    assert dspy_example.answer == "A"
+
+
+@pytest.mark.parametrize(
+    "path", [("a",), ("a", "b"), ("a", "b", "c"), ("a", "b", "c", "d")]
+)
+def test_compile_nested_getter_matches_get_nested_value(simple_data_file, path):
+    temp_file, _ = simple_data_file
+    adapter = ConfigurableJSONAdapter(
+        dataset_path=temp_file,
+        input_field="question",
+        golden_output_field="answer",
+        default_value="missing",
+    )
+    getter = datasets._compile_nested_getter(path, "missing")
+
+    items = [
+        {},
+        {"a": "text"},
+        {"a": ["list"]},
+        {"a": {"b": None}},
+        {"a": {"b": {"c": 1}}},
+        {"a": {"b": {"c": {"d": "deep"}}}},
+    ]
+    for item in items:
+        assert getter(item) == adapter._get_nested_value(item, list(path))
+
+
+def test_create_dspy_example_matches_constructor():
+    doc = StandardExample(
+        inputs={"question": "Q", "context": "C"}, outputs={"answer": "A"}
+    )
+    example = create_dspy_example(doc)
+
+    expected = dspy.Example(question="Q", context="C", answer="A")
+    assert example == expected
+    assert example.inputs() == expected.with_inputs("question", "context").inputs()
+    assert example.labels().toDict() == {"answer": "A"}
+    assert example._output_keys == {"answer"}
+
+
+def test_compiled_processors_match_process_fields(nested_data_file):
+    temp_file, nested_data = nested_data_file
+    adapter = ConfigurableJSONAdapter(
+        dataset_path=temp_file,
+        input_field=["fields", "input"],
+        golden_output_field={"output": "reference"},
+        input_transform=str.upper,
+    )
+
+    for item in nested_data:
+        assert adapter._input_processor(item) == adapter._process_fields(
+            item, adapter.input_field, adapter.input_transform, is_input=True
+        )
+        assert adapter._output_processor(item) == adapter._process_fields(
+            item, adapter.golden_output_field, adapter.output_transform, is_input=False
+        )
+
+
+def test_load_dataset_converts_splits_lazily(mock_dataset_adapter):
+    with patch.object(
+        datasets, "create_dspy_example", wraps=datasets.create_dspy_example
+    ) as create:
+        trainset, valset, testset = load_dataset(mock_dataset_adapter)
+        assert create.call_count == 0
+
+        questions = [example.question for example in trainset]
+        assert create.call_count == len(trainset) == 60
+
+        # Converted examples are cached
+        assert [example.question for example in trainset] == questions
+        assert create.call_count == 60
+
+    # Splits behave like lists of examples
+    random.Random(0).shuffle(trainset)
+    assert sorted(ex.question for ex in trainset) == sorted(questions)
+    assert len(valset + testset) == 40
+    assert trainset[:2] == list(trainset)[:2]
+
+
+def test_load_yaml_list_key(tmp_path):
+    data_file = tmp_path / "data.yaml"
+    data_file.write_text("tags: [a, b]\nitems:\n  - question: Q1\n    answer: A1\n")
+
+    def make_adapter(**kwargs):
+        return ConfigurableJSONAdapter(
+            dataset_path=str(data_file),
+            input_field="question",
+            golden_output_field="answer",
+            **kwargs,
+        )
+
+    # Without a hint the first list value is used
+    assert make_adapter().load_raw_data() == ["a", "b"]
+    assert make_adapter(yaml_list_key="items").load_raw_data() == [
+        {"question": "Q1", "answer": "A1"}
+    ]
+    with pytest.raises(ValueError, match="missing"):
+        make_adapter(yaml_list_key="missing").load_raw_data()
+
+
+def test_adapt_interns_short_repeated_values(tmp_path):
+    data_file = tmp_path / "data.json"
+    long_text = "x" * 300
+    data_file.write_text(
+        json.dumps(
+            [
+                {"question": long_text, "label": "positive"},
+                {"question": long_text, "label": "positive"},
+            ]
+        )
+    )
+
+    adapter = ConfigurableJSONAdapter(
+        dataset_path=str(data_file),
+        input_field="question",
+        golden_output_field="label",
+    )
+    first, second = adapter.adapt()
+
+    assert first["outputs"]["answer"] is second["outputs"]["answer"]
+    assert first["inputs"]["question"] == second["inputs"]["question"] == long_text
+
+
+def test_load_json_memory_mapped(tmp_path, monkeypatch):
+    monkeypatch.setattr(datasets, "_MMAP_MIN_BYTES", 1)
+    data = [{"question": "Q1", "answer": "A1"}, {"question": "Q2", "answer": "A2"}]
+    array_file = tmp_path / "data.json"
+    array_file.write_text(json.dumps(data))
+    ndjson_file = tmp_path / "data.jsonl"
+    ndjson_file.write_text("\n".join(json.dumps(item) for item in data))
+
+    for path in (array_file, ndjson_file):
+        adapter = ConfigurableJSONAdapter(
+            dataset_path=str(path),
+            input_field="question",
+            golden_output_field="answer",
+        )
+        assert adapter.load_raw_data() == data
+
+
+def test_container_values_keep_default_json_separators(tmp_path):
+    data_file = tmp_path / "data.json"
+    data_file.write_text(json.dumps([{"question": ["é", {"b": 1}], "answer": "A"}]))
+    adapter = ConfigurableJSONAdapter(
+        dataset_path=str(data_file),
+        input_field="question",
+        golden_output_field="answer",
+    )
+
+    [example] = adapter.adapt()
+    assert example.inputs["question"] == '["é", {"b": 1}]'
+
+    doc = StandardExample(inputs={"question": {"a": 1}}, outputs={"answer": [1, 2]})
+    dspy_example = create_dspy_example(doc)
+    assert dspy_example.question == '{"a": 1}'
+    assert dspy_example.answer == "[1, 2]"
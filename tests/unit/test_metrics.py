@@ -1,10 +1,17 @@
+import copy
 import json
+import pickle
+import subprocess
+import sys
+from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
 # Import the metrics classes
 try:
     from prompt_ops.core.metrics import (
+        DSPyMetricAdapter,
         ExactMatchMetric,
         FacilityMetric,
         MetricBase,
@@ -298,3 +305,323 @@ def test_metric_base_extract_value():
         assert metric.extract_value(test_obj, "missing", "default") == "default"
     except NameError:
         pytest.skip("MetricBase not available")
+
+
+def _mock_judge(score="8"):
+    """Patch dspy.ChainOfThought with a judge that always returns `score`."""
+    judge = MagicMock(return_value=MagicMock(score=score))
+    return patch("dspy.ChainOfThought", return_value=judge), judge
+
+
+def test_dspy_metric_adapter_caches_scores():
+    metric = DSPyMetricAdapter(model=MagicMock(), signature_name="similarity")
+    chain_patch, judge = _mock_judge("8")
+
+    with chain_patch:
+        first = metric({"answer": "Paris"}, {"answer": "Paris"})
+        second = metric({"answer": "Paris"}, {"answer": "Paris"})
+        metric({"answer": "Paris"}, {"answer": "Lyon"})
+
+    assert first == second == pytest.approx(7 / 9)
+    assert judge.call_count == 2
+
+    # Changing the scoring configuration misses the cache
+    metric.score_range = (0, 10)
+    with chain_patch:
+        assert metric({"answer": "Paris"}, {"answer": "Paris"}) == pytest.approx(0.8)
+    assert judge.call_count == 3
+
+
+def test_dspy_metric_adapter_semantic_cache():
+    def embed(text):
+        # Toy embedding: near-duplicates that mention Paris map to one vector
+        return [1.0, 0.0] if "Paris" in text else [0.0, 1.0]
+
+    metric = DSPyMetricAdapter(
+        model=MagicMock(),
+        signature_name="similarity",
+        semantic_cache=True,
+        embedding_fn=embed,
+    )
+    chain_patch, judge = _mock_judge("10")
+
+    with chain_patch:
+        assert metric({"answer": "Paris"}, {"answer": "Paris"}) == 1.0
+        assert metric({"answer": "Paris"}, {"answer": " Paris, France"}) == 1.0
+        metric({"answer": "Lyon"}, {"answer": "Lyon"})
+
+    assert judge.call_count == 2
+
+
+def _embed_first_letter(text):
+    return [1.0, 0.0] if text[:1] < "m" else [0.0, 1.0]
+
+
+def test_dspy_metric_adapter_copies():
+    metric = DSPyMetricAdapter(
+        signature_name="similarity",
+        semantic_cache=True,
+        embedding_fn=_embed_first_letter,
+    )
+    chain_patch, judge = _mock_judge("10")
+    with chain_patch:
+        metric({"answer": "Paris"}, {"answer": "Paris"})
+
+    for copy_ in (copy.deepcopy(metric), pickle.loads(pickle.dumps(metric))):
+        assert copy_.custom_instructions == metric.custom_instructions
+        assert copy_.input_mapping == metric.input_mapping
+        assert len(copy_._score_cache) == 0
+        assert copy_._score_cache_lock is not metric._score_cache_lock
+        with chain_patch:
+            assert copy_({"answer": "Lyon"}, {"answer": "Lyon"}) == 1.0
+
+    assert len(metric._score_cache) == 1
+
+
+def test_dspy_metric_adapter_batch():
+    metric = DSPyMetricAdapter(
+        model=MagicMock(), signature_name="similarity", cache_size=0
+    )
+    chain_patch, judge = _mock_judge("10")
+
+    with chain_patch as chain_of_thought:
+        scores = metric.batch(["a", "b", "c"], ["a", "b", "c"], max_threads=2)
+
+    assert scores == [1.0, 1.0, 1.0]
+    assert judge.call_count == 3
+    # One judge module is shared by the whole batch
+    assert chain_of_thought.call_count == 1
+
+    with pytest.raises(ValueError):
+        metric.batch(["a"], [])
+
+
+def test_dspy_metric_adapter_reuses_judge():
+    metric = DSPyMetricAdapter(model=MagicMock(), cache_size=0)
+    chain_patch, _ = _mock_judge("10")
+
+    with chain_patch as chain_of_thought:
+        metric("a", "a")
+        metric("b", "b")
+        assert chain_of_thought.call_count == 1
+
+        # Changing the judge configuration rebuilds the judge
+        metric.custom_instructions = "Score the answers."
+        metric("c", "c")
+        assert chain_of_thought.call_count == 2
+        assert chain_of_thought.call_args[0][0].__doc__ == "Score the answers."
+
+
+@pytest.mark.parametrize(
+    "raw_score,expected",
+    [("10", 1.0), ("Score: 5.5", 0.5), ("1/10", 0.0), ("no score", 0.0)],
+)
+def test_dspy_metric_adapter_parses_score(raw_score, expected):
+    metric = DSPyMetricAdapter(model=MagicMock(), score_range=(1, 10), cache_size=0)
+    chain_patch, _ = _mock_judge(raw_score)
+
+    with chain_patch:
+        assert metric("a", "a") == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("case_sensitive", [True, False])
+@pytest.mark.parametrize("strip_whitespace", [True, False])
+def test_exact_match_metric_batch_matches_scalar(case_sensitive, strip_whitespace):
+    metric = ExactMatchMetric(
+        case_sensitive=case_sensitive, strip_whitespace=strip_whitespace
+    )
+    golds = ["Answer", "Answer ", "answer", 42, "", "Ünïcode"]
+    preds = ["Answer", " Answer", "ANSWER", "42", " ", "ünïcode"]
+
+    scores = metric.batch(golds, preds)
+
+    assert scores.dtype == np.float32
+    assert scores.tolist() == [
+        metric(gold, pred)["exact_match"] for gold, pred in zip(golds, preds)
+    ]
+    assert metric.evaluate(golds, preds).tolist() == scores.tolist()
+    assert metric.evaluate("a", "a") == 1.0
+
+
+def test_flatten_keys_paths():
+    from prompt_ops.core.metrics import _flatten_keys
+
+    value = {"a": {"b": [1, {"c": 2}], "d": {}}, "e": "x"}
+    assert sorted(_flatten_keys(value)) == ["a.b[0]", "a.b[1].c", "a.d", "e"]
+    assert _flatten_keys({}) == []
+    assert _flatten_keys("leaf") == [""]
+
+    # Deep documents don't hit the recursion limit
+    deep = leaf = {}
+    for _ in range(5000):
+        leaf["k"] = {}
+        leaf = leaf["k"]
+    leaf["k"] = 1
+    assert len(_flatten_keys(deep)) == 1
+
+
+def test_json_evaluation_metric_paths():
+    gold = {"a": {"b": [1, 2]}, "c": 3}
+    pred = {"a": {"b": [1]}, "d": 4}
+
+    result = json_evaluation_metric(gold, pred)
+
+    # One shared leaf (a.b[0]) out of two predicted and three gold leaves
+    assert result["precision"] == pytest.approx(1 / 2)
+    assert result["recall"] == pytest.approx(1 / 3)
+
+    # A dotted key is not the same leaf as a nested one
+    assert json_evaluation_metric({"a": {"b": 1}}, {"a.b": 1})["f1"] == 0.0
+
+
+def test_json_evaluation_metric_parses_non_strict_json():
+    # NaN is rejected by orjson but accepted by the stdlib parser
+    result = json_evaluation_metric('{"a": NaN, "b": 1}', '{"a": 1, "b": 2}')
+    assert result["f1"] == 1.0
+
+    # Repeated gold strings are parsed and flattened once
+    gold = '{"x": [1, 2, 3]}'
+    json_evaluation_metric(gold, '{"x": [1]}')
+    from prompt_ops.core.metrics import _gold_leaf_paths, _loads_gold_json
+
+    misses = _loads_gold_json.cache_info().misses
+    hits = _gold_leaf_paths.cache_info().hits
+    result = json_evaluation_metric(gold, '{"x": [1, 2]}')
+    assert _gold_leaf_paths.cache_info().hits == hits + 1
+    assert _loads_gold_json.cache_info().misses == misses
+    assert result["precision"] == 1.0
+    assert result["recall"] == pytest.approx(2 / 3)
+
+
+def test_dspy_metric_adapter_normalize_scores():
+    metric = DSPyMetricAdapter(model=MagicMock(), score_range=(1, 10))
+    raw = [0, 1, 5.5, 10, 12]
+
+    assert metric.normalize_scores(raw).tolist() == pytest.approx(
+        [metric.normalize_score(score) for score in raw]
+    )
+
+    metric.score_range = (5, 5)
+    assert metric.normalize_scores(raw).tolist() == [0.0] * len(raw)
+
+
+def test_exact_match_metric_scalar_results():
+    metric = ExactMatchMetric(case_sensitive=False)
+    assert metric.score(" Answer", "answer") == 1.0
+    assert metric.score("Answer", "Other") == 0.0
+    assert metric("Answer", "answer") == {"exact_match": 1.0}
+
+    scalar_metric = ExactMatchMetric(return_scalar=True)
+    assert scalar_metric("Answer", "Answer") == 1.0
+    assert scalar_metric("Answer", "answer") == 0.0
+
+
+def test_extract_value_cached_accessors():
+    from prompt_ops.core.utils.extraction_utils import (
+        _accessor_cache,
+        _extract_value_generic,
+    )
+
+    class Response:
+        answer = "42"
+
+    samples = [{"answer": "a"}, {"other": 1}, "text", 7, None, Response()]
+    for obj in samples:
+        for _ in range(2):
+            assert MetricBase.extract_value(
+                obj, "answer", "default"
+            ) == _extract_value_generic(obj, "answer", "default")
+
+    assert (dict, "answer") in _accessor_cache
+    assert _accessor_cache[(Response, "answer")] is _extract_value_generic
+
+
+def test_dspy_metric_adapter_default_instructions_cached():
+    metric = DSPyMetricAdapter(model=MagicMock(), score_range=(1, 5))
+    metric.input_field_descriptions = {"gold": "Gold", "pred": "Prediction"}
+    expected = (
+        "Evaluate the similarity between the inputs.\n"
+        "Score from 1-5, where 1 means completely different\n"
+        "and 5 means identical in meaning.\n\n"
+        "Gold: {gold}\n\nPred: {pred}\n\n"
+        "Score[1-5]:"
+    )
+
+    assert metric._default_instructions() == expected
+    assert metric._default_instructions() is metric._default_instructions()
+
+    metric.score_range = (0, 10)
+    assert "Score[0-10]:" in metric._default_instructions()
+
+
+def test_metrics_use_slots():
+    metrics = [
+        DSPyMetricAdapter(model=MagicMock()),
+        ExactMatchMetric(),
+        FacilityMetric(),
+        StandardJSONMetric(output_fields=["answer"]),
+    ]
+    for metric in metrics:
+        assert not hasattr(metric, "__dict__")
+        with pytest.raises(AttributeError):
+            metric.unexpected_attribute = True
+
+
+def test_dspy_metric_adapter_input_resolvers():
+    metric = DSPyMetricAdapter(
+        model=MagicMock(),
+        input_mapping={"gold": "expected", "pred": "actual", "question": "q"},
+        cache_size=0,
+    )
+    patcher, judge = _mock_judge("5")
+    with patcher, patch("dspy.context"):
+        metric({"answer": "a"}, {"answer": "b"}, question="why")
+        judge.assert_called_once_with(expected="a", actual="b", q="why")
+
+        # Reassigning the mapping rebuilds the resolvers
+        metric.input_mapping = {"pred": "output"}
+        metric({"answer": "a"}, "raw prediction")
+        judge.assert_called_with(output="raw prediction")
+
+
+def test_dspy_metric_adapter_retries_transient_errors():
+    metric = DSPyMetricAdapter(model=MagicMock(), score_range=(0, 10), cache_size=0)
+    chain_patch, judge = _mock_judge("10")
+    judge.side_effect = [TimeoutError("slow"), MagicMock(score="10")]
+
+    with (
+        chain_patch,
+        patch("dspy.context"),
+        patch("prompt_ops.core.metrics.time.sleep") as sleep,
+    ):
+        assert metric("a", "a") == 1.0
+        assert judge.call_count == 2
+        assert 0 < sleep.call_args.args[0] <= 2.0
+
+        # Exhausted retries fall back to the worst score
+        judge.side_effect = ConnectionError("down")
+        assert metric("a", "b") == 0.0
+        assert judge.call_count == 2 + metric.max_retries + 1
+
+        # Bugs are not swallowed
+        judge.side_effect = AttributeError("bug")
+        with pytest.raises(AttributeError):
+            metric("a", "c")
+
+
+def test_metrics_import_does_not_load_dspy():
+    # Run in a fresh interpreter, as this session has already imported DSPy
+    code = (
+        "import sys, prompt_ops.core.metrics; "
+        "print('dspy' in sys.modules, 'litellm' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == ["False", "False"]
+
+    # The package still exposes its public names
+    from prompt_ops.core import BasicOptimizationStrategy, ExactMatchMetric
+
+    assert ExactMatchMetric.__module__ == "prompt_ops.core.metrics"
+    assert BasicOptimizationStrategy.__name__ == "BasicOptimizationStrategy"
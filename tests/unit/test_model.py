@@ -0,0 +1,439 @@
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import litellm
+import pytest
+
+from prompt_ops.core.model import (
+    DSPyModelAdapter,
+    LiteLLMModelAdapter,
+    _count_tokens,
+    _FairLimiter,
+    _RateLimiter,
+    setup_model,
+)
+
+
+def _response(text):
+    """Build a minimal litellm.completion response carrying `text`."""
+    message = MagicMock(content=text)
+    return MagicMock(choices=[MagicMock(message=message)])
+
+
+def _embed(text):
+    """Toy embedding: bag of lowercase words over a tiny vocabulary."""
+    vocabulary = ["capital", "france", "germany", "what", "is", "the"]
+    words = text.lower().replace("?", "").split()
+    return [float(words.count(word)) for word in vocabulary]
+
+
+@pytest.fixture
+def completion():
+    with patch("litellm.completion") as mock_completion:
+        mock_completion.return_value = _response("Paris")
+        yield mock_completion
+
+
+def test_litellm_semantic_cache_reuses_near_duplicates(completion):
+    adapter = LiteLLMModelAdapter(
+        model_name="openai/test",
+        cache_size=0,
+        semantic_cache=True,
+        embedding_fn=_embed,
+    )
+
+    assert adapter.generate("What is the capital of France?") == "Paris"
+    assert adapter.generate("what is the capital of france") == "Paris"
+    assert completion.call_count == 1
+    assert adapter.cache_hits == 1
+
+    # Different content, and sampled requests, always reach the provider
+    adapter.generate("What is the capital of Germany?")
+    adapter.generate("What is the capital of France?", temperature=0.7)
+    assert completion.call_count == 3
+
+    # Requests with different parameters never share entries
+    adapter.generate("What is the capital of France?", max_tokens=5)
+    assert completion.call_count == 4
+
+
+def test_litellm_exact_cache_for_deterministic_requests(completion):
+    adapter = LiteLLMModelAdapter(model_name="openai/test", cache_size=2)
+    messages = [{"role": "user", "content": "What is the capital of France?"}]
+
+    assert adapter.generate("What is the capital of France?") == "Paris"
+    assert adapter.generate_with_chat_format(messages) == "Paris"
+    assert completion.call_count == 1
+    assert adapter.cache_hits == 1
+
+    # Sampled requests are never cached
+    adapter.generate("What is the capital of France?", temperature=0.7)
+    adapter.generate("What is the capital of France?", temperature=0.7)
+    assert completion.call_count == 3
+
+    # The least recently used entry is evicted
+    adapter.generate("a")
+    adapter.generate("b")
+    adapter.generate("What is the capital of France?")
+    assert completion.call_count == 6
+
+
+def test_litellm_generate_batch_runs_async_in_order():
+    adapter = LiteLLMModelAdapter(model_name="openai/test", cache_size=0)
+    in_flight = 0
+    peak = 0
+
+    async def acompletion(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _response(kwargs["messages"][0]["content"].upper())
+
+    prompts = [f"prompt {i}" for i in range(10)]
+    with (
+        patch(
+            "litellm.acompletion",
+            AsyncMock(side_effect=acompletion),
+        ),
+        patch("litellm.completion") as completion,
+    ):
+        results = adapter.generate_batch(prompts, max_threads=3)
+
+    assert results == [prompt.upper() for prompt in prompts]
+    assert peak == 3
+    completion.assert_not_called()
+
+
+def test_fair_limiter_serves_tenants_round_robin():
+    limiter = _FairLimiter(max_concurrency=1)
+    limiter.acquire("setup")
+    order = []
+
+    def request(tenant):
+        limiter.acquire(tenant)
+        order.append(tenant)
+        limiter.release()
+
+    # A floods the queue before B arrives
+    threads = [threading.Thread(target=request, args=(t,)) for t in "AAAB"]
+    for thread in threads:
+        thread.start()
+        time.sleep(0.02)
+    limiter.release()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert order == ["A", "B", "A", "A"]
+
+
+def test_limited_async_batch_does_not_exhaust_executor():
+    adapter = LiteLLMModelAdapter(
+        model_name="openai/test", cache_size=0, max_concurrency=1, rpm=100000
+    )
+
+    async def acompletion(**kwargs):
+        await asyncio.sleep(0.001)
+        return _response(kwargs["messages"][0]["content"])
+
+    prompts = [f"prompt {i}" for i in range(20)]
+    results = []
+    with patch("litellm.acompletion", AsyncMock(side_effect=acompletion)):
+        # Waiters used to park in the loop's default executor, leaving the
+        # slot holder no thread to take its rate budget in
+        worker = threading.Thread(
+            target=lambda: results.extend(
+                adapter.generate_batch(prompts, max_threads=20)
+            ),
+            daemon=True,
+        )
+        worker.start()
+        worker.join(timeout=10)
+
+    assert not worker.is_alive()
+    assert results == prompts
+
+
+def test_fair_limiter_async_waiters_share_slots_with_threads():
+    limiter = _FairLimiter(max_concurrency=1)
+    order = []
+
+    async def request(tenant):
+        await limiter.aacquire(tenant)
+        order.append(tenant)
+        await asyncio.sleep(0)
+        limiter.release()
+
+    async def main():
+        limiter.acquire("setup")
+        tasks = [asyncio.create_task(request(t)) for t in "AAB"]
+        await asyncio.sleep(0.01)
+        # A cancelled waiter gives up its place in the queue
+        cancelled = asyncio.create_task(request("C"))
+        await asyncio.sleep(0.01)
+        cancelled.cancel()
+        # Released from another thread, as a synchronous caller would
+        threading.Thread(target=limiter.release).start()
+        await asyncio.gather(*tasks)
+
+    asyncio.run(main())
+    assert order == ["A", "B", "A"]
+    assert limiter._in_flight == 0 and not limiter._waiting
+
+
+def test_rate_limiter_waits_for_budget():
+    clock = [1000.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    with (
+        patch("prompt_ops.core.model.time.monotonic", lambda: clock[0]),
+        patch("prompt_ops.core.model.time.sleep", sleep),
+    ):
+        limiter = _RateLimiter(rpm=2, tpm=1000)
+        limiter.acquire(100)
+        limiter.acquire(100)
+        assert sleeps == []
+
+        # Out of requests: wait for one request's worth of refill (30s at 2 rpm)
+        limiter.acquire(100)
+        assert sleeps == [pytest.approx(30.0)]
+
+        # Out of tokens: 700 left after the refill, 900 needed
+        limiter.acquire(900)
+        assert sum(sleeps[1:]) == pytest.approx(30.0)
+
+
+def test_count_tokens_estimates_unknown_models():
+    assert _count_tokens("hello world", "openai/gpt-4o-mini") > 0
+    assert _count_tokens("hello world", "openrouter/meta-llama/llama-3.3-70b") > 0
+
+
+def test_count_tokens_encodes_each_text_once():
+    encoding = MagicMock()
+    encoding.encode.side_effect = lambda text, **kwargs: text.split()
+    with patch("prompt_ops.core.model._encoding_for", return_value=encoding):
+        assert _count_tokens("one two three", "test/counting") == 3
+        assert _count_tokens("one two three", "test/counting") == 3
+        assert _count_tokens("one two", "test/counting") == 2
+    assert encoding.encode.call_count == 2
+
+
+def test_dspy_chat_format_flattens_messages():
+    adapter = DSPyModelAdapter.__new__(DSPyModelAdapter)
+    messages = [
+        {"role": "System", "content": "Be brief."},
+        {"role": "tool", "content": "ignored"},
+        {"role": "user", "content": "Hi"},
+        {"role": "assistant", "content": "Hello"},
+        {"content": "Bye"},
+    ]
+    with patch.object(DSPyModelAdapter, "generate", return_value="ok") as generate:
+        assert adapter.generate_with_chat_format(messages) == "ok"
+
+    assert generate.call_args.args[0] == (
+        "System: Be brief.\n\nUser: Hi\n\nAssistant: Hello\n\n"
+        "User: Bye\n\nAssistant: "
+    )
+
+
+def test_litellm_request_kwargs_merge_overrides(completion):
+    adapter = LiteLLMModelAdapter(
+        model_name="openai/test",
+        api_base="http://localhost:8000/v1",
+        max_tokens=64,
+        cache=True,
+        top_p=0.9,
+    )
+
+    adapter.generate("hi")
+    assert completion.call_args.kwargs == {
+        "model": "openai/test",
+        "messages": [{"role": "user", "content": "hi"}],
+        "temperature": 0.0,
+        "max_tokens": 64,
+        "top_p": 0.9,
+        "api_base": "http://localhost:8000/v1",
+    }
+
+    adapter.generate("hi", temperature=0.5, top_p=0.5, api_base="ignored")
+    kwargs = completion.call_args.kwargs
+    assert kwargs["temperature"] == 0.5
+    assert kwargs["top_p"] == 0.5
+    assert kwargs["api_base"] == "http://localhost:8000/v1"
+    assert adapter._base_kwargs["top_p"] == 0.9
+
+
+def test_litellm_connection_pool_installs_shared_sessions():
+    with (
+        patch("litellm.client_session", None),
+        patch("litellm.aclient_session", None),
+    ):
+        LiteLLMModelAdapter(model_name="openai/test", connection_pool_size=8)
+        session = litellm.client_session
+        assert session is not None and litellm.aclient_session is not None
+
+        # Later adapters keep the installed sessions
+        LiteLLMModelAdapter(model_name="openai/test", connection_pool_size=16)
+        assert litellm.client_session is session
+
+        session.close()
+
+
+def _chunk(text):
+    """Build a minimal streamed chunk carrying `text`."""
+    return MagicMock(choices=[MagicMock(delta=MagicMock(content=text))])
+
+
+def test_litellm_generate_streaming_stops_early(completion):
+    adapter = LiteLLMModelAdapter(model_name="openai/test")
+    stream = MagicMock()
+    stream.__iter__.return_value = iter(
+        [_chunk("Reasoning. "), _chunk("Answer: 4\n"), _chunk("More text")]
+    )
+    completion.return_value = stream
+
+    text = adapter.generate_streaming("2+2?", stop_detector=lambda t: "\n" in t)
+
+    assert text == "Reasoning. Answer: 4\n"
+    assert completion.call_args.kwargs["stream"] is True
+    stream.close.assert_called_once()
+
+    # Truncated responses are not cached
+    completion.return_value = iter([_chunk("Reasoning. "), _chunk("Answer: 4")])
+    assert adapter.generate_streaming("2+2?") == "Reasoning. Answer: 4"
+    assert adapter.generate_streaming("2+2?") == "Reasoning. Answer: 4"
+    assert completion.call_count == 2
+
+
+def test_generate_batch_sends_repeated_prompts_once(completion):
+    adapter = LiteLLMModelAdapter(model_name="openai/test", cache_size=0)
+    completion.side_effect = lambda **kwargs: _response(
+        kwargs["messages"][0]["content"].upper()
+    )
+
+    assert adapter.generate_batch(["a", "b", "a", "a"]) == ["A", "B", "A", "A"]
+    assert completion.call_count == 2
+
+    # Sampled requests are drawn independently
+    adapter.generate_batch(["a", "a"], temperature=0.7)
+    assert completion.call_count == 4
+
+
+def test_generate_batch_follows_dspy_adapter_temperature():
+    with (
+        patch("dspy.configure"),
+        patch("prompt_ops.core.model._dspy_lm_owners", return_value=()),
+    ):
+        sampled = DSPyModelAdapter(model_name="openai/test", temperature=0.9)
+        greedy = DSPyModelAdapter(model_name="openai/test")
+
+    draws = iter(range(10))
+    with patch.object(
+        DSPyModelAdapter, "generate", side_effect=lambda prompt, **kw: next(draws)
+    ) as generate:
+        assert sampled.generate_batch(["same"] * 3) == [0, 1, 2]
+        assert greedy.generate_batch(["same"] * 3) == [3, 3, 3]
+        assert generate.call_count == 4
+
+
+def test_generate_batch_reuses_thread_pool(completion):
+    adapter = LiteLLMModelAdapter(model_name="openai/test", cache_size=0)
+
+    # Inside a running event loop the batch uses the thread pool
+    async def run(max_threads):
+        return adapter.generate_batch(["a", "b"], max_threads=max_threads)
+
+    asyncio.run(run(2))
+    executor = adapter._executor
+    asyncio.run(run(2))
+    assert adapter._executor is executor
+
+    asyncio.run(run(3))
+    assert adapter._executor is not executor
+    assert adapter._executor_workers == 3
+
+
+def test_litellm_merges_extra_body(completion):
+    adapter = LiteLLMModelAdapter(
+        model_name="openai/test",
+        api_base="http://localhost:8000/v1",
+        extra_body={"guided_decoding_backend": "xgrammar"},
+    )
+
+    adapter.generate("hi", extra_body={"top_k": 5})
+    assert completion.call_args.kwargs["extra_body"] == {
+        "guided_decoding_backend": "xgrammar",
+        "top_k": 5,
+    }
+    assert adapter._base_kwargs["extra_body"] == {"guided_decoding_backend": "xgrammar"}
+
+
+def test_setup_model_output_format_sets_stop(completion):
+    adapter = setup_model(
+        "openai/test",
+        adapter_type="litellm",
+        output_format="xml_tag",
+        output_tag="answer",
+    )
+    adapter.generate("hi")
+    assert completion.call_args.kwargs["stop"] == ["</answer>"]
+
+    adapter = setup_model("openai/test", adapter_type="litellm", output_format="json")
+    assert adapter._base_kwargs["stop"] == ["\n```"]
+
+    with pytest.raises(ValueError):
+        setup_model("openai/test", adapter_type="litellm", output_format="xml_tag")
+    with pytest.raises(ValueError):
+        setup_model("openai/test", output_format="json")
+
+
+def test_litellm_metrics_aggregate_across_threads(completion):
+    completion.return_value.usage = MagicMock(total_tokens=7)
+    adapter = LiteLLMModelAdapter(model_name="openai/test")
+
+    threads = [
+        threading.Thread(target=adapter.generate, args=("hi",)) for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    adapter.generate("hi")
+
+    metrics = adapter.metrics()
+    assert metrics["requests"] == 5
+    assert metrics["provider_calls"] + metrics["cache_hits"] == 5
+    assert metrics["total_tokens"] == 7 * metrics["provider_calls"]
+    assert metrics["latency_s"] >= 0
+    assert adapter.cache_hits == metrics["cache_hits"]
+
+
+def test_litellm_provider_errors_propagate(completion):
+    adapter = LiteLLMModelAdapter(
+        model_name="openai/test", cache_size=0, max_retries=1, retry_delay=0.0
+    )
+
+    completion.side_effect = ValueError("bad request")
+    with pytest.raises(ValueError, match="bad request"):
+        adapter.generate("hi")
+    with pytest.raises(ValueError, match="bad request"):
+        adapter.generate_streaming("hi")
+
+    with patch("litellm.acompletion", AsyncMock(side_effect=ValueError("async"))):
+        with pytest.raises(ValueError, match="async"):
+            asyncio.run(adapter.agenerate("hi"))
+
+    # Rate limits are retried, then re-raised once retries run out
+    completion.side_effect = litellm.exceptions.RateLimitError(
+        "slow down", llm_provider="openai", model="test"
+    )
+    with pytest.raises(litellm.exceptions.RateLimitError):
+        adapter.generate("hi")
+    assert completion.call_count == 4
@@ -0,0 +1,16 @@
+from prompt_ops.core.prompt_strategies import BasicOptimizationStrategy
+
+
+def test_create_signature_reuses_class_for_same_fields():
+    strategy = BasicOptimizationStrategy()
+    prompt_data = {"inputs": ["question", "context"], "outputs": ["answer"]}
+
+    signature = strategy._create_signature(prompt_data, "Answer the question.")
+    assert list(signature.input_fields) == ["question", "context"]
+    assert list(signature.output_fields) == ["answer"]
+    assert signature.instructions == "Answer the question."
+    assert strategy._create_signature(prompt_data, "Answer the question.") is signature
+
+    # Different instructions or fields get their own class
+    assert strategy._create_signature(prompt_data, "Be brief.") is not signature
+    assert strategy._create_signature({}, "Answer the question.") is not signature